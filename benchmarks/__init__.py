@@ -0,0 +1,5 @@
+"""
+Benchmark scripts untuk mengukur performa dashboard
+
+Jalankan dari root project, mis. `python -m benchmarks.import_time`.
+"""
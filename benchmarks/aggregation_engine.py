@@ -0,0 +1,67 @@
+"""
+Engine agregasi: groupby pandas vs bincount atas kode integer
+
+Untuk setiap ukuran dataset sintetis, agregat parsial kategori, bulanan dan
+harian dihitung dengan kedua engine (engine.bincount.aggregation_partials),
+lalu waktu terbaik dan kesamaan hasil setelah finalisasi dilaporkan.
+
+Contoh:
+    python -m benchmarks.aggregation_engine
+    python -m benchmarks.aggregation_engine --rows 1000 10000 100000 1000000 --repeat 5
+"""
+
+import argparse
+import time
+
+from benchmarks.page_memory import synthetic_dataset
+
+FINALIZERS = {
+    'category': 'finalize_category_summary',
+    'monthly': 'finalize_monthly_summary',
+    'daily': 'finalize_daily_transactions',
+}
+
+
+def best_time(func, df, repeat):
+    """Waktu terbaik (detik) dari beberapa pemanggilan"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(df)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """CLI benchmark engine agregasi"""
+    import engine.aggregates as aggregates
+    from engine.bincount import aggregation_partials
+    from engine.schema import apply_schema
+
+    parser = argparse.ArgumentParser(description="Groupby pandas vs bincount untuk agregat parsial")
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000, 10_000, 100_000, 1_000_000],
+                        help="Jumlah baris dataset sintetis")
+    parser.add_argument('--repeat', type=int, default=5, help="Jumlah pengulangan (waktu terbaik)")
+    args = parser.parse_args()
+
+    pandas_partials = aggregation_partials('pandas')
+    bincount_partials = aggregation_partials('bincount')
+
+    print(f"{'Baris':>12} {'Agregat':>10} {'Pandas (ms)':>12} {'Bincount (ms)':>14} {'Speedup':>8}  Sama")
+    for rows in args.rows:
+        df = apply_schema(synthetic_dataset(rows))
+
+        for name, finalizer in FINALIZERS.items():
+            finalize = getattr(aggregates, finalizer)
+            pandas_time = best_time(pandas_partials[name], df, args.repeat)
+            bincount_time = best_time(bincount_partials[name], df, args.repeat)
+            same = finalize(pandas_partials[name](df)).equals(finalize(bincount_partials[name](df)))
+
+            print(
+                f"{rows:>12,} {name:>10} {pandas_time * 1000:>12.2f} {bincount_time * 1000:>14.2f} "
+                f"{pandas_time / bincount_time:>7.1f}x  {'✅' if same else '❌'}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Agregasi Dashboard: rantai fungsi lama vs dashboard_aggregates
+
+Rantai lama memanggil calculate_summary, get_category_summary (atas filter
+Debit), get_monthly_summary, calculate_statistics dan dua kali filter Tipe +
+nlargest, masing-masing membaca kolom dataset sendiri. dashboard_aggregates
+menurunkan semuanya dari satu groupby sel (hari, Kategori, Tipe) plus satu
+pembacaan kolom Jumlah dan Tipe.
+
+Jumlah "pass" dihitung sebagai pembacaan kolom (df['Kolom']) dan operasi baris
+penuh (filter boolean, nlargest) atas DataFrame input. Kedua jalur dihitung dari
+DataFrame mentah (tanpa rollup cube) agar yang dibandingkan adalah biaya scan.
+
+Contoh:
+    python -m benchmarks.dashboard_aggregates
+    python -m benchmarks.dashboard_aggregates --rows 10000 100000 1000000 --repeat 5
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.page_memory import synthetic_dataset
+
+
+class PassCounter:
+    """Proxy DataFrame yang menghitung pembacaan kolom dan operasi baris"""
+
+    def __init__(self, df, counts=None):
+        self._df = df
+        self.counts = {'column': 0, 'rows': 0} if counts is None else counts
+
+    def __getattr__(self, name):
+        return getattr(self._df, name)
+
+    def __len__(self):
+        return len(self._df)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            self.counts['column'] += 1
+            return self._df[key]
+        if isinstance(key, list):
+            self.counts['column'] += len(key)
+            return self._df[key]
+        self.counts['rows'] += 1
+        return PassCounter(self._df[key], self.counts)
+
+    def nlargest(self, n, column):
+        self.counts['rows'] += 1
+        return self._df.nlargest(n, column)
+
+    @property
+    def passes(self):
+        return self.counts['column'] + self.counts['rows']
+
+
+def chain_aggregates(df, top_n=5):
+    """Agregat Dashboard dengan rantai fungsi utils (sebelum dashboard_aggregates)"""
+    from utils import calculate_statistics, calculate_summary, get_category_summary, get_monthly_summary
+
+    return {
+        'summary': calculate_summary(df),
+        'category_summary': get_category_summary(df[df['Tipe'] == 'Debit']),
+        'monthly_summary': get_monthly_summary(df),
+        'statistics': calculate_statistics(df),
+        'top_transactions': {
+            tipe: df[df['Tipe'] == tipe].nlargest(top_n, 'Jumlah') for tipe in ('Debit', 'Kredit')
+        },
+    }
+
+
+def fused_aggregates(df, top_n=5):
+    """Agregat Dashboard dengan engine satu pass"""
+    from engine.dashboard import dashboard_aggregates
+
+    return dashboard_aggregates(df, top_n=top_n)
+
+
+def same_result(left, right):
+    """True jika dua hasil agregat Dashboard sama (statistik dengan toleransi float)"""
+    if left['summary'] != right['summary']:
+        return False
+    for key in ('category_summary', 'monthly_summary'):
+        try:
+            pd.testing.assert_frame_equal(
+                left[key].reset_index(drop=True), right[key].reset_index(drop=True), check_dtype=False
+            )
+        except AssertionError:
+            return False
+    for key, value in left['statistics'].items():
+        if not np.isclose(value, right['statistics'][key], equal_nan=True):
+            return False
+    return all(left['top_transactions'][t].equals(right['top_transactions'][t]) for t in ('Debit', 'Kredit'))
+
+
+def measure(func, df, repeat):
+    """Jumlah pass dan waktu terbaik (detik) satu jalur agregasi"""
+    counter = PassCounter(df)
+    result = func(counter)
+
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(df)
+        best = min(best, time.perf_counter() - start)
+    return counter.passes, best, result
+
+
+def main():
+    """CLI benchmark agregasi Dashboard"""
+    from engine.schema import apply_schema
+
+    parser = argparse.ArgumentParser(description="Rantai fungsi lama vs dashboard_aggregates")
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000, 1_000_000],
+                        help="Jumlah baris dataset sintetis")
+    parser.add_argument('--repeat', type=int, default=3, help="Jumlah pengulangan (waktu terbaik)")
+    args = parser.parse_args()
+
+    print(f"{'Baris':>12} {'Pass lama':>10} {'Pass baru':>10} {'Lama (ms)':>11} {'Baru (ms)':>11} {'Speedup':>8}  Sama")
+    for rows in args.rows:
+        df = apply_schema(synthetic_dataset(rows))
+
+        chain_passes, chain_time, chain_result = measure(chain_aggregates, df, args.repeat)
+        fused_passes, fused_time, fused_result = measure(fused_aggregates, df, args.repeat)
+
+        print(
+            f"{rows:>12,} {chain_passes:>10} {fused_passes:>10} "
+            f"{chain_time * 1000:>11.1f} {fused_time * 1000:>11.1f} "
+            f"{chain_time / fused_time:>7.1f}x  {'✅' if same_result(chain_result, fused_result) else '❌'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Laporan import-time per modul dan latency render pertama
+
+Setiap target diukur di interpreter baru (cold start) dengan `python -X importtime`,
+sehingga hasilnya sama dengan yang dialami proses server setelah deploy atau autoscale.
+
+Contoh:
+    python -m benchmarks.import_time app.py "pages/1_📊_Dashboard.py" --top 15
+    python -m benchmarks.import_time components.charts --first-render app.py
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _import_statement(target):
+    """Statement Python untuk meng-import modul atau menjalankan script halaman"""
+    if target.endswith('.py'):
+        path = os.path.join(ROOT, target)
+        return f"import runpy; runpy.run_path({path!r}, run_name='__importtime__')"
+    return f"import {target}"
+
+
+def import_time_report(target):
+    """
+    Ukur import-time per modul untuk satu target di interpreter baru
+
+    Args:
+        target: Nama modul (mis. 'components.charts') atau path script (mis. 'app.py')
+
+    Returns:
+        DataFrame berisi Modul, Self (ms), Kumulatif (ms), Depth; urut kumulatif terbesar
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _import_statement(target)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_part, cumulative_part, name = line.split('|', 2)
+        self_us = int(self_part.split(':')[1])
+        cumulative_us = int(cumulative_part)
+        rows.append({
+            'Modul': name.strip(),
+            'Self (ms)': self_us / 1000,
+            'Kumulatif (ms)': cumulative_us / 1000,
+            'Depth': (len(name) - len(name.lstrip())) // 2,
+        })
+
+    report = pd.DataFrame(rows, columns=['Modul', 'Self (ms)', 'Kumulatif (ms)', 'Depth'])
+    return report.sort_values('Kumulatif (ms)', ascending=False).reset_index(drop=True)
+
+
+def total_import_time(report):
+    """Total import-time (ms) = jumlah kumulatif modul top-level"""
+    return report.loc[report['Depth'] == 0, 'Kumulatif (ms)'].sum()
+
+
+def first_render_time(script):
+    """
+    Ukur waktu cold start sampai render pertama halaman Streamlit selesai
+
+    Halaman dijalankan dengan streamlit.testing di interpreter baru.
+
+    Returns:
+        Dictionary berisi total_s (proses baru sampai render selesai) dan render_s (render saja)
+    """
+    path = os.path.join(ROOT, script)
+    code = (
+        "import time; t0 = time.perf_counter()\n"
+        "from streamlit.testing.v1 import AppTest\n"
+        "t1 = time.perf_counter()\n"
+        f"AppTest.from_file({path!r}, default_timeout=300).run()\n"
+        "t2 = time.perf_counter()\n"
+        "print(t2 - t1)"
+    )
+
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True)
+    total = time.perf_counter() - start
+
+    render = float(result.stdout.strip().splitlines()[-1]) if result.returncode == 0 else float('nan')
+    return {'total_s': total, 'render_s': render}
+
+
+def main():
+    """CLI laporan import-time"""
+    parser = argparse.ArgumentParser(description="Laporan import-time per modul (cold start)")
+    parser.add_argument('targets', nargs='*', default=['app.py'], help="Modul atau path script halaman")
+    parser.add_argument('--top', type=int, default=20, help="Jumlah modul terbesar yang ditampilkan")
+    parser.add_argument('--first-render', nargs='*', default=[], help="Script halaman untuk diukur render pertamanya")
+    args = parser.parse_args()
+
+    for target in args.targets:
+        report = import_time_report(target)
+        print(f"\n📦 {target}: total import {total_import_time(report):,.1f} ms")
+        print(report.head(args.top).to_string(index=False))
+
+    for script in args.first_render:
+        timing = first_render_time(script)
+        print(f"\n⏱️ {script}: cold start + render pertama {timing['total_s']:.2f} s "
+              f"(render {timing['render_s']:.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
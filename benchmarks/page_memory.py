@@ -0,0 +1,111 @@
+"""
+Peak memory per rerun halaman Streamlit
+
+Dataset sintetis dengan jumlah baris tertentu dibangkitkan dari data contoh
+(baris diambil acak, tanggal disebar di rentang yang sama, Saldo dihitung ulang)
+di direktori sementara. Setiap halaman dijalankan sekali dengan streamlit.testing
+untuk warm-up (load dataset dan index), lalu rerun kedua diukur dengan
+tracemalloc di interpreter baru.
+
+Contoh:
+    python -m benchmarks.page_memory --rows 200000
+    python -m benchmarks.page_memory "pages/1_📊_Dashboard.py" --rows 500000
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_PAGES = [
+    'pages/1_📊_Dashboard.py',
+    'pages/2_📈_Analytics.py',
+    'pages/3_💳_Transactions.py',
+]
+
+
+def synthetic_dataset(rows, seed=0):
+    """
+    Bangkitkan dataset sintetis dari data contoh
+
+    Args:
+        rows: Jumlah baris
+        seed: Seed random generator
+
+    Returns:
+        DataFrame dengan kolom dan format CSV yang sama dengan data contoh
+    """
+    from config import DATA_PATH
+
+    sample = pd.read_csv(os.path.join(ROOT, DATA_PATH), parse_dates=['Tanggal'])
+    rng = np.random.default_rng(seed)
+
+    df = sample.iloc[rng.integers(0, len(sample), rows)].reset_index(drop=True)
+    start, end = sample['Tanggal'].min(), sample['Tanggal'].max()
+    days = rng.integers(0, (end - start).days + 1, rows)
+    df['Tanggal'] = start + pd.to_timedelta(np.sort(days), unit='D')
+
+    signed = np.where(df['Tipe'] == 'Kredit', df['Jumlah'], -df['Jumlah'])
+    df['Saldo'] = sample['Saldo'].iloc[0] + np.cumsum(signed)
+    return df
+
+
+def rerun_peak_memory(script, workdir):
+    """
+    Ukur peak memory (bytes) rerun kedua satu halaman di interpreter baru
+
+    Args:
+        script: Path script halaman relatif terhadap root repo
+        workdir: Direktori kerja berisi data/ (DATA_PATH relatif)
+
+    Returns:
+        Peak memory dalam bytes, atau NaN jika halaman error
+    """
+    path = os.path.join(ROOT, script)
+    code = (
+        "import tracemalloc\n"
+        "from streamlit.testing.v1 import AppTest\n"
+        f"at = AppTest.from_file({path!r}, default_timeout=600)\n"
+        "at.run()\n"
+        "tracemalloc.start()\n"
+        "at.run()\n"
+        "print(tracemalloc.get_traced_memory()[1])\n"
+        "print(len(at.exception))"
+    )
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    result = subprocess.run([sys.executable, '-c', code], cwd=workdir, env=env, capture_output=True, text=True)
+
+    lines = result.stdout.strip().splitlines()
+    if result.returncode != 0 or len(lines) < 2 or lines[-1] != '0':
+        return float('nan')
+    return int(lines[-2])
+
+
+def main():
+    """CLI peak memory per rerun"""
+    parser = argparse.ArgumentParser(description="Peak memory per rerun halaman (tracemalloc)")
+    parser.add_argument('pages', nargs='*', default=DEFAULT_PAGES, help="Path script halaman")
+    parser.add_argument('--rows', type=int, default=200_000, help="Jumlah baris dataset sintetis")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        from config import DATA_PATH
+
+        data_path = os.path.join(workdir, DATA_PATH)
+        os.makedirs(os.path.dirname(data_path), exist_ok=True)
+        synthetic_dataset(args.rows).to_csv(data_path, index=False, date_format='%Y-%m-%d')
+
+        print(f"📦 Dataset sintetis: {args.rows:,} baris")
+        for page in args.pages:
+            peak = rerun_peak_memory(page, workdir)
+            print(f"  {page}: peak rerun {peak / 1024 ** 2:,.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
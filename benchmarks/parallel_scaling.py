@@ -0,0 +1,86 @@
+"""
+Skala agregasi paralel per partisi bulan terhadap jumlah worker
+
+Untuk setiap ukuran dataset sintetis multi-tahun, agregat bulanan
+(get_monthly_summary) dan pivot Kategori x Bulan (heatmap halaman Analytics)
+dihitung dengan engine.parallel.parallel_partial untuk 1..N worker. Pool
+dipanaskan dulu, sehingga waktu start process tidak ikut; speedup relatif
+terhadap jumlah worker pertama (default 1 = serial di proses ini).
+
+Contoh:
+    python -m benchmarks.parallel_scaling
+    python -m benchmarks.parallel_scaling --rows 1000000 5000000 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import time
+
+from benchmarks.period_comparison import spread_dataset
+
+
+def best_time(func, repeat):
+    """Waktu terbaik (detik) dari beberapa pemanggilan"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """CLI benchmark skala agregasi paralel"""
+    from engine.aggregates import (
+        category_month_partial, finalize_category_month_pivot, finalize_monthly_summary,
+        merge_category_month, merge_monthly
+    )
+    from engine.bincount import aggregation_partials
+    from engine.parallel import parallel_partial, shutdown_executor
+    from engine.schema import apply_schema
+
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Skala agregasi paralel terhadap jumlah worker")
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000_000, 5_000_000],
+                        help="Jumlah baris dataset sintetis")
+    parser.add_argument('--workers', type=int, nargs='+', default=list(range(1, cores + 1)),
+                        help="Jumlah worker yang diukur (default 1..jumlah core)")
+    parser.add_argument('--years', type=int, default=4, help="Rentang tahun dataset")
+    parser.add_argument('--repeat', type=int, default=3, help="Jumlah pengulangan (waktu terbaik)")
+    args = parser.parse_args()
+
+    aggregates = {
+        'monthly': (aggregation_partials('bincount')['monthly'], merge_monthly,
+                    ['Tanggal', 'Tipe', 'Jumlah'], finalize_monthly_summary),
+        'pivot': (category_month_partial, merge_category_month,
+                  ['Tanggal', 'Kategori', 'Jumlah'], finalize_category_month_pivot),
+    }
+
+    print(f"Core tersedia: {cores}\n")
+    print(f"{'Baris':>12} {'Agregat':>8} {'Worker':>7} {'Waktu (ms)':>11} {'Speedup':>8}  Sama")
+    try:
+        for rows in args.rows:
+            df = apply_schema(spread_dataset(rows, args.years))
+
+            for name, (partial, merge, columns, finalize) in aggregates.items():
+                expected = finalize(partial(df))
+                serial_time = None
+
+                for workers in args.workers:
+                    def run():
+                        return parallel_partial(df, partial, merge, columns, workers=workers)
+
+                    same = finalize(run()).equals(expected)  # juga memanaskan pool
+                    elapsed = best_time(run, args.repeat)
+                    serial_time = serial_time or elapsed
+
+                    print(
+                        f"{rows:>12,} {name:>8} {workers:>7} {elapsed * 1000:>11.1f} "
+                        f"{serial_time / elapsed:>7.2f}x  {'✅' if same else '❌'}"
+                    )
+    finally:
+        shutdown_executor()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Perbandingan periode: filter + summary per periode vs DailyLedger sekaligus
+
+Dataset sintetis disebar ke beberapa tahun, lalu N bulan terakhir dibandingkan
+dengan dua cara: filter baris dan hitung summary serta total per kategori untuk
+setiap periode (cara lama), atau engine.comparison.compare_periods atas
+DailyLedger (semua periode dalam satu operasi array). Waktu build ledger
+dilaporkan terpisah karena dibangun sekali per versi dataset.
+
+Contoh:
+    python -m benchmarks.period_comparison
+    python -m benchmarks.period_comparison --rows 100000 1000000 --years 5 --months 36
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.page_memory import synthetic_dataset
+
+
+def spread_dataset(rows, years, seed=0):
+    """Dataset sintetis dengan Tanggal tersebar rata selama beberapa tahun"""
+    df = synthetic_dataset(rows, seed)
+    rng = np.random.default_rng(seed)
+    days = np.sort(rng.integers(0, years * 365, rows))
+    df['Tanggal'] = df['Tanggal'].min() + pd.to_timedelta(days, unit='D')
+    return df
+
+
+def per_period(df, periods):
+    """Cara lama: filter dan agregasi ulang untuk setiap periode"""
+    from engine.aggregates import finalize_category_summary, finalize_summary, summary_partial
+
+    results = []
+    for start, end in zip(periods['Mulai'], periods['Sampai']):
+        period = df[(df['Tanggal'] >= start) & (df['Tanggal'] <= end)]
+        category = period.groupby('Kategori', observed=True)['Jumlah'].agg(['sum', 'count'])
+        results.append((finalize_summary(summary_partial(period)), finalize_category_summary(category)))
+    return results
+
+
+def best_time(func, repeat):
+    """Waktu terbaik (detik) dari beberapa pemanggilan"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """CLI benchmark perbandingan periode"""
+    from engine.comparison import compare_periods, month_over_month
+    from engine.ledger import DailyLedger
+    from engine.schema import apply_schema
+
+    parser = argparse.ArgumentParser(description="Perbandingan periode: per periode vs DailyLedger")
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000],
+                        help="Jumlah baris dataset sintetis")
+    parser.add_argument('--years', type=int, default=4, help="Rentang tahun dataset")
+    parser.add_argument('--months', type=int, default=24, help="Jumlah bulan yang dibandingkan")
+    parser.add_argument('--repeat', type=int, default=3, help="Jumlah pengulangan (waktu terbaik)")
+    args = parser.parse_args()
+
+    print(f"{'Baris':>12} {'Per periode (ms)':>17} {'Build ledger (ms)':>18} {'Ledger (ms)':>12}  Sama")
+    for rows in args.rows:
+        df = apply_schema(spread_dataset(rows, args.years))
+        periods = month_over_month(df['Tanggal'].max(), args.months)
+
+        old_time = best_time(lambda: per_period(df, periods), args.repeat)
+        build_time = best_time(lambda: DailyLedger(df), args.repeat)
+        ledger = DailyLedger(df)
+        new_time = best_time(lambda: compare_periods(ledger, periods), args.repeat)
+
+        summary = compare_periods(ledger, periods)['summary']
+        expected = [result['transaction_count'] for result, _ in per_period(df, periods)]
+        same = summary['Jumlah Transaksi'].tolist() == expected
+
+        print(
+            f"{rows:>12,} {old_time * 1000:>17.1f} {build_time * 1000:>18.1f} "
+            f"{new_time * 1000:>12.2f}  {'✅' if same else '❌'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Akurasi dan biaya quantile sketch dibanding quantile exact
+
+Untuk setiap ukuran dataset sintetis (Jumlah dari data contoh, plus distribusi
+lognormal dan uniform sebagai pembanding), quantile sketch dibandingkan dengan
+np.quantile exact: error relatif per quantile, apakah sketch gabungan per
+partisi bulan sama dengan sketch seluruh data, dan waktu query CellSketches
+(sketch per bulan x Kategori x Tipe) dibanding quantile exact atas baris
+terfilter, untuk dataset multi-tahun dengan filter kategori dan jendela tanggal.
+
+Contoh:
+    python -m benchmarks.quantile_sketch
+    python -m benchmarks.quantile_sketch --rows 100000 1000000 --accuracy 0.005
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.page_memory import synthetic_dataset
+from benchmarks.period_comparison import spread_dataset
+
+QUANTILES = [0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99]
+
+
+def relative_errors(sketch, values):
+    """Error relatif sketch per quantile terhadap np.quantile exact"""
+    exact = np.quantile(values, QUANTILES)
+    return np.abs(sketch.quantiles(QUANTILES) - exact) / np.abs(exact)
+
+
+def best_time(func, repeat):
+    """Waktu terbaik (detik) dari beberapa pemanggilan"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """CLI akurasi quantile sketch"""
+    from engine.expressions import EvalContext, category_in, date_between
+    from engine.schema import apply_schema
+    from engine.sketch import CellSketches, LogSketch
+
+    parser = argparse.ArgumentParser(description="Akurasi quantile sketch vs exact")
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000, 1_000_000],
+                        help="Jumlah baris dataset sintetis")
+    parser.add_argument('--accuracy', type=float, default=0.01, help="Error relatif sketch")
+    parser.add_argument('--years', type=int, default=4, help="Rentang tahun dataset untuk waktu query")
+    parser.add_argument('--repeat', type=int, default=3, help="Jumlah pengulangan (waktu terbaik)")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    header = ' '.join(f"{f'p{q * 100:g}':>7}" for q in QUANTILES)
+    print(f"Error relatif maksimum teoretis: {args.accuracy:.2%}\n")
+    print(f"{'Baris':>10} {'Distribusi':>10} {header}  Merge sama")
+
+    for rows in args.rows:
+        df = apply_schema(synthetic_dataset(rows))
+        distributions = {
+            'contoh': df['Jumlah'].to_numpy(),
+            'lognormal': np.round(rng.lognormal(12, 1.5, rows)).astype(np.int64),
+            'uniform': rng.integers(1_000, 10_000_000, rows),
+        }
+
+        for name, values in distributions.items():
+            sketch = LogSketch.from_values(values, args.accuracy)
+            errors = relative_errors(sketch, values)
+
+            months = df['Tanggal'].dt.month.to_numpy()
+            merged = None
+            for month in np.unique(months):
+                part = LogSketch.from_values(values[months == month], args.accuracy)
+                merged = part if merged is None else merged.merge(part)
+
+            cells = ' '.join(f"{error:>7.2%}" for error in errors)
+            same = np.array_equal(merged.counts, sketch.counts)
+            print(f"{rows:>10,} {name:>10} {cells}  {'✅' if same else '❌'}")
+
+    print(f"\n{'Baris':>10} {'Filter':>18} {'Cocok':>10} {'Exact (ms)':>11} {'Sketch (ms)':>12}")
+    for rows in args.rows:
+        df = apply_schema(spread_dataset(rows, args.years))
+        sketches = CellSketches(df, args.accuracy)
+        amounts = df['Jumlah'].to_numpy()
+        first = df['Tanggal'].iloc[0]
+        filters = {
+            'kategori': category_in(['Belanja']),
+            'kategori + 1 tahun': category_in(['Belanja']) & date_between(
+                first + pd.Timedelta(days=45), first + pd.Timedelta(days=410)
+            ),
+            '1 bulan': date_between(first + pd.Timedelta(days=100), first + pd.Timedelta(days=130)),
+        }
+
+        for name, expr in filters.items():
+            # Exact: baris terfilter sudah dipilih (seperti select_positions yang di-cache)
+            positions = np.flatnonzero(expr.mask(EvalContext(df)))
+            matched = len(positions)
+            exact_time = best_time(lambda: np.quantile(amounts[positions], QUANTILES), args.repeat)
+            sketch_time = best_time(lambda: sketches.query(expr).quantiles(QUANTILES), args.repeat)
+            print(
+                f"{rows:>10,} {name:>18} {matched:>10,} {exact_time * 1000:>11.2f} {sketch_time * 1000:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Total bergulir: groupby + rolling pandas per seri vs DailyLedger
+
+Untuk setiap ukuran dataset sintetis multi-tahun dan setiap panjang jendela,
+total bergulir per kategori dihitung dengan pandas (groupby harian, reindex ke
+grid hari rapat, rolling sum per seri) dan dengan engine.rolling.rolling_totals
+atas DailyLedger (selisih kumulatif untuk semua hari dan seri sekaligus).
+
+Contoh:
+    python -m benchmarks.rolling_windows
+    python -m benchmarks.rolling_windows --rows 1000000 --years 5 --windows 7 30 90 365
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from benchmarks.period_comparison import spread_dataset
+
+
+def pandas_rolling(df, days):
+    """Total bergulir per kategori dengan groupby + rolling"""
+    daily = df.groupby(['Kategori', df['Tanggal'].dt.normalize()], observed=True)['Jumlah'].sum()
+    grid = pd.date_range(df['Tanggal'].min().normalize(), df['Tanggal'].max().normalize(), freq='D')
+    return {
+        kategori: series.droplevel(0).reindex(grid, fill_value=0).rolling(days, min_periods=1).sum()
+        for kategori, series in daily.groupby(level=0, observed=True)
+    }
+
+
+def best_time(func, repeat):
+    """Waktu terbaik (detik) dari beberapa pemanggilan"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """CLI benchmark total bergulir"""
+    from engine.ledger import DailyLedger
+    from engine.rolling import rolling_totals
+    from engine.schema import apply_schema
+
+    parser = argparse.ArgumentParser(description="Total bergulir: pandas rolling vs DailyLedger")
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000],
+                        help="Jumlah baris dataset sintetis")
+    parser.add_argument('--years', type=int, default=4, help="Rentang tahun dataset")
+    parser.add_argument('--windows', type=int, nargs='+', default=[7, 30, 90], help="Panjang jendela (hari)")
+    parser.add_argument('--repeat', type=int, default=3, help="Jumlah pengulangan (waktu terbaik)")
+    args = parser.parse_args()
+
+    print(f"{'Baris':>12} {'Jendela':>8} {'Pandas (ms)':>12} {'Ledger (ms)':>12}  Sama")
+    for rows in args.rows:
+        df = apply_schema(spread_dataset(rows, args.years))
+        ledger = DailyLedger(df)
+
+        for days in args.windows:
+            pandas_time = best_time(lambda: pandas_rolling(df, days), args.repeat)
+            ledger_time = best_time(lambda: rolling_totals(ledger, days), args.repeat)
+
+            result = rolling_totals(ledger, days)
+            same = all(
+                (result.loc[result['Seri'] == kategori, 'Total'].to_numpy() == series.to_numpy()).all()
+                for kategori, series in pandas_rolling(df, days).items()
+            )
+            print(
+                f"{rows:>12,} {days:>8} {pandas_time * 1000:>12.1f} {ledger_time * 1000:>12.1f}  "
+                f"{'✅' if same else '❌'}"
+            )
+
+
+if __name__ == "__main__":
+    main()
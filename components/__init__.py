@@ -1,39 +1,56 @@
 """
 Components package untuk reusable components
+
+Submodule di-load secara lazy: `from components import pie_chart` hanya
+meng-import components.charts saat nama tersebut pertama kali diakses.
 """
 
-from .metrics import metric_card, summary_metrics, category_metrics, statistics_metrics
-from .charts import pie_chart, bar_chart, line_chart, box_plot, histogram_chart, area_chart, heatmap_chart
-from .filters import date_range_filter, category_filter, transaction_type_filter, amount_range_filter, search_filter
-from .tables import transaction_table, summary_table, category_breakdown_table, top_transactions_table, comparison_table
+import importlib
 
-__all__ = [
+_SUBMODULES = {
     # Metrics
-    'metric_card',
-    'summary_metrics',
-    'category_metrics',
-    'statistics_metrics',
+    'metric_card': 'metrics',
+    'summary_metrics': 'metrics',
+    'category_metrics': 'metrics',
+    'statistics_metrics': 'metrics',
     
     # Charts
-    'pie_chart',
-    'bar_chart',
-    'line_chart',
-    'box_plot',
-    'histogram_chart',
-    'area_chart',
-    'heatmap_chart',
+    'pie_chart': 'charts',
+    'bar_chart': 'charts',
+    'line_chart': 'charts',
+    'box_plot': 'charts',
+    'histogram_chart': 'charts',
+    'area_chart': 'charts',
+    'heatmap_chart': 'charts',
+    'grouped_bar_chart': 'charts',
     
     # Filters
-    'date_range_filter',
-    'category_filter',
-    'transaction_type_filter',
-    'amount_range_filter',
-    'search_filter',
+    'date_range_filter': 'filters',
+    'category_filter': 'filters',
+    'transaction_type_filter': 'filters',
+    'amount_range_filter': 'filters',
+    'search_filter': 'filters',
+    'period_picker': 'filters',
     
     # Tables
-    'transaction_table',
-    'summary_table',
-    'category_breakdown_table',
-    'top_transactions_table',
-    'comparison_table',
-]
+    'transaction_table': 'tables',
+    'summary_table': 'tables',
+    'category_breakdown_table': 'tables',
+    'top_transactions_table': 'tables',
+    'comparison_table': 'tables',
+    'period_comparison_table': 'tables',
+}
+
+__all__ = list(_SUBMODULES)
+
+def __getattr__(name):
+    """Import submodule yang berisi `name` saat pertama kali diakses"""
+    if name not in _SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(f".{_SUBMODULES[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
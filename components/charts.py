@@ -2,16 +2,32 @@
 Reusable components untuk charts menggunakan matplotlib dan seaborn
 """
 
-import streamlit as st
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
-import numpy as np
 from config import CATEGORY_COLORS, COLOR_PALETTE
 
-# Set style seaborn
-sns.set_style("whitegrid")
-sns.set_palette("husl")
+# matplotlib dan seaborn di-import saat chart pertama dibuat, bukan saat modul
+# di-import, sehingga halaman tanpa chart tidak menanggung biaya import-nya
+_plotting = None
+
+def _load_plotting():
+    """
+    Import matplotlib dan seaborn (sekali per proses)
+    
+    Returns:
+        Tuple (pyplot, seaborn)
+    """
+    global _plotting
+    
+    if _plotting is None:
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
+        # Set style seaborn
+        sns.set_style("whitegrid")
+        sns.set_palette("husl")
+        
+        _plotting = (plt, sns)
+    
+    return _plotting
 
 def pie_chart(data, labels, title="Pie Chart", colors=None):
     """
@@ -23,6 +39,8 @@ def pie_chart(data, labels, title="Pie Chart", colors=None):
         title: Judul chart
         colors: List warna (optional)
     """
+    plt, sns = _load_plotting()
+    
     fig, ax = plt.subplots(figsize=(10, 6))
     
     # Filter data yang > 0
@@ -68,6 +86,8 @@ def bar_chart(data, x, y, title="Bar Chart", color=None, horizontal=False):
         color: Warna bar (optional)
         horizontal: Jika True, buat horizontal bar
     """
+    plt, sns = _load_plotting()
+    
     fig, ax = plt.subplots(figsize=(12, 6))
     
     if horizontal:
@@ -92,6 +112,38 @@ def bar_chart(data, x, y, title="Bar Chart", color=None, horizontal=False):
     
     return fig
 
+def grouped_bar_chart(data, x, y, hue, title="Grouped Bar Chart"):
+    """
+    Create grouped bar chart (satu bar per nilai hue di setiap x)
+    
+    Args:
+        data: DataFrame format long
+        x: Kolom untuk x-axis
+        y: Kolom untuk y-axis
+        hue: Kolom untuk grouping bar
+        title: Judul chart
+    """
+    plt, sns = _load_plotting()
+    
+    fig, ax = plt.subplots(figsize=(12, 6))
+    
+    sns.barplot(data=data, x=x, y=y, hue=hue, ax=ax)
+    ax.set_xlabel(x, fontsize=11)
+    ax.set_ylabel(y, fontsize=11)
+    ax.legend(title=hue)
+    
+    if data[x].nunique() > 5:
+        plt.xticks(rotation=45, ha='right')
+    
+    ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+    
+    # Format y-axis dengan separator
+    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:,.0f}'))
+    
+    plt.tight_layout()
+    
+    return fig
+
 def line_chart(data, x, y, title="Line Chart", hue=None):
     """
     Create line chart
@@ -103,6 +155,8 @@ def line_chart(data, x, y, title="Line Chart", hue=None):
         title: Judul chart
         hue: Kolom untuk grouping (optional)
     """
+    plt, sns = _load_plotting()
+    
     fig, ax = plt.subplots(figsize=(12, 6))
     
     if isinstance(y, list):
@@ -111,7 +165,7 @@ def line_chart(data, x, y, title="Line Chart", hue=None):
         ax.legend()
     else:
         if hue:
-            for key, grp in data.groupby(hue):
+            for key, grp in data.groupby(hue, observed=True):
                 ax.plot(grp[x], grp[y], marker='o', label=key, linewidth=2)
             ax.legend()
         else:
@@ -143,6 +197,8 @@ def heatmap_chart(data, title="Heatmap", annot=True, fmt=".0f", cmap="YlOrRd"):
         fmt: Format annotations
         cmap: Color map
     """
+    plt, sns = _load_plotting()
+    
     fig, ax = plt.subplots(figsize=(10, 8))
     
     sns.heatmap(data, annot=annot, fmt=fmt, cmap=cmap, ax=ax, cbar_kws={'label': 'Amount'})
@@ -162,6 +218,8 @@ def box_plot(data, x, y, title="Box Plot"):
         y: Kolom untuk y-axis
         title: Judul chart
     """
+    plt, sns = _load_plotting()
+    
     fig, ax = plt.subplots(figsize=(12, 6))
     
     sns.boxplot(data=data, x=x, y=y, ax=ax, hue=x, palette="Set2", legend=False)
@@ -188,6 +246,8 @@ def histogram_chart(data, column, bins=30, title="Histogram"):
         bins: Jumlah bins
         title: Judul chart
     """
+    plt, sns = _load_plotting()
+    
     fig, ax = plt.subplots(figsize=(10, 6))
     
     ax.hist(data[column], bins=bins, color=COLOR_PALETTE['secondary'], alpha=0.7, edgecolor='black')
@@ -211,6 +271,8 @@ def area_chart(data, x, y, title="Area Chart"):
         y: Kolom untuk y-axis (bisa list untuk stacked area)
         title: Judul chart
     """
+    plt, sns = _load_plotting()
+    
     fig, ax = plt.subplots(figsize=(12, 6))
     
     if isinstance(y, list):
@@ -2,8 +2,12 @@
 Reusable components untuk filters
 """
 
+import pandas as pd
 import streamlit as st
 from datetime import datetime, timedelta
+from engine.comparison import (
+    PERIOD_MODES, month_over_month, year_over_year, rolling_periods, custom_periods
+)
 
 def date_range_filter(min_date, max_date, key_prefix="date"):
     """
@@ -83,7 +87,7 @@ def transaction_type_filter(transaction_types, key="type_filter", default=None):
     
     return selected
 
-def amount_range_filter(min_amount, max_amount, key="amount_filter"):
+def amount_range_filter(min_amount, max_amount, key="amount_filter", amount_index=None):
     """
     Create amount range slider
     
@@ -91,22 +95,123 @@ def amount_range_filter(min_amount, max_amount, key="amount_filter"):
         min_amount: Jumlah minimum
         max_amount: Jumlah maksimum
         key: Key untuk widget
+        amount_index: AmountIndex opsional; jika ada, tampilkan histogram Jumlah,
+            jumlah transaksi yang cocok dan opsi batas berdasarkan persentil
     
     Returns:
         Tuple (min_selected, max_selected)
     """
-    selected_range = st.slider(
-        "💰 Range Jumlah Transaksi",
-        min_value=float(min_amount),
-        max_value=float(max_amount),
-        value=(float(min_amount), float(max_amount)),
-        key=key,
-        format="Rp %.0f",
-        help="Geser untuk memilih range jumlah transaksi"
+    if amount_index is not None:
+        counts, edges = amount_index.histogram()
+        st.bar_chart(
+            pd.DataFrame({'Transaksi': counts}, index=pd.Index(edges[:-1], name='Jumlah')),
+            height=120
+        )
+    
+    use_percentile = amount_index is not None and st.checkbox(
+        "Gunakan batas persentil",
+        key=f"{key}_use_percentile",
+        help="Pilih range berdasarkan persentil distribusi jumlah transaksi"
     )
     
+    if use_percentile:
+        low_pct, high_pct = st.slider(
+            "📊 Range Persentil",
+            min_value=0,
+            max_value=100,
+            value=(0, 100),
+            key=f"{key}_percentile",
+            format="P%d"
+        )
+        selected_range = (amount_index.percentile(low_pct), amount_index.percentile(high_pct))
+    else:
+        selected_range = st.slider(
+            "💰 Range Jumlah Transaksi",
+            min_value=float(min_amount),
+            max_value=float(max_amount),
+            value=(float(min_amount), float(max_amount)),
+            key=key,
+            format="Rp %.0f",
+            help="Geser untuk memilih range jumlah transaksi"
+        )
+    
+    if amount_index is not None:
+        count = amount_index.count(*selected_range)
+        low_rank = amount_index.percentile_rank(selected_range[0], inclusive=False)
+        high_rank = amount_index.percentile_rank(selected_range[1])
+        st.caption(
+            f"Rp {selected_range[0]:,.0f} - Rp {selected_range[1]:,.0f} · "
+            f"{count:,} transaksi (P{low_rank:.0f}-P{high_rank:.0f})"
+        )
+    
     return selected_range
 
+def period_picker(min_date, max_date, start_date, end_date, key_prefix="period"):
+    """
+    Create picker periode perbandingan
+    
+    Periode dibentuk relatif terhadap rentang tanggal aktif: bulan ke bulan dan
+    jendela bergulir berakhir di end_date, tahun ke tahun mengulang rentang
+    [start_date, end_date] pada tahun-tahun sebelumnya.
+    
+    Args:
+        min_date: Tanggal minimum data
+        max_date: Tanggal maksimum data
+        start_date: Tanggal awal rentang aktif
+        end_date: Tanggal akhir rentang aktif
+        key_prefix: Prefix untuk key
+    
+    Returns:
+        DataFrame periode (Periode, Mulai, Sampai)
+    """
+    mode = st.radio(
+        "📆 Jenis Perbandingan",
+        PERIOD_MODES,
+        horizontal=True,
+        key=f"{key_prefix}_mode"
+    )
+    
+    if mode == "Bulan ke Bulan":
+        n_months = (end_date.year - start_date.year) * 12 + end_date.month - start_date.month + 1
+        count = st.slider(
+            "Jumlah bulan", min_value=2, max_value=24,
+            value=min(max(n_months, 2), 12), key=f"{key_prefix}_months"
+        )
+        return month_over_month(end_date, count)
+    
+    if mode == "Tahun ke Tahun":
+        count = st.slider("Jumlah tahun", min_value=2, max_value=5, value=2, key=f"{key_prefix}_years")
+        return year_over_year(start_date, end_date, count)
+    
+    if mode == "Jendela Bergulir":
+        col1, col2 = st.columns(2)
+        with col1:
+            days = st.selectbox(
+                "Panjang jendela", [7, 14, 30, 90], index=2,
+                format_func=lambda d: f"{d} hari", key=f"{key_prefix}_days"
+            )
+        with col2:
+            count = st.slider("Jumlah jendela", min_value=2, max_value=24, value=4, key=f"{key_prefix}_windows")
+        return rolling_periods(end_date, days, count)
+    
+    # Custom: default dua paruh rentang aktif
+    middle = start_date + (end_date - start_date) / 2
+    defaults = [(start_date, middle), (min(middle + timedelta(days=1), end_date), end_date)]
+    
+    ranges = []
+    for i, col in enumerate(st.columns(2)):
+        with col:
+            selected = st.date_input(
+                f"📅 Periode {i + 1}",
+                value=defaults[i],
+                min_value=min_date,
+                max_value=max_date,
+                key=f"{key_prefix}_custom_{i}"
+            )
+        # Saat range baru dipilih sebagian, date_input mengembalikan satu tanggal
+        ranges.append((selected[0], selected[-1]) if selected else defaults[i])
+    return custom_periods(ranges)
+
 def quick_date_filter(key="quick_date"):
     """
     Create quick date range selector
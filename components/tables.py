@@ -5,28 +5,31 @@ Reusable components untuk tables
 import streamlit as st
 import pandas as pd
 from utils import format_currency
+from engine.views import as_frame
 
 def transaction_table(df, show_index=False, height=400):
     """
     Display transaction table dengan formatting
     
     Args:
-        df: DataFrame transaksi
+        df: DataFrame atau DataView transaksi
         show_index: Show index column
         height: Tinggi tabel
     """
-    # Format untuk display
-    df_display = df.copy()
-    
-    # Format tanggal
-    df_display['Tanggal'] = pd.to_datetime(df_display['Tanggal']).dt.strftime('%d-%m-%Y')
-    
-    # Format jumlah
-    df_display['Jumlah'] = df_display['Jumlah'].apply(format_currency)
+    # Format untuk display; kolom lain tidak di-copy
+    df = as_frame(df)
+    formatted = {
+        # Format tanggal
+        'Tanggal': pd.to_datetime(df['Tanggal']).dt.strftime('%d-%m-%Y'),
+        # Format jumlah
+        'Jumlah': df['Jumlah'].apply(format_currency),
+    }
     
     # Format saldo jika ada
-    if 'Saldo' in df_display.columns:
-        df_display['Saldo'] = df_display['Saldo'].apply(format_currency)
+    if 'Saldo' in df.columns:
+        formatted['Saldo'] = df['Saldo'].apply(format_currency)
+    
+    df_display = df.assign(**formatted)
     
     # Display dengan styling
     st.dataframe(
@@ -93,11 +96,11 @@ def top_transactions_table(df, n=10, transaction_type=None):
     Display top N transactions
     
     Args:
-        df: DataFrame transaksi
+        df: DataFrame atau DataView transaksi
         n: Jumlah transaksi yang ditampilkan
         transaction_type: Filter by type (Debit/Kredit)
     """
-    df_filtered = df.copy()
+    df_filtered = df
     
     if transaction_type:
         df_filtered = df_filtered[df_filtered['Tipe'] == transaction_type]
@@ -139,3 +142,26 @@ def comparison_table(data1, data2, labels=["Periode 1", "Periode 2"]):
         use_container_width=True,
         hide_index=True
     )
+
+def period_comparison_table(summary):
+    """
+    Display comparison table untuk banyak periode
+    
+    Args:
+        summary: DataFrame summary per periode (engine.comparison.compare_periods)
+    """
+    currency_columns = [
+        'Income', 'Expense', 'Balance', 'Perubahan Income', 'Perubahan Expense', 'Perubahan Balance'
+    ]
+    formatted = {
+        column: summary[column].apply(lambda value: '-' if pd.isna(value) else format_currency(value))
+        for column in currency_columns
+    }
+    formatted['Mulai'] = summary['Mulai'].dt.strftime('%d-%m-%Y')
+    formatted['Sampai'] = summary['Sampai'].dt.strftime('%d-%m-%Y')
+    
+    st.dataframe(
+        summary.assign(**formatted),
+        use_container_width=True,
+        hide_index=True
+    )
@@ -10,6 +10,52 @@ PAGE_LAYOUT = "wide"
 # Path data
 DATA_PATH = "data/bank_transactions.csv"
 
+# Format penyimpanan kolumnar ("parquet", "feather" atau None untuk CSV saja)
+COLUMNAR_FORMAT = "parquet"
+
+# Konversi otomatis CSV ke format kolumnar jika file kolumnar belum ada atau basi
+AUTO_CONVERT_COLUMNAR = True
+
+# Storage backend untuk filter dan agregasi ("pandas", "sqlite" atau "partitioned")
+STORAGE_BACKEND = "pandas"
+
+# Path database SQLite (None untuk database in-memory)
+SQLITE_PATH = "data/bank_transactions.sqlite"
+
+# Direktori dataset terpartisi per bulan
+PARTITIONS_DIR = "data/partitions"
+
+# Engine agregasi baris mentah ("bincount" atau "pandas" untuk groupby)
+AGGREGATION_ENGINE = "bincount"
+
+# Median/kuartil Jumlah: "exact" atau "sketch" (quantile sketch per bulan x Kategori x Tipe,
+# hanya lebih cepat untuk rentang multi-bulan yang besar, lihat benchmarks.quantile_sketch)
+QUANTILE_MODE = "exact"
+
+# Error relatif maksimum quantile sketch
+QUANTILE_RELATIVE_ACCURACY = 0.01
+
+# Di bawah jumlah baris ini quantile selalu exact (sort kecil lebih murah)
+QUANTILE_SKETCH_MIN_ROWS = 50_000
+
+# Jumlah worker process agregasi paralel baris mentah (None = semua core, 1 = serial)
+PARALLEL_WORKERS = None
+
+# Di bawah jumlah baris ini agregasi selalu serial (biaya kirim baris ke worker lebih besar)
+PARALLEL_MIN_ROWS = 1_000_000
+
+# Panjang jendela (hari) yang bisa dipilih di analisis rolling
+ROLLING_WINDOWS = [7, 30, 90]
+
+# Batas memori cache LRU hasil filter (MB)
+FILTER_CACHE_MAX_MB = 64
+
+# File watermark ingestion append-only
+INGEST_STATE_PATH = "data/ingest_state.json"
+
+# Batas memori kerja per chunk (MB) untuk agregasi streaming
+STREAMING_MAX_MEMORY_MB = 256
+
 # Kategori transaksi
 CATEGORIES = [
     'Makanan & Minuman', 
@@ -27,6 +73,19 @@ CATEGORIES = [
 # Tipe transaksi
 TRANSACTION_TYPES = ['Debit', 'Kredit']
 
+# Schema dataset transaksi
+# Kolom kategori disimpan sebagai categorical dengan kode tetap (urut alfabet,
+# sehingga sort berdasarkan kode sama dengan sort berdasarkan teks).
+# Jumlah dan Saldo disimpan sebagai int64 rupiah.
+DATASET_SCHEMA = {
+    'Tanggal': {'dtype': 'datetime64[ns]'},
+    'Kategori': {'dtype': 'category', 'categories': sorted(CATEGORIES)},
+    'Tipe': {'dtype': 'category', 'categories': sorted(TRANSACTION_TYPES)},
+    'Jumlah': {'dtype': 'int64', 'min': 0},
+    'Deskripsi': {'dtype': 'category'},
+    'Saldo': {'dtype': 'int64'},
+}
+
 # Color palette untuk charts
 COLOR_PALETTE = {
     'primary': '#FF4B4B',
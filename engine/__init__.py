@@ -0,0 +1,3 @@
+"""
+Engine package untuk data loading, caching dan agregasi dataset transaksi
+"""
@@ -0,0 +1,147 @@
+"""
+Agregat parsial yang bisa digabung (mergeable) untuk summary transaksi
+
+Setiap fungsi summary di utils dipecah menjadi tiga langkah: hitung agregat
+parsial dari sebagian data, gabungkan beberapa agregat parsial, lalu finalisasi
+menjadi format output. Jalur in-memory dan streaming memakai langkah yang sama
+sehingga hasilnya identik. Agregat parsial hanya mengakses kolom (df['Kolom']),
+sehingga menerima DataFrame maupun engine.views.DataView.
+"""
+
+import pandas as pd
+
+
+def merge_series(left, right):
+    """Gabungkan dua Series agregat (sum per key)"""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    return pd.concat([left, right]).groupby(level=0, observed=True).sum()
+
+
+def summary_partial(df):
+    """Hitung agregat parsial untuk calculate_summary"""
+    tipe = df['Tipe']
+    jumlah = df['Jumlah']
+    return {
+        'total_income': jumlah[tipe == 'Kredit'].sum(),
+        'total_expense': jumlah[tipe == 'Debit'].sum(),
+        'transaction_count': len(df),
+    }
+
+
+def merge_summary(left, right):
+    """Gabungkan dua agregat parsial summary"""
+    if left is None:
+        return right
+    return {key: left[key] + right[key] for key in left}
+
+
+def finalize_summary(partial):
+    """Bentuk dictionary summary dari agregat parsial"""
+    return {
+        'total_income': partial['total_income'],
+        'total_expense': partial['total_expense'],
+        'balance': partial['total_income'] - partial['total_expense'],
+        'transaction_count': partial['transaction_count'],
+    }
+
+
+def category_partial(df):
+    """Hitung agregat parsial (sum, count) per kategori"""
+    return df['Jumlah'].groupby(df['Kategori'], observed=True).agg(['sum', 'count'])
+
+
+def merge_category(left, right):
+    """Gabungkan dua agregat parsial per kategori"""
+    if left is None:
+        return right
+    return pd.concat([left, right]).groupby(level=0, observed=True).sum()
+
+
+def finalize_category_summary(partial):
+    """Bentuk DataFrame summary per kategori dari agregat parsial"""
+    category_summary = partial.reset_index()
+    category_summary.columns = ['Kategori', 'Total', 'Jumlah Transaksi']
+    category_summary['Kategori'] = category_summary['Kategori'].astype(str)
+    category_summary = category_summary.sort_values('Total', ascending=False)
+    return category_summary
+
+
+def monthly_partial(df):
+    """
+    Hitung agregat parsial income dan expense per bulan
+
+    Returns:
+        Tuple (income per bulan, expense per bulan)
+    """
+    bulan = df['Tanggal'].dt.to_period('M').rename('Bulan')
+
+    tipe = df['Tipe']
+    jumlah = df['Jumlah']
+    is_income = tipe == 'Kredit'
+    is_expense = tipe == 'Debit'
+
+    monthly_income = jumlah[is_income].groupby(bulan[is_income]).sum()
+    monthly_expense = jumlah[is_expense].groupby(bulan[is_expense]).sum()
+
+    return monthly_income, monthly_expense
+
+
+def merge_monthly(left, right):
+    """Gabungkan dua agregat parsial bulanan"""
+    if left is None:
+        return right
+    return merge_series(left[0], right[0]), merge_series(left[1], right[1])
+
+
+def finalize_monthly_summary(partial):
+    """Bentuk DataFrame summary bulanan dari agregat parsial"""
+    monthly_income, monthly_expense = partial
+
+    monthly_summary = pd.DataFrame({
+        'Income': monthly_income,
+        'Expense': monthly_expense
+    }).fillna(0)
+
+    monthly_summary['Balance'] = monthly_summary['Income'] - monthly_summary['Expense']
+    monthly_summary.index = monthly_summary.index.astype(str)
+    monthly_summary.index.name = 'Bulan'
+
+    return monthly_summary.reset_index()
+
+
+def daily_partial(df):
+    """Hitung agregat parsial jumlah transaksi per hari"""
+    tanggal = df['Tanggal']
+    return tanggal.groupby(tanggal.dt.date).size().rename(None)
+
+
+def finalize_daily_transactions(partial):
+    """Bentuk DataFrame jumlah transaksi per hari dari agregat parsial"""
+    daily = partial.reset_index()
+    daily.columns = ['Tanggal', 'Jumlah Transaksi']
+    return daily
+
+
+def category_month_partial(df):
+    """Hitung agregat parsial total Jumlah per (Kategori, Bulan)"""
+    bulan = df['Tanggal'].dt.to_period('M').rename('Bulan')
+    return df['Jumlah'].groupby([df['Kategori'], bulan], observed=True).sum()
+
+
+def merge_category_month(left, right):
+    """Gabungkan dua agregat parsial per (Kategori, Bulan)"""
+    if left is None:
+        return right
+    return pd.concat([left, right]).groupby(level=[0, 1], observed=True).sum()
+
+
+def finalize_category_month_pivot(partial):
+    """Bentuk pivot Kategori (baris) x Bulan (kolom, YYYY-MM) dari agregat parsial"""
+    pivot = partial.unstack('Bulan', fill_value=0)
+    pivot.columns = pivot.columns.astype(str)
+    pivot.columns.name = 'Bulan'
+    pivot.name = None
+    return pivot
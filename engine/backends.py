@@ -0,0 +1,246 @@
+"""
+Storage backend untuk filter dan agregasi dataset transaksi
+
+Backend dengan hasil yang sama, masing-masing menerima filter expression
+(select) maupun argumen filter_data:
+- PandasBackend: filter dengan boolean mask di memori
+- SQLiteBackend: filter dan agregasi di-push ke SQLite (stdlib sqlite3) dengan
+  index pada Tanggal, Kategori dan Tipe, sehingga hanya baris atau agregat yang
+  cocok yang masuk ke pandas
+"""
+
+import os
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+
+from engine.aggregates import finalize_category_summary, finalize_summary
+from engine.expressions import SQL_DATETIME_FORMAT, filter_expression
+from engine.schema import apply_schema
+
+_COLUMNS = ['Tanggal', 'Kategori', 'Tipe', 'Jumlah', 'Deskripsi', 'Saldo']
+
+
+class PandasBackend:
+    """Backend in-memory berbasis pandas"""
+
+    name = 'pandas'
+
+    def __init__(self, df):
+        self.df = df
+
+    def select(self, expr):
+        """Baris dataset yang cocok dengan filter expression sebagai DataView tanpa copy"""
+        from utils import select_view
+        return select_view(self.df, expr)
+
+    def filter_data(self, start_date=None, end_date=None, categories=None, transaction_types=None):
+        """Filter dataset, lihat utils.filter_data"""
+        from utils import filter_data
+        return filter_data(self.df, start_date, end_date, categories, transaction_types)
+
+    def append(self, new_rows, data):
+        """Update backend setelah baris baru di-append ke dataset"""
+        self.df = data
+
+    def calculate_summary(self, **filters):
+        """Hitung summary untuk baris yang cocok dengan filter"""
+        from utils import calculate_summary
+        return calculate_summary(self.select(filter_expression(**filters)))
+
+    def get_category_summary(self, **filters):
+        """Hitung summary per kategori untuk baris yang cocok dengan filter"""
+        from utils import get_category_summary
+        return get_category_summary(self.select(filter_expression(**filters)))
+
+
+def where_clause(expr):
+    """
+    Kompilasi filter expression menjadi klausa WHERE berparameter
+
+    Predikat Deskripsi di-resolve ke nilai Deskripsi yang cocok lewat index
+    pencarian dataset, lalu menjadi IN (...).
+
+    Returns:
+        Tuple (sql, params); sql berupa string kosong jika tanpa filter
+    """
+    from utils import _match_descriptions
+
+    sql, params = expr.to_sql(_match_descriptions)
+    return (" WHERE " + sql if sql else ""), params
+
+
+class SQLiteBackend:
+    """
+    Backend SQLite dengan filter pushdown
+
+    Tabel dibangun dari dataset yang sudah di-load. Jika path berupa file,
+    database dipakai ulang selama versi dataset sama.
+    """
+
+    name = 'sqlite'
+
+    def __init__(self, df, path=':memory:'):
+        self.path = path
+        self._lock = threading.Lock()
+        self._description_dtype = df['Deskripsi'].dtype
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._build(df)
+
+    def _build(self, df):
+        """Bangun tabel transaksi dan index jika versi dataset berbeda"""
+        version = df.attrs.get('dataset_version', '')
+
+        with self._lock, self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'dataset_version'").fetchone()
+            if version and row is not None and row[0] == version:
+                return
+
+            self._conn.execute("DROP TABLE IF EXISTS transactions")
+            self._conn.execute("""
+                CREATE TABLE transactions (
+                    row_id INTEGER PRIMARY KEY,
+                    Tanggal TEXT NOT NULL,
+                    Kategori TEXT NOT NULL,
+                    Tipe TEXT NOT NULL,
+                    Jumlah INTEGER NOT NULL,
+                    Deskripsi TEXT,
+                    Saldo INTEGER
+                )
+            """)
+
+            self._insert(df)
+
+            self._conn.execute("CREATE INDEX idx_transactions_tanggal ON transactions (Tanggal)")
+            self._conn.execute("CREATE INDEX idx_transactions_kategori ON transactions (Kategori)")
+            self._conn.execute("CREATE INDEX idx_transactions_tipe ON transactions (Tipe)")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('dataset_version', ?)", (version,)
+            )
+
+    def _insert(self, df):
+        """Insert baris DataFrame ke tabel transaksi (row_id = index dataset)"""
+        records = zip(
+            df.index.tolist(),
+            df['Tanggal'].dt.strftime(SQL_DATETIME_FORMAT).tolist(),
+            df['Kategori'].astype(str).tolist(),
+            df['Tipe'].astype(str).tolist(),
+            df['Jumlah'].tolist(),
+            df['Deskripsi'].astype(str).tolist(),
+            df['Saldo'].tolist(),
+        )
+        self._conn.executemany("INSERT INTO transactions VALUES (?, ?, ?, ?, ?, ?, ?)", records)
+
+    def append(self, new_rows, data):
+        """Insert baris baru tanpa membangun ulang tabel dan index"""
+        with self._lock, self._conn:
+            self._insert(new_rows)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('dataset_version', ?)",
+                (data.attrs.get('dataset_version', ''),)
+            )
+        self._description_dtype = data['Deskripsi'].dtype
+
+    def _query(self, sql, params):
+        """Jalankan query dan kembalikan semua baris"""
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def select(self, expr):
+        """Baris yang cocok dengan filter expression, dengan satu query SQL"""
+        where, params = where_clause(expr)
+        rows = self._query(
+            f"SELECT row_id, {', '.join(_COLUMNS)} FROM transactions{where} ORDER BY row_id", params
+        )
+
+        df = pd.DataFrame(rows, columns=['row_id'] + _COLUMNS).set_index('row_id')
+        df.index = df.index.astype('int64')
+        df.index.name = None
+        df['Jumlah'] = df['Jumlah'].astype('int64')
+        df['Saldo'] = df['Saldo'].astype('int64')
+        df['Deskripsi'] = df['Deskripsi'].astype(self._description_dtype)
+        return apply_schema(df)
+
+    def filter_data(self, start_date=None, end_date=None, categories=None, transaction_types=None):
+        """Filter dataset dengan satu query SQL, lihat utils.filter_data"""
+        return self.select(filter_expression(start_date, end_date, categories, transaction_types))
+
+    def calculate_summary(self, **filters):
+        """Hitung summary dengan satu query agregat"""
+        where, params = where_clause(filter_expression(**filters))
+        total_income, total_expense, count = self._query(f"""
+            SELECT
+                COALESCE(SUM(CASE WHEN Tipe = 'Kredit' THEN Jumlah ELSE 0 END), 0),
+                COALESCE(SUM(CASE WHEN Tipe = 'Debit' THEN Jumlah ELSE 0 END), 0),
+                COUNT(*)
+            FROM transactions{where}
+        """, params)[0]
+
+        return finalize_summary({
+            'total_income': np.int64(total_income),
+            'total_expense': np.int64(total_expense),
+            'transaction_count': count,
+        })
+
+    def get_category_summary(self, **filters):
+        """Hitung summary per kategori dengan satu query GROUP BY"""
+        where, params = where_clause(filter_expression(**filters))
+        rows = self._query(
+            f"SELECT Kategori, SUM(Jumlah), COUNT(*) FROM transactions{where} "
+            f"GROUP BY Kategori ORDER BY Kategori", params
+        )
+
+        partial = pd.DataFrame(rows, columns=['Kategori', 'sum', 'count']).set_index('Kategori')
+        partial = partial.astype('int64')
+        return finalize_category_summary(partial)
+
+
+def create_backend(name, df):
+    """
+    Buat backend sesuai nama
+
+    Args:
+        name: 'pandas', 'sqlite' atau 'partitioned'
+        df: Dataset yang di-load
+
+    Returns:
+        Instance backend
+    """
+    if name == 'pandas':
+        return PandasBackend(df)
+    if name == 'sqlite':
+        from config import SQLITE_PATH
+        path = SQLITE_PATH or ':memory:'
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        return SQLiteBackend(df, path)
+
+    if name == 'partitioned':
+        from config import PARTITIONS_DIR
+        from engine.columnar import columnar_available
+        from engine.partitions import PartitionedBackend
+        if not columnar_available():
+            raise ImportError("Backend 'partitioned' membutuhkan pyarrow (pip install pyarrow)")
+        return PartitionedBackend(df, PARTITIONS_DIR)
+
+    raise ValueError(f"Storage backend tidak dikenal: {name}")
+
+
+def get_backend(name=None):
+    """
+    Get backend process-wide untuk versi dataset saat ini
+
+    Args:
+        name: Nama backend (optional, default STORAGE_BACKEND)
+
+    Returns:
+        Instance backend
+    """
+    from config import STORAGE_BACKEND
+    from utils import get_derived
+
+    name = name or STORAGE_BACKEND
+    return get_derived(f"backend:{name}", lambda df: create_backend(name, df))
@@ -0,0 +1,165 @@
+"""
+Index saldo per tanggal dan validasi Saldo
+
+BalanceIndex menyimpan checkpoint saldo: Saldo penutup untuk setiap Tanggal
+unik (baris terakhir pada Tanggal itu), urut waktu. Saldo pada tanggal X adalah
+checkpoint terakhir dengan Tanggal <= X, dicari dengan binary search, sehingga
+satu tanggal maupun ribuan tanggal sekaligus tidak perlu scan baris. Ringkasan
+per bulan (saldo awal dan akhir) diturunkan dari checkpoint yang sama.
+
+Saldo juga dihitung ulang secara vektor dari Jumlah/Tipe (saldo awal + cumsum
+Kredit - Debit). Baris tempat selisih Saldo tersimpan vs hitungan berubah
+ditandai sebagai drift: satu baris Saldo yang salah muncul sebagai dua titik
+(awal dan akhir selisih), transaksi yang hilang sebagai satu titik yang
+selisihnya terbawa ke baris berikutnya.
+"""
+
+import numpy as np
+import pandas as pd
+
+DRIFT_COLUMNS = ['Tanggal', 'Deskripsi', 'Jumlah', 'Tipe', 'Saldo', 'Saldo Hitung', 'Selisih']
+
+
+def signed_amounts(df):
+    """Jumlah bertanda: + untuk Kredit, - untuk Debit"""
+    amounts = df['Jumlah'].to_numpy()
+    return np.where((df['Tipe'] == 'Kredit').to_numpy(), amounts, -amounts)
+
+
+def opening_balance(df):
+    """Saldo sebelum baris pertama (Saldo baris pertama dikurangi Jumlah bertandanya)"""
+    if len(df) == 0:
+        return 0
+    return df['Saldo'].iloc[0] - signed_amounts(df.iloc[:1])[0]
+
+
+def recompute_balance(df, opening=None):
+    """
+    Hitung ulang saldo berjalan dari Jumlah dan Tipe
+
+    Args:
+        df: DataFrame transaksi urut Tanggal
+        opening: Saldo sebelum baris pertama (default diturunkan dari Saldo dan
+            Jumlah baris pertama)
+
+    Returns:
+        Array saldo setelah setiap baris
+    """
+    if opening is None:
+        opening = opening_balance(df)
+    return opening + np.cumsum(signed_amounts(df))
+
+
+def _drift_rows(df, recomputed, previous_drift=0):
+    """Baris tempat selisih Saldo tersimpan - hitungan berubah (format DRIFT_COLUMNS)"""
+    drift = df['Saldo'].to_numpy() - recomputed
+    changed = np.diff(drift, prepend=previous_drift) != 0
+
+    rows = df[DRIFT_COLUMNS[:5]][changed]
+    return rows.assign(**{'Saldo Hitung': recomputed[changed], 'Selisih': drift[changed]})
+
+
+class BalanceIndex:
+    """
+    Checkpoint saldo per Tanggal unik untuk query saldo pada tanggal tertentu
+
+    Attributes:
+        timestamps: Array datetime64 Tanggal unik (urut)
+        closing: Saldo tersimpan setelah baris terakhir pada setiap Tanggal
+        opening: Saldo sebelum transaksi pertama
+        drift: DataFrame baris drift Saldo (format DRIFT_COLUMNS)
+    """
+
+    def __init__(self, df):
+        self.timestamps, self.closing = self._checkpoints(df)
+        self.opening = opening_balance(df)
+
+        recomputed = recompute_balance(df, self.opening)
+        self.drift = _drift_rows(df, recomputed)
+        self._last_recomputed = recomputed[-1] if len(df) else self.opening
+        self._last_drift = df['Saldo'].iloc[-1] - self._last_recomputed if len(df) else 0
+
+    @staticmethod
+    def _checkpoints(df):
+        """Tanggal unik dan Saldo baris terakhir pada setiap Tanggal"""
+        tanggal = df['Tanggal'].to_numpy()
+        last = np.flatnonzero(np.append(tanggal[1:] != tanggal[:-1], True)) if len(tanggal) else []
+        return tanggal[last], df['Saldo'].to_numpy()[last]
+
+    def append(self, new_rows, data):
+        """Tambahkan checkpoint dan validasi untuk baris baru (rebuild jika tidak urut)"""
+        if len(new_rows) == 0:
+            return
+        if len(self.timestamps) == 0 or new_rows['Tanggal'].iloc[0] < self.timestamps[-1]:
+            self.__init__(data)
+            return
+
+        timestamps, closing = self._checkpoints(new_rows)
+        if timestamps[0] == self.timestamps[-1]:
+            self.timestamps, self.closing = self.timestamps[:-1], self.closing[:-1]
+        self.timestamps = np.concatenate([self.timestamps, timestamps])
+        self.closing = np.concatenate([self.closing, closing])
+
+        recomputed = recompute_balance(new_rows, self._last_recomputed)
+        self.drift = pd.concat([self.drift, _drift_rows(new_rows, recomputed, self._last_drift)])
+        self._last_recomputed = recomputed[-1]
+        self._last_drift = new_rows['Saldo'].iloc[-1] - self._last_recomputed
+
+    def balance_at(self, dates):
+        """
+        Saldo setelah semua transaksi dengan Tanggal <= setiap tanggal
+
+        Args:
+            dates: Satu tanggal atau array tanggal
+
+        Returns:
+            Saldo (int) untuk satu tanggal, atau array saldo untuk array tanggal;
+            tanggal sebelum transaksi pertama mendapat saldo awal
+        """
+        scalar = np.ndim(dates) == 0
+        values = pd.DatetimeIndex([dates] if scalar else dates).to_numpy()
+
+        positions = np.searchsorted(self.timestamps, values, side='right') - 1
+        balances = np.where(positions >= 0, self.closing[np.maximum(positions, 0)], self.opening)
+        return balances[0] if scalar else balances
+
+    def balance_series(self, start=None, end=None, freq='D'):
+        """
+        Saldo penutup per periode (untuk chart saldo dari waktu ke waktu)
+
+        Args:
+            start: Tanggal awal (default transaksi pertama)
+            end: Tanggal akhir (default transaksi terakhir)
+            freq: Frekuensi pandas ('D', 'W', 'MS', ...)
+
+        Returns:
+            DataFrame berisi Tanggal dan Saldo
+        """
+        if len(self.timestamps) == 0:
+            return pd.DataFrame({'Tanggal': pd.DatetimeIndex([]), 'Saldo': []})
+
+        start = pd.Timestamp(start if start is not None else self.timestamps[0]).normalize()
+        end = pd.Timestamp(end if end is not None else self.timestamps[-1])
+        dates = pd.date_range(start, end, freq=freq)
+
+        # Saldo penutup: semua transaksi sampai akhir hari
+        day_ends = dates + pd.Timedelta(days=1) - pd.Timedelta(1, 'ns')
+        return pd.DataFrame({'Tanggal': dates, 'Saldo': self.balance_at(day_ends)})
+
+    def monthly_checkpoints(self):
+        """
+        Saldo awal dan akhir per bulan
+
+        Returns:
+            DataFrame berisi Bulan, Saldo Awal, Saldo Akhir dan Perubahan
+        """
+        months = pd.DatetimeIndex(self.timestamps).to_period('M')
+        closing = pd.Series(self.closing).groupby(months).last()
+        opening = closing.shift(1, fill_value=self.opening)
+
+        return pd.DataFrame({
+            'Bulan': closing.index.astype(str),
+            'Saldo Awal': opening.to_numpy(),
+            'Saldo Akhir': closing.to_numpy(),
+            'Perubahan': (closing - opening).to_numpy(),
+        })
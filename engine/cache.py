@@ -0,0 +1,341 @@
+"""
+Cache dataset process-wide yang dibagi oleh semua session dan page
+"""
+
+import hashlib
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+_HASH_BLOCK_SIZE = 1 << 20
+
+# Ukuran blok terakhir sebelum watermark yang di-hash untuk mendeteksi penggantian isi
+_TAIL_CHECK_SIZE = 64 * 1024
+
+
+def file_stat(path):
+    """Get fingerprint murah dari file (size, mtime_ns)"""
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def file_digest(path, size=None):
+    """
+    Hitung hash isi file untuk memastikan file benar-benar berubah
+
+    Args:
+        path: Path file
+        size: Hanya hash sejumlah byte pertama (optional)
+
+    Returns:
+        Objek hasher (blake2b) yang bisa di-update dengan byte tambahan
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    remaining = size
+
+    with open(path, 'rb') as f:
+        while remaining is None or remaining > 0:
+            block = f.read(_HASH_BLOCK_SIZE if remaining is None else min(_HASH_BLOCK_SIZE, remaining))
+            if not block:
+                break
+            hasher.update(block)
+            if remaining is not None:
+                remaining -= len(block)
+
+    return hasher
+
+
+def tail_digest(path, offset):
+    """
+    Hash blok terakhir sebelum offset
+
+    Cek murah bahwa isi lama tidak diganti saat file bertambah: hanya
+    _TAIL_CHECK_SIZE byte yang dibaca, berapa pun ukuran file.
+    """
+    start = max(0, offset - _TAIL_CHECK_SIZE)
+    with open(path, 'rb') as f:
+        f.seek(start)
+        block = f.read(offset - start)
+    return hashlib.blake2b(block, digest_size=16).hexdigest()
+
+
+def concat_rows(data, new_rows):
+    """
+    Tambahkan baris baru ke dataset, menyatukan kategori kolom categorical
+
+    Args:
+        data: Dataset lama
+        new_rows: Baris baru dengan kolom dan tipe yang sama
+
+    Returns:
+        DataFrame gabungan dengan RangeIndex berlanjut
+    """
+    new_rows = new_rows[list(data.columns)].copy()
+    data = data.copy(deep=False)
+
+    for col in data.columns:
+        if isinstance(data[col].dtype, pd.CategoricalDtype):
+            missing = new_rows[col].cat.categories.difference(data[col].cat.categories)
+            if len(missing):
+                data[col] = data[col].cat.add_categories(missing)
+            new_rows[col] = new_rows[col].cat.set_categories(data[col].cat.categories)
+
+    new_rows.index = pd.RangeIndex(len(data), len(data) + len(new_rows))
+    combined = pd.concat([data, new_rows])
+    combined.attrs = dict(data.attrs)
+    return combined
+
+
+class DatasetCache:
+    """
+    Cache satu salinan dataset per proses server
+
+    Dataset di-reload hanya jika file sumber berubah. Perubahan dideteksi dari
+    size/mtime, lalu dikonfirmasi dengan hash isi file sehingga file yang hanya
+    di-touch tidak memicu reload. Jika file hanya bertambah di akhir (append),
+    hanya baris lengkap setelah watermark (byte offset) yang di-parse; isi lama
+    dicek dengan hash blok terakhir sebelum watermark, bukan hash ulang seluruh
+    file. Setiap pemanggil mendapat shallow copy sendiri di atas buffer kolom
+    read-only (lihat _freeze).
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._entries = {}
+        self._stats = {'hits': 0, 'misses': 0, 'reloads': 0, 'appends': 0}
+
+    def get(self, path, loader, key=None, tail_loader=None):
+        """
+        Ambil dataset dari cache, load ulang jika file berubah
+
+        Args:
+            path: Path file sumber
+            loader: Callable loader(path) yang mengembalikan DataFrame
+            key: Key tambahan untuk membedakan variasi load (optional)
+            tail_loader: Callable tail_loader(path, offset, columns, end) yang
+                mem-parse baris di rentang byte [offset, end) (optional, untuk
+                append inkremental)
+
+        Returns:
+            DataFrame (shallow copy) dengan attrs['dataset_version']
+        """
+        cache_key = (os.path.abspath(path), key)
+        stat = file_stat(path)
+
+        with self._lock:
+            entry = self._entries.get(cache_key)
+
+            if entry is not None and entry['stat'] == stat:
+                self._stats['hits'] += 1
+                return _share(entry)
+
+            if entry is not None and tail_loader is not None and stat[0] > entry['offset']:
+                if self._append(entry, path, stat, tail_loader):
+                    return _share(entry)
+
+            hasher = file_digest(path, stat[0])
+            digest = hasher.hexdigest()
+
+            if entry is not None and entry['digest'] == digest:
+                # File di-touch tanpa perubahan isi
+                entry['stat'] = stat
+                self._stats['hits'] += 1
+                return _share(entry)
+
+            data = _freeze(loader(path))
+            data.attrs['dataset_version'] = digest
+
+            self._stats['reloads' if entry is not None else 'misses'] += 1
+            entry = {
+                'stat': stat,
+                'offset': stat[0],
+                'tail': tail_digest(path, stat[0]),
+                'digest': digest,
+                'hasher': hasher,
+                'data': data,
+            }
+            self._entries[cache_key] = entry
+
+            return _share(entry)
+
+    def _append(self, entry, path, stat, tail_loader):
+        """
+        Update entry secara inkremental jika file hanya bertambah di akhir
+
+        Baris terakhir yang belum selesai ditulis (tanpa newline) tidak di-parse:
+        entry tetap dipakai dan baris tersebut ikut di-parse setelah lengkap.
+
+        Returns:
+            True jika entry bisa dipakai (baris baru di-append atau menunggu baris
+            lengkap), False jika perlu reload penuh
+        """
+        offset = entry['offset']
+
+        # Pastikan isi lama tidak diganti (blok terakhir sebelum watermark sama)
+        if tail_digest(path, offset) != entry['tail']:
+            return False
+
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            tail = f.read(stat[0] - offset)
+
+        # Tunggu sampai baris terakhir selesai ditulis
+        tail = tail[:tail.rfind(b'\n') + 1]
+        if not tail:
+            entry['stat'] = stat
+            self._stats['hits'] += 1
+            return True
+
+        end = offset + len(tail)
+        old_rows = len(entry['data'])
+        new_rows = tail_loader(path, offset, list(entry['data'].columns), end)
+
+        # Dataset dijaga urut berdasarkan Tanggal; append yang merusak urutan perlu reload penuh
+        if 'Tanggal' in new_rows.columns and old_rows > 0 and len(new_rows) > 0:
+            tanggal = pd.concat([entry['data']['Tanggal'].iloc[-1:], new_rows['Tanggal']])
+            if not tanggal.is_monotonic_increasing:
+                return False
+
+        hasher = entry['hasher'].copy()
+        hasher.update(tail)
+        digest = hasher.hexdigest()
+
+        data = _freeze(concat_rows(entry['data'], new_rows))
+        data.attrs['dataset_version'] = digest
+        new_rows = data.iloc[old_rows:]
+
+        # Struktur turunan yang punya append() di-update di tempat, sisanya dibangun ulang
+        derived = {}
+        for name, obj in entry.get('derived', {}).items():
+            if hasattr(obj, 'append'):
+                obj.append(new_rows, data)
+                derived[name] = obj
+
+        entry.update({
+            'stat': stat,
+            'offset': end,
+            'tail': tail_digest(path, end),
+            'digest': digest,
+            'hasher': hasher,
+            'data': data,
+            'derived': derived,
+        })
+        self._stats['appends'] += 1
+        return True
+
+    def derived(self, path, name, version, builder, key=None):
+        """
+        Get struktur turunan (index, backend, agregat) yang dibangun sekali per versi dataset
+
+        Struktur disimpan di entry dataset sehingga otomatis dibuang saat dataset di-reload.
+        Struktur yang punya method append(new_rows, data) di-update saat data di-append.
+
+        Args:
+            path: Path file sumber
+            name: Nama struktur turunan
+            version: Versi dataset yang dipakai builder
+            builder: Callable tanpa argumen yang membangun struktur
+            key: Key variasi load (optional)
+
+        Returns:
+            Struktur turunan
+        """
+        with self._lock:
+            entry = self._entries.get((os.path.abspath(path), key))
+
+            if entry is None or entry['digest'] != version:
+                # Versi sudah berganti, jangan simpan struktur basi
+                return builder()
+
+            store = entry.setdefault('derived', {})
+            if name not in store:
+                store[name] = builder()
+            return store[name]
+
+    def is_cached(self, path, df, key=None):
+        """
+        Cek apakah df adalah salinan (shallow) dari dataset yang sedang di-cache
+
+        Salinan dari load_data() berbagi buffer kolom dengan dataset di-cache;
+        hasil filter, sort atau reset_index tidak, sehingga index posisi baris
+        yang dibangun dari dataset hanya dipakai untuk DataFrame yang benar.
+        """
+        entry = self._entries.get((os.path.abspath(path), key))
+        if entry is None or df.attrs.get('dataset_version') != entry['digest']:
+            return False
+
+        data = entry['data']
+        if len(df) != len(data) or not df.index.equals(data.index) or 'Jumlah' not in df.columns:
+            return False
+
+        return np.shares_memory(df['Jumlah'].to_numpy(), data['Jumlah'].to_numpy())
+
+    def version(self, path, key=None):
+        """Get versi dataset (hash isi file) yang sedang di-cache, None jika belum di-load"""
+        entry = self._entries.get((os.path.abspath(path), key))
+        return entry['digest'] if entry is not None else None
+
+    def stats(self):
+        """
+        Get statistik cache
+
+        Returns:
+            Dictionary berisi hits, misses, reloads, appends, hit_rate dan entries
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+
+        total = stats['hits'] + stats['misses'] + stats['reloads'] + stats['appends']
+        stats['hit_rate'] = stats['hits'] / total if total > 0 else 0.0
+        return stats
+
+    def clear(self):
+        """Hapus semua entry dan reset statistik"""
+        with self._lock:
+            self._entries.clear()
+            self._stats = {'hits': 0, 'misses': 0, 'reloads': 0, 'appends': 0}
+
+
+def _freeze(data):
+    """
+    Bangun ulang dataset di atas view read-only dari buffer kolomnya (tanpa copy)
+
+    Shallow copy berbagi buffer dengan dataset di-cache. Dengan buffer read-only,
+    assignment kolom di salinan hanya mengganti kolom salinan itu, sedangkan
+    penulisan di tempat (mis. df.loc[i, col] = x) di-copy dulu oleh Copy-on-Write
+    (pandas >= 3.0) atau gagal dengan ValueError (pandas lama), tidak pernah
+    menulis ke data di-cache. Tidak mengubah opsi global pandas.
+    """
+    columns = {}
+    for col in data.columns:
+        series = data[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = _read_only(series.cat.codes.to_numpy())
+            columns[col] = pd.Categorical.from_codes(codes, dtype=series.dtype)
+        else:
+            columns[col] = _read_only(series.to_numpy())
+
+    frozen = pd.DataFrame(columns, index=data.index, copy=False)
+    frozen.attrs = dict(data.attrs)
+    return frozen
+
+
+def _read_only(values):
+    """View read-only dari array (buffer tetap sama)"""
+    view = values.view()
+    view.setflags(write=False)
+    return view
+
+
+def _share(entry):
+    """Shallow copy dataset untuk pemanggil; data di-cache tidak ikut berubah"""
+    shared = entry['data'].copy(deep=False)
+    shared.attrs['dataset_version'] = entry['digest']
+    return shared
+
+
+# Instance tunggal per proses server
+dataset_cache = DatasetCache()
@@ -0,0 +1,239 @@
+"""
+Penyimpanan kolumnar (Parquet/Feather) untuk dataset transaksi
+
+File kolumnar menyimpan kolom dengan tipe final (datetime, categorical, int64)
+sehingga load tidak perlu parse teks dan bisa membaca sebagian kolom saja.
+"""
+
+import argparse
+import importlib.util
+import io
+import os
+
+import pandas as pd
+
+from engine.schema import apply_schema, csv_dtypes
+
+
+FORMAT_EXTENSIONS = {
+    'parquet': '.parquet',
+    'feather': '.feather',
+}
+
+# Key metadata untuk fingerprint file CSV sumber
+_SOURCE_SIZE_KEY = b'source_size'
+_SOURCE_MTIME_KEY = b'source_mtime_ns'
+
+
+def columnar_available():
+    """Cek apakah pyarrow tersedia untuk format kolumnar (tanpa meng-import-nya)"""
+    return importlib.util.find_spec('pyarrow') is not None
+
+
+def columnar_path(csv_path, fmt='parquet'):
+    """Get path file kolumnar untuk file CSV sumber"""
+    return os.path.splitext(csv_path)[0] + FORMAT_EXTENSIONS[fmt]
+
+
+def read_csv_typed(csv_path, columns=None):
+    """
+    Parse CSV transaksi dengan tipe kolom sesuai DATASET_SCHEMA
+
+    Args:
+        csv_path: Path file CSV
+        columns: List kolom yang dibaca (optional, default semua)
+
+    Returns:
+        DataFrame bertipe
+    """
+    df = pd.read_csv(csv_path, usecols=columns, dtype=csv_dtypes(columns))
+    return apply_schema(df)
+
+
+def read_csv_tail(csv_path, offset, columns=None, end=None):
+    """
+    Parse baris CSV mulai dari byte offset (bagian yang baru di-append)
+
+    Args:
+        csv_path: Path file CSV
+        offset: Byte offset awal baris baru
+        columns: List kolom yang dibaca (optional, default semua)
+        end: Byte offset akhir (eksklusif, optional, default akhir file)
+
+    Returns:
+        DataFrame bertipe berisi baris baru
+    """
+    with open(csv_path, 'rb') as f:
+        header = f.readline().decode('utf-8').strip().split(',')
+        f.seek(offset)
+        source = f if end is None else io.BytesIO(f.read(end - offset))
+        df = pd.read_csv(source, header=None, names=header, usecols=columns, dtype=csv_dtypes(columns))
+
+    return apply_schema(df)
+
+
+def convert_to_columnar(csv_path, out_path=None, fmt='parquet'):
+    """
+    Konversi CSV transaksi menjadi file kolumnar bertipe
+
+    File ditulis ke file sementara lalu di-rename sehingga pembaca lain
+    tidak pernah melihat file setengah jadi.
+
+    Args:
+        csv_path: Path file CSV sumber
+        out_path: Path file output (optional, default di samping CSV)
+        fmt: 'parquet' atau 'feather'
+
+    Returns:
+        Path file kolumnar
+    """
+    if not columnar_available():
+        raise ImportError("pyarrow diperlukan untuk format kolumnar")
+
+    out_path = out_path or columnar_path(csv_path, fmt)
+    stat = os.stat(csv_path)
+
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    df = read_csv_typed(csv_path)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[_SOURCE_SIZE_KEY] = str(stat.st_size).encode()
+    metadata[_SOURCE_MTIME_KEY] = str(stat.st_mtime_ns).encode()
+    table = table.replace_schema_metadata(metadata)
+
+    tmp_path = f"{out_path}.tmp-{os.getpid()}"
+    try:
+        if fmt == 'parquet':
+            pq.write_table(table, tmp_path)
+        else:
+            feather.write_feather(table, tmp_path)
+        os.replace(tmp_path, out_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return out_path
+
+
+def _read_schema(path, fmt):
+    """Baca schema file kolumnar tanpa membaca data"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if fmt == 'parquet':
+        return pq.read_schema(path)
+    with pa.memory_map(path) as source:
+        return pa.ipc.open_file(source).schema
+
+
+def is_fresh(csv_path, path, fmt='parquet'):
+    """
+    Cek apakah file kolumnar masih sesuai dengan CSV sumber
+
+    Returns:
+        True jika file kolumnar ada dan dibuat dari versi CSV yang sama
+    """
+    if not columnar_available() or not os.path.exists(path):
+        return False
+
+    import pyarrow as pa
+
+    try:
+        metadata = _read_schema(path, fmt).metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return False
+
+    stat = os.stat(csv_path)
+    return (
+        metadata.get(_SOURCE_SIZE_KEY) == str(stat.st_size).encode()
+        and metadata.get(_SOURCE_MTIME_KEY) == str(stat.st_mtime_ns).encode()
+    )
+
+
+def read_columnar(path, columns=None, fmt='parquet'):
+    """
+    Baca file kolumnar, hanya kolom yang diminta
+
+    Args:
+        path: Path file kolumnar
+        columns: List kolom yang dibaca (optional, default semua)
+        fmt: 'parquet' atau 'feather'
+
+    Returns:
+        DataFrame
+    """
+    if fmt == 'parquet':
+        df = pd.read_parquet(path, columns=columns)
+    else:
+        df = pd.read_feather(path, columns=columns)
+
+    return apply_schema(df)
+
+
+def ensure_columnar(csv_path, fmt='parquet', auto_convert=True):
+    """
+    Pastikan file kolumnar fresh tersedia untuk CSV sumber
+
+    Args:
+        csv_path: Path file CSV sumber
+        fmt: 'parquet', 'feather' atau None untuk CSV saja
+        auto_convert: Konversi otomatis jika file kolumnar belum ada atau basi
+
+    Returns:
+        Path file kolumnar, atau None jika harus memakai CSV
+    """
+    if not fmt or not columnar_available():
+        return None
+
+    path = columnar_path(csv_path, fmt)
+
+    if not is_fresh(csv_path, path, fmt) and auto_convert:
+        try:
+            convert_to_columnar(csv_path, path, fmt)
+        except OSError:
+            # Direktori data read-only (mis. di hosting), pakai CSV
+            pass
+
+    return path if is_fresh(csv_path, path, fmt) else None
+
+
+def load_dataset(csv_path, columns=None, fmt='parquet', auto_convert=True):
+    """
+    Load dataset dari file kolumnar jika tersedia dan fresh, fallback ke CSV
+
+    Args:
+        csv_path: Path file CSV sumber
+        columns: List kolom yang dibaca (optional, default semua)
+        fmt: 'parquet', 'feather' atau None untuk CSV saja
+        auto_convert: Konversi otomatis jika file kolumnar belum ada atau basi
+
+    Returns:
+        DataFrame bertipe
+    """
+    path = ensure_columnar(csv_path, fmt, auto_convert)
+
+    if path is not None:
+        return read_columnar(path, columns=columns, fmt=fmt)
+
+    return read_csv_typed(csv_path, columns=columns)
+
+
+def main():
+    """CLI untuk konversi CSV ke format kolumnar"""
+    from config import DATA_PATH
+
+    parser = argparse.ArgumentParser(description="Konversi CSV transaksi ke format kolumnar")
+    parser.add_argument('csv_path', nargs='?', default=DATA_PATH, help="Path file CSV sumber")
+    parser.add_argument('--format', choices=list(FORMAT_EXTENSIONS), default='parquet')
+    parser.add_argument('--output', default=None, help="Path file output")
+    args = parser.parse_args()
+
+    out_path = convert_to_columnar(args.csv_path, args.output, args.format)
+    print(f"✅ File kolumnar berhasil dibuat: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
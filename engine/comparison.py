@@ -0,0 +1,148 @@
+"""
+Perbandingan antar periode (bulan ke bulan, tahun ke tahun, jendela bergulir, custom)
+
+Periode adalah DataFrame berisi Periode (label unik), Mulai dan Sampai (tanggal,
+inklusif per hari). compare_periods menjawab semua periode sekaligus dari
+DailyLedger: total per (periode, Kategori, Tipe) adalah selisih dua baris
+kumulatif per periode dalam satu operasi array, sehingga membandingkan 24 bulan
+sama murahnya dengan 2 periode dan periode boleh saling tumpang tindih.
+
+Perubahan dihitung terhadap periode sebelumnya dalam urutan periode (periode
+pertama tidak punya perubahan).
+"""
+
+import numpy as np
+import pandas as pd
+
+PERIOD_COLUMNS = ['Periode', 'Mulai', 'Sampai']
+PERIOD_MODES = ['Bulan ke Bulan', 'Tahun ke Tahun', 'Jendela Bergulir', 'Custom']
+
+
+def _day(value):
+    """Timestamp awal hari"""
+    return pd.Timestamp(value).normalize()
+
+
+def _range_label(start, end):
+    return f"{start:%Y-%m-%d} - {end:%Y-%m-%d}"
+
+
+def make_periods(starts, ends, labels=None):
+    """
+    Bentuk DataFrame periode
+
+    Args:
+        starts: Tanggal awal per periode
+        ends: Tanggal akhir per periode (inklusif)
+        labels: Label per periode (default rentang tanggal)
+
+    Returns:
+        DataFrame berisi Periode, Mulai, Sampai
+    """
+    starts = pd.DatetimeIndex(starts).normalize()
+    ends = pd.DatetimeIndex(ends).normalize()
+    if labels is None:
+        labels = [_range_label(start, end) for start, end in zip(starts, ends)]
+    if len(set(labels)) != len(labels):
+        raise ValueError("Label periode harus unik")
+    return pd.DataFrame({'Periode': list(labels), 'Mulai': starts, 'Sampai': ends})
+
+
+def month_periods(start, end):
+    """Bulan kalender yang beririsan dengan [start, end], dipotong ke rentang itu"""
+    start, end = _day(start), _day(end)
+    months = pd.period_range(start, end, freq='M')
+    starts = months.start_time.where(months.start_time >= start, start)
+    ends = months.end_time.normalize()
+    ends = ends.where(ends <= end, end)
+    return make_periods(starts, ends, labels=months.astype(str).tolist())
+
+
+def month_over_month(end, n_months):
+    """n_months bulan kalender terakhir sampai bulan tanggal end"""
+    end = _day(end)
+    first = (end.to_period('M') - (n_months - 1)).start_time
+    return month_periods(first, end)
+
+
+def year_over_year(start, end, n_years):
+    """Rentang [start, end] yang sama pada n_years tahun terakhir (tahun terlama dulu)"""
+    start, end = _day(start), _day(end)
+    offsets = [pd.DateOffset(years=k) for k in range(n_years - 1, -1, -1)]
+    starts = [start - offset for offset in offsets]
+    ends = [end - offset for offset in offsets]
+    labels = [str(period_end.year) for period_end in ends] if start.year == end.year else None
+    return make_periods(starts, ends, labels)
+
+
+def rolling_periods(end, days, n_windows):
+    """n_windows jendela berurutan sepanjang days hari, jendela terakhir berakhir di end"""
+    end = _day(end)
+    ends = pd.DatetimeIndex([end - pd.Timedelta(days=days * k) for k in range(n_windows - 1, -1, -1)])
+    return make_periods(ends - pd.Timedelta(days=days - 1), ends)
+
+
+def custom_periods(ranges):
+    """Periode dari list (start, end) dengan label Periode 1, Periode 2, ..."""
+    starts = [start for start, _ in ranges]
+    ends = [end for _, end in ranges]
+    return make_periods(starts, ends, labels=[f"Periode {i + 1}" for i in range(len(ranges))])
+
+
+def _change(values, previous):
+    """Perubahan (%) terhadap nilai sebelumnya (NaN jika sebelumnya 0 atau tidak ada)"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(previous > 0, (values - previous) / previous * 100, np.nan)
+
+
+def compare_periods(ledger, periods, expr=None):
+    """
+    Summary dan total per kategori untuk setiap periode, plus perubahannya
+
+    Args:
+        ledger: engine.ledger.DailyLedger atas data yang dibandingkan
+        periods: DataFrame periode (lihat make_periods)
+        expr: Expression view (optional, harus bisa dijawab ledger); periode
+            dipotong ke batas tanggalnya dan hanya kategori/tipe yang cocok dihitung
+
+    Returns:
+        Dictionary berisi:
+        - summary: DataFrame per periode (Periode, Mulai, Sampai, Income, Expense,
+          Balance, Jumlah Transaksi, Perubahan Income/Expense/Balance)
+        - categories: DataFrame per (Kategori, Periode) berisi Total, Jumlah
+          Transaksi, Perubahan dan Perubahan (%); kategori tanpa transaksi di
+          semua periode tidak ikut
+    """
+    sums, counts = ledger.category_windows(periods['Mulai'], periods['Sampai'], expr)
+    types = list(ledger.type_dtype.categories)
+
+    income = sums[:, :, types.index('Kredit')].sum(axis=1)
+    expense = sums[:, :, types.index('Debit')].sum(axis=1)
+    summary = periods[PERIOD_COLUMNS].reset_index(drop=True).assign(
+        Income=income,
+        Expense=expense,
+        Balance=income - expense,
+        **{'Jumlah Transaksi': counts.sum(axis=(1, 2))}
+    )
+    for column in ['Income', 'Expense', 'Balance']:
+        summary[f'Perubahan {column}'] = summary[column].diff()
+
+    # (periode, kategori): total semua tipe, seperti get_category_summary
+    totals = sums.sum(axis=2)
+    category_counts = counts.sum(axis=2)
+    present = np.flatnonzero(category_counts.sum(axis=0))
+    totals, category_counts = totals[:, present], category_counts[:, present]
+
+    previous = np.vstack([np.full((1, len(present)), np.nan), totals[:-1]])
+    categories = pd.DataFrame({
+        'Kategori': np.tile(np.asarray(ledger.category_dtype.categories, dtype=object)[present], len(periods)),
+        'Periode': pd.Categorical(
+            np.repeat(periods['Periode'].to_numpy(), len(present)), categories=periods['Periode'], ordered=True
+        ),
+        'Total': totals.ravel(),
+        'Jumlah Transaksi': category_counts.ravel(),
+        'Perubahan': (totals - previous).ravel(),
+        'Perubahan (%)': _change(totals, previous).ravel(),
+    })
+
+    return {'summary': summary, 'categories': categories}
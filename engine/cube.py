@@ -0,0 +1,235 @@
+"""
+Rollup cube: agregat per (hari, Kategori, Tipe)
+
+Cube menyimpan sum, count, min, max dan m2 (jumlah kuadrat deviasi, untuk
+variance) Jumlah per sel (hari, Kategori, Tipe), dibangun sekali per versi
+dataset dan di-update saat append. Ribuan sel menggantikan jutaan baris untuk
+summary, kategori, bulanan, harian, statistik dan pivot kategori x bulan.
+Kolom sel bernama sama dengan kolom dataset (Tanggal, Kategori, Tipe),
+sehingga filter expression yang hanya memakai kolom tersebut bisa dievaluasi
+langsung pada sel.
+"""
+
+import numpy as np
+import pandas as pd
+
+from engine.bincount import group_codes
+from engine.expressions import EvalContext
+
+CUBE_COLUMNS = ('Tanggal', 'Kategori', 'Tipe')
+
+CELL_AGGREGATES = ('sum', 'count', 'min', 'max', 'm2')
+
+
+def encode_cells(df):
+    """
+    Key integer sel (hari, Kategori, Tipe) per baris
+
+    Returns:
+        Tuple (key, decode); key urut sama dengan (hari, Kategori, Tipe), dan
+        decode(key) mengembalikan dict kolom Tanggal, Kategori, Tipe
+    """
+    tanggal = df['Tanggal']
+    days = tanggal.to_numpy().astype('datetime64[D]').astype(np.int64)
+    first_day = days.min() if len(days) else 0
+    category_codes, decode_category = group_codes(df['Kategori'])
+    type_codes, decode_type = group_codes(df['Tipe'])
+
+    n_categories = int(category_codes.max()) + 1 if len(category_codes) else 1
+    n_types = int(type_codes.max()) + 1 if len(type_codes) else 1
+    key = ((days - first_day) * n_categories + category_codes) * n_types + type_codes
+
+    def decode(key):
+        cell_days = (key // (n_categories * n_types) + first_day).astype('datetime64[D]')
+        return {
+            'Tanggal': pd.Series(cell_days).astype(tanggal.dtype).to_numpy(),
+            'Kategori': decode_category(key // n_types % n_categories),
+            'Tipe': decode_type(key % n_types),
+        }
+
+    return key, decode
+
+
+def build_cells(df):
+    """
+    Hitung sel cube dari baris transaksi (satu groupby)
+
+    Hari, Kategori dan Tipe digabung menjadi satu key integer sehingga groupby
+    hanya meng-hash satu kolom.
+
+    Returns:
+        DataFrame berisi Tanggal (hari), Kategori, Tipe, sum, count, min, max, m2;
+        urut per hari. m2 adalah jumlah kuadrat deviasi terhadap rata-rata sel
+    """
+    key, decode = encode_cells(df)
+    cells = df['Jumlah'].groupby(key, sort=True).agg(['sum', 'count', 'min', 'max', 'var'])
+    cells['m2'] = (cells.pop('var') * (cells['count'] - 1)).fillna(0.0)
+
+    for position, (column, values) in enumerate(decode(cells.index.to_numpy()).items()):
+        cells.insert(position, column, values)
+    return cells.reset_index(drop=True)
+
+
+def combine_cells(cells, keys):
+    """
+    Gabungkan sel per keys (sum/count dijumlahkan, min/max, m2 dengan rumus Chan)
+
+    Args:
+        cells: DataFrame sel (format build_cells)
+        keys: List kolom pengelompokan (kosong = satu grup total)
+
+    Returns:
+        DataFrame agregat per keys dengan kolom sum, count, min, max, m2
+    """
+    grouped = cells.groupby(keys, observed=True, sort=True) if keys else None
+    total = (lambda col: grouped[col].transform('sum')) if keys else (lambda col: cells[col].sum())
+
+    # m2 gabungan = sum(m2_i) + sum(n_i * (mean_i - mean)^2)
+    mean = cells['sum'] / cells['count']
+    group_mean = total('sum') / total('count')
+    spread = cells['m2'] + cells['count'] * (mean - group_mean) ** 2
+
+    if not keys:
+        return pd.DataFrame({
+            'sum': [cells['sum'].sum()],
+            'count': [cells['count'].sum()],
+            'min': [cells['min'].min()],
+            'max': [cells['max'].max()],
+            'm2': [spread.sum()],
+        })
+
+    combined = grouped.agg({'sum': 'sum', 'count': 'sum', 'min': 'min', 'max': 'max'})
+    combined['m2'] = spread.groupby([cells[key] for key in keys], observed=True, sort=True).sum()
+    return combined
+
+
+def merge_cells(left, right):
+    """Gabungkan dua kumpulan sel (sel yang sama digabung dengan combine_cells)"""
+    combined = pd.concat([left, right], ignore_index=True)
+    return combine_cells(combined, list(CUBE_COLUMNS)).reset_index()
+
+
+class RollupCube:
+    """
+    Cube sum/count/min/max/m2 per (hari, Kategori, Tipe)
+
+    Jika ada Tanggal dengan komponen jam, sel per hari tidak bisa menjawab batas
+    tanggal yang presisi, sehingga expression dengan predikat Tanggal tidak
+    dijawab dari cube (lihat answers).
+    """
+
+    def __init__(self, df):
+        self.cells = build_cells(df)
+        self.day_aligned = bool((df['Tanggal'] == df['Tanggal'].dt.normalize()).all())
+
+    def append(self, new_rows, data):
+        """Gabungkan baris baru; hanya sel mulai hari pertama baris baru yang dihitung ulang"""
+        new_cells = build_cells(new_rows)
+        first_day = new_cells['Tanggal'].min()
+
+        overlap = self.cells['Tanggal'] >= first_day
+        self.cells = pd.concat(
+            [self.cells[~overlap], merge_cells(self.cells[overlap], new_cells)],
+            ignore_index=True
+        )
+        self.day_aligned = self.day_aligned and bool(
+            (new_rows['Tanggal'] == new_rows['Tanggal'].dt.normalize()).all()
+        )
+
+    def answers(self, expr):
+        """True jika expression bisa dijawab dari sel cube"""
+        columns = expr.columns()
+        if not columns <= set(CUBE_COLUMNS):
+            return False
+        return self.day_aligned or 'Tanggal' not in columns
+
+    def query(self, expr):
+        """
+        Sel cube yang cocok dengan expression
+
+        Returns:
+            DataFrame sel (format build_cells)
+        """
+        return select_cells(self.cells, expr)
+
+
+def select_cells(table, expr):
+    """
+    Baris tabel per sel (urut Tanggal) yang cocok dengan expression
+
+    Batas tanggal dipotong dengan binary search, sisa predikat dievaluasi
+    langsung pada kolom Tanggal, Kategori dan Tipe tabel.
+    """
+    days = table['Tanggal'].to_numpy()
+    start, end = expr.date_bounds()
+    lo = 0 if start is None else int(np.searchsorted(days, start.to_datetime64(), side='left'))
+    hi = len(days) if end is None else int(np.searchsorted(days, end.to_datetime64(), side='right'))
+
+    rows = table.iloc[lo:max(lo, hi)]
+    mask = expr.mask(EvalContext(rows, window=(start, end)))
+    return rows if mask is None else rows[mask]
+
+
+def cube_summary_partial(cells):
+    """Agregat parsial calculate_summary dari sel cube"""
+    tipe = cells['Tipe']
+    return {
+        'total_income': cells['sum'][tipe == 'Kredit'].sum(),
+        'total_expense': cells['sum'][tipe == 'Debit'].sum(),
+        'transaction_count': int(cells['count'].sum()),
+    }
+
+
+def cube_category_partial(cells):
+    """Agregat parsial (sum, count) per kategori dari sel cube"""
+    return cells[['sum', 'count']].groupby(cells['Kategori'], observed=True).sum()
+
+
+def cube_monthly_partial(cells):
+    """Agregat parsial income dan expense per bulan dari sel cube"""
+    bulan = cells['Tanggal'].dt.to_period('M').rename('Bulan')
+    tipe = cells['Tipe']
+    is_income = tipe == 'Kredit'
+    is_expense = tipe == 'Debit'
+
+    monthly_income = cells['sum'][is_income].groupby(bulan[is_income]).sum().rename('Jumlah')
+    monthly_expense = cells['sum'][is_expense].groupby(bulan[is_expense]).sum().rename('Jumlah')
+    return monthly_income, monthly_expense
+
+
+def cube_statistics(cells):
+    """
+    Statistik Jumlah (mean, max, min, std) dari sel cube
+
+    Median tidak bisa dihitung dari sel dan tidak termasuk di hasil.
+    """
+    if cells.empty:
+        return {'mean': np.nan, 'max': np.nan, 'min': np.nan, 'std': np.nan}
+
+    total = combine_cells(cells, []).iloc[0]
+    count = total['count']
+
+    return {
+        'mean': total['sum'] / count,
+        'max': cells['max'].max(),
+        'min': cells['min'].min(),
+        'std': np.sqrt(total['m2'] / (count - 1)) if count > 1 else np.nan,
+    }
+
+
+def cube_daily_partial(cells):
+    """Agregat parsial jumlah transaksi per hari dari sel cube"""
+    tanggal = cells['Tanggal']
+    return cells['count'].groupby(tanggal.dt.date.rename('Tanggal')).sum().rename(None)
+
+
+def cube_category_month_pivot(cells):
+    """Pivot total Jumlah per Kategori x Bulan dari sel cube"""
+    return cells.assign(Bulan=cells['Tanggal'].dt.to_period('M').astype(str)).pivot_table(
+        values='sum',
+        index='Kategori',
+        columns='Bulan',
+        aggfunc='sum',
+        fill_value=0,
+        observed=True
+    )
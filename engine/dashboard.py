@@ -0,0 +1,98 @@
+"""
+Agregasi Dashboard dalam satu pass
+
+Semua angka Dashboard (summary, pengeluaran per kategori, trend bulanan,
+statistik dan top transaksi) diturunkan dari satu groupby per (hari, Kategori,
+Tipe), yaitu sel yang sama dengan rollup cube. Jika sel cube untuk filter
+tersedia, groupby dilewati. Hanya top transaksi (dan median, jika tidak ada
+quantile sketch) yang membaca baris, dari kolom Jumlah dan Tipe yang dibaca
+sekali.
+"""
+
+import numpy as np
+
+from engine.aggregates import (
+    finalize_category_summary, finalize_monthly_summary, finalize_summary
+)
+from engine.cube import (
+    build_cells, cube_category_partial, cube_monthly_partial, cube_statistics,
+    cube_summary_partial
+)
+from engine.views import DataView
+
+
+def _take_rows(df, positions):
+    """Baris df pada posisi relatif (DataView atau DataFrame)"""
+    if isinstance(df, DataView):
+        return df.take(positions).to_frame()
+    return df.iloc[positions]
+
+
+def top_rows(df, amounts, selected, n):
+    """
+    N baris terbesar di antara baris terpilih (setara nlargest(n, 'Jumlah'))
+
+    Nilai ambang dicari dengan np.partition, lalu hanya kandidat >= ambang yang
+    diurutkan (stabil, sehingga nilai sama mengikuti urutan baris seperti
+    keep='first').
+
+    Args:
+        df: DataFrame atau DataView sumber baris
+        amounts: Array Jumlah
+        selected: Boolean array baris yang ikut (mis. Tipe == 'Debit')
+        n: Jumlah baris
+
+    Returns:
+        DataFrame berisi n baris terbesar
+    """
+    positions = np.flatnonzero(selected)
+    values = amounts[positions]
+    if len(values) > n > 0:
+        threshold = np.partition(values, len(values) - n)[len(values) - n]
+        candidates = values >= threshold
+        positions, values = positions[candidates], values[candidates]
+
+    order = np.argsort(-values, kind='stable')[:n]
+    return _take_rows(df, positions[order])
+
+
+def dashboard_aggregates(df, cells=None, sketch=None, top_n=5):
+    """
+    Hitung semua agregat Dashboard
+
+    Args:
+        df: DataFrame atau DataView transaksi yang sudah difilter
+        cells: Sel cube untuk filter yang sama (optional); jika None, sel dihitung
+            dari df dengan satu groupby
+        sketch: Quantile sketch Jumlah untuk filter yang sama (optional); jika
+            None, median dihitung exact dari baris
+        top_n: Jumlah top transaksi per tipe
+
+    Returns:
+        Dictionary berisi summary, category_summary (pengeluaran/Debit per
+        kategori), monthly_summary, statistics dan top_transactions
+        ({'Debit': DataFrame, 'Kredit': DataFrame})
+    """
+    if cells is None:
+        cells = build_cells(df)
+
+    amounts = df['Jumlah'].to_numpy()
+    types = df['Tipe']
+
+    statistics = cube_statistics(cells)
+    if sketch is not None:
+        statistics['median'] = sketch.quantile(0.5)
+    else:
+        statistics['median'] = float(np.median(amounts)) if len(amounts) else np.nan
+
+    return {
+        'summary': finalize_summary(cube_summary_partial(cells)),
+        'category_summary': finalize_category_summary(
+            cube_category_partial(cells[cells['Tipe'] == 'Debit'])
+        ),
+        'monthly_summary': finalize_monthly_summary(cube_monthly_partial(cells)),
+        'statistics': {key: statistics[key] for key in ('mean', 'median', 'max', 'min', 'std')},
+        'top_transactions': {
+            tipe: top_rows(df, amounts, (types == tipe).to_numpy(), top_n) for tipe in ('Debit', 'Kredit')
+        },
+    }
@@ -0,0 +1,455 @@
+"""
+Filter expression yang bisa dikomposisi
+
+Predikat pada tanggal, kategori, tipe, jumlah, deskripsi dan saldo digabung
+dengan & (and), | (or) dan ~ (not):
+
+    expr = date_between(start, end) & category_in(['Belanja']) & ~type_in(['Kredit'])
+
+Expression dikompilasi menjadi satu boolean mask yang dievaluasi langsung atas
+array kolom (tanpa DataFrame perantara), atau menjadi klausa WHERE berparameter
+untuk backend SQL. Seperti utils.filter_data, argumen kosong berarti tanpa
+filter; predikat tanpa filter menghasilkan mask None (semua baris cocok).
+"""
+
+import numpy as np
+import pandas as pd
+
+from config import CATEGORIES, TRANSACTION_TYPES
+from engine.result_cache import normalize_values
+
+SQL_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+_KNOWN_VALUES = {'Kategori': CATEGORIES, 'Tipe': TRANSACTION_TYPES}
+
+# Rentang dijawab dari index jika baris yang cocok paling banyak 1/16 baris frame
+_INDEX_SELECTIVITY = 16
+
+
+def _timestamp(value):
+    """Normalisasi tanggal menjadi pd.Timestamp (None jika kosong)"""
+    return pd.to_datetime(value) if value else None
+
+
+class EvalContext:
+    """
+    Sumber kolom untuk evaluasi mask
+
+    Args:
+        frame: DataFrame (atau slice dataset) yang dievaluasi
+        bitmap: BitmapIndex dataset opsional, dipakai untuk kategori/tipe
+        offset: Posisi baris pertama frame di dataset (untuk memotong bitmap)
+        window: Tuple (start, end) yang pasti memuat semua Tanggal di frame
+        describe: Callable (query, mode, max_distance) -> list nilai Deskripsi
+            yang cocok; default membangun DescriptionIndex dari frame
+        search: DescriptionIndex dataset opsional; pencarian Deskripsi dijawab
+            dari posting list baris index (dipotong dengan offset)
+        amounts: AmountIndex dataset opsional; rentang Jumlah yang selektif
+            dijawab dengan binary search pada index (dipotong dengan offset)
+    """
+
+    def __init__(self, frame, bitmap=None, offset=0, window=(None, None), describe=None, search=None,
+                 amounts=None):
+        self.frame = frame
+        self.n = len(frame)
+        self.bitmap = bitmap
+        self.offset = offset
+        self.window = window
+        self._describe = describe
+        self.search = search
+        self.amounts = amounts
+
+    def column(self, name):
+        """Array numpy kolom"""
+        return self.frame[name].to_numpy()
+
+    def values_mask(self, column, values):
+        """Mask isin untuk kolom categorical (None jika semua nilai dipilih)"""
+        if self.bitmap is not None:
+            mask = self.bitmap.mask(column, values)
+            return None if mask is None else mask[self.offset:self.offset + self.n]
+        return self.frame[column].isin(values).to_numpy()
+
+    def _rows_mask(self, rows):
+        """Mask frame dari posisi baris dataset yang terurut"""
+        lo, hi = np.searchsorted(rows, [self.offset, self.offset + self.n])
+        mask = np.zeros(self.n, dtype=bool)
+        mask[rows[lo:hi] - self.offset] = True
+        return mask
+
+    def range_mask(self, column, low, high):
+        """
+        Mask low <= kolom <= high (None = tanpa batas)
+
+        Dengan AmountIndex, rentang Jumlah yang selektif diambil dari index
+        (biaya sebanding jumlah baris yang cocok); rentang yang lebar lebih murah
+        dibandingkan langsung pada kolom.
+        """
+        if column == 'Jumlah' and self.amounts is not None:
+            if self.amounts.count(low, high) * _INDEX_SELECTIVITY <= self.n:
+                return self._rows_mask(self.amounts.rows(low, high))
+
+        values = self.column(column)
+        result = None
+        if low is not None:
+            result = values >= low
+        if high is not None:
+            upper = values <= high
+            result = upper if result is None else np.logical_and(result, upper, out=result)
+        return result
+
+    def description_labels(self, query, mode, max_distance):
+        """Nilai Deskripsi yang cocok dengan query pencarian"""
+        if self._describe is None:
+            from engine.search import DescriptionIndex
+            self._describe = DescriptionIndex(self.frame).matching_labels
+        return self._describe(query, mode, max_distance)
+
+    def description_mask(self, query, mode, max_distance):
+        """Mask baris yang Deskripsi-nya cocok dengan query pencarian"""
+        if self.search is None:
+            labels = self.description_labels(query, mode, max_distance)
+            return self.frame['Deskripsi'].isin(labels).to_numpy()
+
+        return self._rows_mask(self.search.search(query, mode, max_distance))
+
+
+class Expr:
+    """Base class filter expression"""
+
+    def __and__(self, other):
+        return And(self, other)
+
+    def __or__(self, other):
+        return Or(self, other)
+
+    def __invert__(self):
+        return Not(self)
+
+    def key(self):
+        """Bentuk kanonik yang hashable (untuk cache)"""
+        raise NotImplementedError
+
+    def date_bounds(self):
+        """Tuple (start, end) yang pasti memuat semua baris yang cocok"""
+        return None, None
+
+    def columns(self):
+        """Set kolom yang dipakai predikat (kosong jika tanpa filter)"""
+        raise NotImplementedError
+
+    def mask(self, ctx):
+        """Boolean array untuk ctx.frame, atau None jika semua baris cocok"""
+        raise NotImplementedError
+
+    def to_sql(self, describe=None):
+        """
+        Klausa SQL berparameter
+
+        Returns:
+            Tuple (sql, params); sql kosong jika semua baris cocok
+        """
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"{type(self).__name__}{self.key()!r}"
+
+
+class DateRange(Expr):
+    """start <= Tanggal <= end"""
+
+    def __init__(self, start=None, end=None):
+        self.start = _timestamp(start)
+        self.end = _timestamp(end)
+
+    def key(self):
+        return ('Tanggal', self.start, self.end)
+
+    def columns(self):
+        return set() if self.start is None and self.end is None else {'Tanggal'}
+
+    def date_bounds(self):
+        return self.start, self.end
+
+    def mask(self, ctx):
+        window_start, window_end = ctx.window
+        covers_start = self.start is None or (window_start is not None and window_start >= self.start)
+        covers_end = self.end is None or (window_end is not None and window_end <= self.end)
+        if covers_start and covers_end:
+            return None
+
+        dates = ctx.column('Tanggal')
+        result = None
+        if self.start is not None:
+            result = dates >= self.start.to_datetime64()
+        if self.end is not None:
+            upper = dates <= self.end.to_datetime64()
+            result = upper if result is None else np.logical_and(result, upper, out=result)
+        return result
+
+    def to_sql(self, describe=None):
+        conditions, params = [], []
+        if self.start is not None:
+            conditions.append("Tanggal >= ?")
+            params.append(self.start.strftime(SQL_DATETIME_FORMAT))
+        if self.end is not None:
+            conditions.append("Tanggal <= ?")
+            params.append(self.end.strftime(SQL_DATETIME_FORMAT))
+        return " AND ".join(conditions), params
+
+
+class ValuesIn(Expr):
+    """Kolom categorical (Kategori/Tipe) di dalam values"""
+
+    def __init__(self, column, values):
+        self.column = column
+        self.values = normalize_values(values, _KNOWN_VALUES[column])
+
+    def key(self):
+        return (self.column, self.values)
+
+    def columns(self):
+        return set() if self.values is None else {self.column}
+
+    def mask(self, ctx):
+        if self.values is None:
+            return None
+        return ctx.values_mask(self.column, list(self.values))
+
+    def to_sql(self, describe=None):
+        if self.values is None:
+            return "", []
+        if not self.values:
+            return "0 = 1", []
+        return f"{self.column} IN ({', '.join('?' * len(self.values))})", list(self.values)
+
+
+class Between(Expr):
+    """low <= kolom <= high untuk kolom numerik (Jumlah/Saldo)"""
+
+    def __init__(self, column, low=None, high=None):
+        self.column = column
+        self.low = low
+        self.high = high
+
+    def key(self):
+        return (self.column, self.low, self.high)
+
+    def columns(self):
+        return set() if self.low is None and self.high is None else {self.column}
+
+    def mask(self, ctx):
+        if self.low is None and self.high is None:
+            return None
+        return ctx.range_mask(self.column, self.low, self.high)
+
+    def to_sql(self, describe=None):
+        conditions, params = [], []
+        if self.low is not None:
+            conditions.append(f"{self.column} >= ?")
+            params.append(self.low)
+        if self.high is not None:
+            conditions.append(f"{self.column} <= ?")
+            params.append(self.high)
+        return " AND ".join(conditions), params
+
+
+class DescriptionMatch(Expr):
+    """
+    Deskripsi cocok dengan query pencarian
+
+    Query dicocokkan dengan nilai Deskripsi unik lewat index pencarian. Dengan
+    index dataset, mask dibangun dari posting list baris kode yang cocok (hanya
+    baris slice); tanpa index, nilai yang cocok menjadi predikat isin.
+    """
+
+    def __init__(self, query, mode='substring', max_distance=None):
+        self.query = query.lower().strip() if query else ''
+        self.mode = mode
+        self.max_distance = max_distance
+
+    def key(self):
+        return ('Deskripsi', self.mode, self.query, self.max_distance)
+
+    def columns(self):
+        return {'Deskripsi'} if self.query else set()
+
+    def mask(self, ctx):
+        if not self.query:
+            return None
+        return ctx.description_mask(self.query, self.mode, self.max_distance)
+
+    def to_sql(self, describe=None):
+        if not self.query:
+            return "", []
+        labels = describe(self.query, self.mode, self.max_distance)
+        if not labels:
+            return "0 = 1", []
+        return f"Deskripsi IN ({', '.join('?' * len(labels))})", list(labels)
+
+
+class And(Expr):
+    """Semua child expression cocok"""
+
+    def __init__(self, *children):
+        self.children = children
+
+    def key(self):
+        return ('and', frozenset(child.key() for child in self.children))
+
+    def columns(self):
+        return set().union(*(child.columns() for child in self.children))
+
+    def date_bounds(self):
+        start, end = None, None
+        for child in self.children:
+            child_start, child_end = child.date_bounds()
+            if child_start is not None and (start is None or child_start > start):
+                start = child_start
+            if child_end is not None and (end is None or child_end < end):
+                end = child_end
+        return start, end
+
+    def mask(self, ctx):
+        result = None
+        owned = False
+
+        for child in self.children:
+            mask = child.mask(ctx)
+            if mask is None:
+                continue
+            if result is None:
+                result = mask
+            elif owned:
+                np.logical_and(result, mask, out=result)
+            else:
+                result = result & mask
+                owned = True
+
+        return result
+
+    def to_sql(self, describe=None):
+        conditions, params = [], []
+        for child in self.children:
+            sql, child_params = child.to_sql(describe)
+            if sql:
+                conditions.append(f"({sql})")
+                params.extend(child_params)
+        return " AND ".join(conditions), params
+
+
+class Or(Expr):
+    """Minimal satu child expression cocok"""
+
+    def __init__(self, *children):
+        self.children = children
+
+    def key(self):
+        return ('or', frozenset(child.key() for child in self.children))
+
+    def columns(self):
+        return set().union(*(child.columns() for child in self.children))
+
+    def date_bounds(self):
+        bounds = [child.date_bounds() for child in self.children]
+        if not bounds or any(start is None for start, _ in bounds):
+            start = None
+        else:
+            start = min(start for start, _ in bounds)
+        if not bounds or any(end is None for _, end in bounds):
+            end = None
+        else:
+            end = max(end for _, end in bounds)
+        return start, end
+
+    def mask(self, ctx):
+        if not self.children:
+            return np.zeros(ctx.n, dtype=bool)
+
+        result = None
+        owned = False
+
+        for child in self.children:
+            mask = child.mask(ctx)
+            if mask is None:
+                return None
+            if result is None:
+                result = mask
+            elif owned:
+                np.logical_or(result, mask, out=result)
+            else:
+                result = result | mask
+                owned = True
+
+        return result
+
+    def to_sql(self, describe=None):
+        if not self.children:
+            return "0 = 1", []
+
+        conditions, params = [], []
+        for child in self.children:
+            sql, child_params = child.to_sql(describe)
+            if not sql:
+                return "", []
+            conditions.append(f"({sql})")
+            params.extend(child_params)
+        return " OR ".join(conditions), params
+
+
+class Not(Expr):
+    """Child expression tidak cocok"""
+
+    def __init__(self, child):
+        self.child = child
+
+    def key(self):
+        return ('not', self.child.key())
+
+    def columns(self):
+        return self.child.columns()
+
+    def mask(self, ctx):
+        mask = self.child.mask(ctx)
+        return np.zeros(ctx.n, dtype=bool) if mask is None else ~mask
+
+    def to_sql(self, describe=None):
+        sql, params = self.child.to_sql(describe)
+        if not sql:
+            return "0 = 1", []
+        return f"NOT ({sql})", params
+
+
+def date_between(start=None, end=None):
+    """Predikat start <= Tanggal <= end"""
+    return DateRange(start, end)
+
+
+def category_in(categories):
+    """Predikat Kategori di dalam categories (kosong = tanpa filter)"""
+    return ValuesIn('Kategori', categories)
+
+
+def type_in(transaction_types):
+    """Predikat Tipe di dalam transaction_types (kosong = tanpa filter)"""
+    return ValuesIn('Tipe', transaction_types)
+
+
+def amount_between(low=None, high=None):
+    """Predikat low <= Jumlah <= high"""
+    return Between('Jumlah', low, high)
+
+
+def balance_between(low=None, high=None):
+    """Predikat low <= Saldo <= high"""
+    return Between('Saldo', low, high)
+
+
+def description_matches(query, mode='substring', max_distance=None):
+    """Predikat pencarian Deskripsi ('substring', 'word' atau 'fuzzy')"""
+    return DescriptionMatch(query, mode, max_distance)
+
+
+def filter_expression(start_date=None, end_date=None, categories=None, transaction_types=None):
+    """Expression yang setara dengan argumen utils.filter_data"""
+    return And(date_between(start_date, end_date), category_in(categories), type_in(transaction_types))
@@ -0,0 +1,241 @@
+"""
+Index posisi baris yang dibangun sekali per versi dataset
+
+Index hanya boleh dipakai untuk DataFrame dataset itu sendiri (bukan hasil
+filter/sort), lihat DatasetCache.is_cached.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class BitmapIndex:
+    """
+    Bitmap (boolean mask) per nilai Kategori dan Tipe
+
+    Kombinasi filter kategori/tipe menjadi beberapa operasi OR/AND vektor pada
+    mask yang sudah dihitung. Jika lebih dari separuh nilai dipilih, mask dibentuk
+    dari komplemen nilai yang tidak dipilih, sehingga biaya filter tidak pernah
+    lebih dari separuh jumlah nilai unik, berapa pun kategori yang dipilih.
+    """
+
+    COLUMNS = ('Kategori', 'Tipe')
+
+    def __init__(self, df):
+        self.n = len(df)
+        self._capacity = self.n
+        self.masks = {col: self._build_masks(df[col]) for col in self.COLUMNS}
+
+    @staticmethod
+    def _build_masks(series):
+        """Bangun satu mask per kategori dari kode categorical"""
+        codes = series.cat.codes.to_numpy()
+        return {
+            str(value): codes == code
+            for code, value in enumerate(series.cat.categories)
+        }
+
+    def _reserve(self, n):
+        """Pastikan kapasitas mask minimal n baris (tumbuh 2x, amortized O(1) per baris)"""
+        if n <= self._capacity:
+            return
+        self._capacity = max(n, 2 * self._capacity)
+        for masks in self.masks.values():
+            for value, mask in masks.items():
+                grown = np.zeros(self._capacity, dtype=bool)
+                grown[:self.n] = mask[:self.n]
+                masks[value] = grown
+
+    def append(self, new_rows, data):
+        """Tulis mask baris baru ke kapasitas sisa, tanpa menyalin mask lama"""
+        n = self.n + len(new_rows)
+        self._reserve(n)
+        for col in self.COLUMNS:
+            masks = self.masks[col]
+            codes = new_rows[col].cat.codes.to_numpy()
+            for code, value in enumerate(new_rows[col].cat.categories):
+                mask = masks.setdefault(str(value), np.zeros(self._capacity, dtype=bool))
+                mask[self.n:n] = codes == code
+        self.n = n
+
+    def mask(self, column, values):
+        """
+        Mask baris dengan nilai kolom di dalam values (setara isin)
+
+        Args:
+            column: 'Kategori' atau 'Tipe'
+            values: List nilai yang dipilih
+
+        Returns:
+            Boolean array, atau None jika semua nilai dipilih (tanpa filter)
+        """
+        masks = self.masks[column]
+        selected = {str(value) for value in values} & set(masks)
+
+        if len(selected) == len(masks):
+            return None
+        if not selected:
+            return np.zeros(self.n, dtype=bool)
+
+        if len(selected) <= len(masks) / 2:
+            result = np.zeros(self.n, dtype=bool)
+            for value in selected:
+                result |= masks[value][:self.n]
+            return result
+
+        result = np.zeros(self.n, dtype=bool)
+        for value in set(masks) - selected:
+            result |= masks[value][:self.n]
+        return ~result
+
+
+class DateIndex:
+    """
+    Index tanggal untuk dataset yang urut berdasarkan Tanggal
+
+    Rentang tanggal dijawab dengan dua binary search (searchsorted) dan
+    menghasilkan rentang posisi [start, stop) untuk slice tanpa copy.
+    """
+
+    def __init__(self, df):
+        self.values = df['Tanggal'].to_numpy()
+
+        if len(self.values) > 1 and (self.values[1:] < self.values[:-1]).any():
+            raise ValueError("DateIndex membutuhkan dataset yang urut berdasarkan Tanggal")
+
+    def append(self, new_rows, data):
+        """Pakai kolom Tanggal dataset baru (baris baru selalu di akhir)"""
+        self.values = data['Tanggal'].to_numpy()
+
+    def slice(self, start_date=None, end_date=None):
+        """
+        Get rentang posisi baris dengan start_date <= Tanggal <= end_date
+
+        Returns:
+            Tuple (start, stop) posisi baris
+        """
+        start = 0
+        stop = len(self.values)
+
+        if start_date:
+            start = int(np.searchsorted(self.values, pd.to_datetime(start_date).to_datetime64(), side='left'))
+        if end_date:
+            stop = int(np.searchsorted(self.values, pd.to_datetime(end_date).to_datetime64(), side='right'))
+
+        return start, max(start, stop)
+
+
+class AmountIndex:
+    """
+    Index Jumlah terurut (argsort) untuk query rentang jumlah
+
+    Rentang [low, high] dijawab dengan binary search pada nilai yang sudah
+    diurutkan. Persentil dan histogram dihitung dari array terurut yang sama,
+    sehingga tidak pernah memindai data.
+
+    Seperti DescriptionIndex, nilai disimpan sebagai run terurut: append hanya
+    mengurutkan baris baru, dan run yang berdekatan digabung saat ukurannya
+    setara, sehingga jumlah run tetap O(log n). Query menjumlahkan hasil per run.
+    """
+
+    def __init__(self, df, bins=20):
+        self._runs = []
+        self._add_run(df['Jumlah'].to_numpy(), df.index.to_numpy(dtype=np.int64))
+        self.bins = bins
+
+    def _add_run(self, amounts, row_ids):
+        """Tambahkan run terurut untuk baris baru, lalu gabungkan run yang setara"""
+        order = np.argsort(amounts, kind='stable')
+        self._runs.append((amounts[order], row_ids[order]))
+
+        while len(self._runs) > 1 and len(self._runs[-2][0]) <= len(self._runs[-1][0]):
+            (values_a, rows_a), (values_b, rows_b) = self._runs.pop(-2), self._runs.pop()
+            values = np.concatenate([values_a, values_b])
+            merged = np.argsort(values, kind='stable')
+            self._runs.append((values[merged], np.concatenate([rows_a, rows_b])[merged]))
+
+    def append(self, new_rows, data):
+        """Urutkan baris baru sebagai run sendiri (tanpa menyalin run lama)"""
+        self._add_run(new_rows['Jumlah'].to_numpy(), new_rows.index.to_numpy(dtype=np.int64))
+
+    def __len__(self):
+        return sum(len(values) for values, _ in self._runs)
+
+    @property
+    def min(self):
+        return min((values[0] for values, _ in self._runs if len(values)), default=0)
+
+    @property
+    def max(self):
+        return max((values[-1] for values, _ in self._runs if len(values)), default=0)
+
+    def _count_below(self, value, side):
+        """Jumlah baris dengan Jumlah < value (side='left') atau <= value (side='right')"""
+        return sum(int(np.searchsorted(values, value, side=side)) for values, _ in self._runs)
+
+    def _nth(self, position):
+        """Nilai ke-position (0-based) dalam urutan Jumlah semua run"""
+        if len(self._runs) == 1:
+            return self._runs[0][0][position]
+
+        # Binary search nilai terkecil dengan lebih dari position baris <= nilai
+        low, high = int(self.min), int(self.max)
+        while low < high:
+            middle = (low + high) // 2
+            if self._count_below(middle, 'right') > position:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def count(self, low=None, high=None):
+        """Jumlah baris dengan low <= Jumlah <= high"""
+        start = 0 if low is None else self._count_below(low, 'left')
+        stop = len(self) if high is None else self._count_below(high, 'right')
+        return max(0, stop - start)
+
+    def rows(self, low=None, high=None):
+        """
+        Row-id dengan low <= Jumlah <= high
+
+        Returns:
+            Array int64 row-id yang terurut
+        """
+        parts = []
+        for values, row_ids in self._runs:
+            start = 0 if low is None else int(np.searchsorted(values, low, side='left'))
+            stop = len(values) if high is None else int(np.searchsorted(values, high, side='right'))
+            parts.append(row_ids[start:max(start, stop)])
+        return np.sort(np.concatenate(parts))
+
+    def percentile(self, q):
+        """
+        Nilai persentil q (0-100), interpolasi linear seperti np.percentile
+        """
+        if not len(self):
+            return 0.0
+
+        position = (len(self) - 1) * q / 100
+        lower = int(np.floor(position))
+        upper = min(lower + 1, len(self) - 1)
+        fraction = position - lower
+        return float(self._nth(lower) * (1 - fraction) + self._nth(upper) * fraction)
+
+    def percentile_rank(self, value, inclusive=True):
+        """Persentase baris dengan Jumlah <= value (atau < value jika inclusive=False)"""
+        if not len(self):
+            return 0.0
+        side = 'right' if inclusive else 'left'
+        return 100 * self._count_below(value, side) / len(self)
+
+    def histogram(self):
+        """
+        Histogram Jumlah dengan bin lebar sama antara min dan max
+
+        Returns:
+            Tuple (counts, edges) seperti np.histogram
+        """
+        edges = np.linspace(float(self.min), float(self.max), self.bins + 1)
+        cumulative = sum(np.searchsorted(values, edges[1:-1], side='left') for values, _ in self._runs)
+        cumulative = np.concatenate([[0], cumulative, [len(self)]])
+        return np.diff(cumulative), edges
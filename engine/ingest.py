@@ -0,0 +1,203 @@
+"""
+Ingestion append-only untuk batch transaksi baru
+
+Batch baru ditambahkan di akhir CSV dengan Saldo yang melanjutkan saldo
+terakhir, lalu watermark (byte offset, jumlah baris, tanggal dan saldo
+terakhir) dicatat di file state. Dataset yang sudah di-cache hanya mem-parse
+baris baru (lihat DatasetCache), dan struktur turunan yang punya append()
+di-update di tempat.
+"""
+
+import argparse
+import csv
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from config import DATA_PATH, DATE_FORMAT, INGEST_STATE_PATH
+from engine.schema import apply_schema, validate_schema
+
+INPUT_COLUMNS = ['Tanggal', 'Kategori', 'Tipe', 'Jumlah', 'Deskripsi']
+
+_TAIL_BLOCK_SIZE = 64 * 1024
+
+
+def _parse_line(line):
+    """Parse satu baris CSV (Deskripsi ber-quote boleh memuat koma)"""
+    return next(csv.reader([line.rstrip('\r\n')]), [])
+
+
+def _read_header(data_path):
+    """Baca nama kolom dari baris pertama CSV"""
+    with open(data_path, 'rb') as f:
+        return _parse_line(f.readline().decode('utf-8'))
+
+
+def _read_last_line(data_path):
+    """Baca baris terakhir CSV tanpa membaca seluruh file"""
+    with open(data_path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - _TAIL_BLOCK_SIZE))
+        lines = f.read().rstrip(b'\n').split(b'\n')
+    return lines[-1].decode('utf-8')
+
+
+def _count_rows(data_path):
+    """Hitung jumlah baris data (tanpa header)"""
+    count = 0
+    with open(data_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            count += block.count(b'\n')
+    return max(0, count - 1)
+
+
+def bootstrap_state(data_path=DATA_PATH):
+    """
+    Bangun watermark dari file CSV yang ada
+
+    Dipakai saat state belum ada atau file diubah di luar ingestion.
+
+    Returns:
+        Dictionary state berisi offset, rows, last_date, last_saldo
+    """
+    header = _read_header(data_path)
+    rows = _count_rows(data_path)
+
+    state = {
+        'offset': os.path.getsize(data_path),
+        'rows': rows,
+        'last_date': None,
+        'last_saldo': 0,
+    }
+
+    if rows > 0:
+        last = dict(zip(header, _parse_line(_read_last_line(data_path))))
+        state['last_date'] = last['Tanggal']
+        state['last_saldo'] = int(last['Saldo'])
+
+    return state
+
+
+def read_state(data_path=DATA_PATH, state_path=INGEST_STATE_PATH):
+    """
+    Baca watermark ingestion, bootstrap ulang jika tidak cocok dengan file
+
+    Returns:
+        Dictionary state berisi offset, rows, last_date, last_saldo
+    """
+    if os.path.exists(state_path):
+        with open(state_path) as f:
+            state = json.load(f)
+        if state.get('offset') == os.path.getsize(data_path):
+            return state
+
+    return bootstrap_state(data_path)
+
+
+def write_state(state, state_path=INGEST_STATE_PATH):
+    """Tulis watermark ingestion secara atomik"""
+    tmp_path = f"{state_path}.tmp-{os.getpid()}"
+    with open(tmp_path, 'w') as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, state_path)
+
+
+def prepare_batch(batch, last_date=None, last_saldo=0):
+    """
+    Validasi batch dan hitung Saldo berjalan dari saldo terakhir
+
+    Args:
+        batch: DataFrame dengan kolom Tanggal, Kategori, Tipe, Jumlah, Deskripsi
+        last_date: Tanggal transaksi terakhir di dataset (optional)
+        last_saldo: Saldo setelah transaksi terakhir
+
+    Returns:
+        DataFrame bertipe dengan kolom Saldo, urut berdasarkan Tanggal
+
+    Raises:
+        ValueError jika batch tidak sesuai schema atau lebih lama dari data terakhir
+    """
+    missing = [col for col in INPUT_COLUMNS if col not in batch.columns]
+    if missing:
+        raise ValueError(f"Kolom batch tidak lengkap: {missing}")
+
+    batch = apply_schema(batch[INPUT_COLUMNS].copy())
+    validate_schema(batch)
+
+    batch = batch.sort_values('Tanggal', kind='stable').reset_index(drop=True)
+
+    if last_date is not None and len(batch) > 0 and batch['Tanggal'].iloc[0] < pd.to_datetime(last_date):
+        raise ValueError(
+            f"Batch berisi transaksi sebelum {last_date}; ingestion hanya mendukung append"
+        )
+
+    signed = np.where(batch['Tipe'] == 'Kredit', batch['Jumlah'], -batch['Jumlah'])
+    batch['Saldo'] = last_saldo + np.cumsum(signed, dtype='int64')
+
+    return batch
+
+
+def ingest_transactions(batch, data_path=DATA_PATH, state_path=INGEST_STATE_PATH):
+    """
+    Append batch transaksi baru ke dataset
+
+    Args:
+        batch: DataFrame transaksi baru (kolom Saldo diabaikan dan dihitung ulang)
+        data_path: Path CSV dataset
+        state_path: Path file watermark
+
+    Returns:
+        Dictionary state baru berisi offset, rows, last_date, last_saldo, appended
+    """
+    state = read_state(data_path, state_path)
+    batch = prepare_batch(batch, state['last_date'], state['last_saldo'])
+
+    if len(batch) == 0:
+        return dict(state, appended=0)
+
+    header = _read_header(data_path)
+    text = batch.to_csv(header=False, index=False, columns=header, date_format=DATE_FORMAT)
+
+    with open(data_path, 'rb+') as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                f.write(b'\n')
+        f.write(text.encode('utf-8'))
+
+    state = {
+        'offset': os.path.getsize(data_path),
+        'rows': state['rows'] + len(batch),
+        'last_date': batch['Tanggal'].iloc[-1].strftime(DATE_FORMAT),
+        'last_saldo': int(batch['Saldo'].iloc[-1]),
+    }
+    write_state(state, state_path)
+
+    # Refresh dataset yang sudah di-cache di proses ini (hanya baris baru yang di-parse)
+    from engine.cache import dataset_cache
+    if os.path.abspath(data_path) == os.path.abspath(DATA_PATH) and dataset_cache.version(DATA_PATH) is not None:
+        from utils import load_data
+        load_data()
+
+    return dict(state, appended=len(batch))
+
+
+def main():
+    """CLI untuk ingestion batch CSV"""
+    parser = argparse.ArgumentParser(description="Append batch transaksi baru ke dataset")
+    parser.add_argument('batch_path', help="Path CSV batch (Tanggal, Kategori, Tipe, Jumlah, Deskripsi)")
+    parser.add_argument('--data-path', default=DATA_PATH, help="Path CSV dataset")
+    parser.add_argument('--state-path', default=INGEST_STATE_PATH, help="Path file watermark")
+    args = parser.parse_args()
+
+    state = ingest_transactions(pd.read_csv(args.batch_path), args.data_path, args.state_path)
+    print(f"✅ {state['appended']} transaksi ditambahkan, total {state['rows']} transaksi")
+    print(f"💵 Saldo terakhir: {state['last_saldo']:,} ({state['last_date']})")
+
+
+if __name__ == "__main__":
+    main()
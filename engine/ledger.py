@@ -0,0 +1,268 @@
+"""
+Ledger harian prefix-sum untuk total jendela tanggal
+
+Ledger menyimpan jumlah kumulatif Jumlah dan count per hari untuk setiap
+kombinasi (Kategori, Tipe), di atas grid hari yang rapat dari hari pertama sampai
+hari terakhir dataset. Total untuk jendela [start, end] adalah selisih dua baris
+kumulatif: cum[hari_akhir + 1] - cum[hari_awal], tidak bergantung pada jumlah
+baris di dalam jendela. Pilihan kategori/tipe hanyalah mask atas kombinasi
+(Kategori, Tipe), dievaluasi dengan filter expression yang sama.
+
+Seperti rollup cube, ledger hanya menjawab expression yang berupa jendela
+tanggal AND predikat Kategori/Tipe, dan batas tanggal hanya presisi jika semua
+Tanggal tanpa komponen jam (lihat answers).
+"""
+
+import numpy as np
+import pandas as pd
+
+from engine.bincount import weighted_sums
+from engine.expressions import And, DateRange, EvalContext
+from engine.indexes import BitmapIndex
+
+_DAY_NS = 86_400 * 10 ** 9
+
+
+def _day_numbers(timestamps):
+    """Hari sejak epoch (int64) untuk array datetime64"""
+    return np.asarray(timestamps).astype('datetime64[D]').astype(np.int64)
+
+
+def _nanoseconds(timestamps):
+    """Array int64 nanodetik dan mask nilai yang ada (None/NaT = tanpa batas)"""
+    values = np.asarray(timestamps)
+    if values.dtype.kind != 'M':
+        values = np.array([np.datetime64('NaT') if value is None else value for value in values],
+                          dtype='datetime64[ns]')
+    values = values.astype('datetime64[ns]')
+    return values.view(np.int64), ~np.isnat(values)
+
+
+def _window_separable(expr):
+    """True jika expression = jendela tanggal AND predikat tanpa Tanggal"""
+    if isinstance(expr, And):
+        return all(_window_separable(child) for child in expr.children)
+    if isinstance(expr, DateRange):
+        return True
+    return expr.columns() <= {'Kategori', 'Tipe'}
+
+
+class DailyLedger:
+    """
+    Jumlah kumulatif per hari untuk setiap (Kategori, Tipe)
+
+    Kategori dan Tipe harus categorical (schema dataset), sehingga kode kombinasi
+    tetap sama saat append.
+
+    Attributes:
+        first_day: Hari pertama grid (hari sejak epoch)
+        sums: Array (hari + 1, kombinasi) jumlah kumulatif Jumlah; baris 0 = nol
+        counts: Array (hari + 1, kombinasi) count kumulatif
+        grid: DataFrame kombinasi (Kategori, Tipe), urut sama dengan kolom sums
+    """
+
+    def __init__(self, df):
+        self.category_dtype = df['Kategori'].dtype
+        self.type_dtype = df['Tipe'].dtype
+        n_categories = len(self.category_dtype.categories)
+        n_types = len(self.type_dtype.categories)
+
+        self.grid = pd.DataFrame({
+            'Kategori': pd.Categorical.from_codes(
+                np.repeat(np.arange(n_categories), n_types), dtype=self.category_dtype
+            ),
+            'Tipe': pd.Categorical.from_codes(np.tile(np.arange(n_types), n_categories), dtype=self.type_dtype),
+        })
+
+        days = _day_numbers(df['Tanggal'].to_numpy())
+        self.first_day = int(days.min()) if len(days) else 0
+        n_days = int(days.max()) - self.first_day + 1 if len(days) else 0
+
+        self.sums, self.counts = self._cumulative(df, n_days)
+        self._type_masks = {
+            tipe: (self.grid['Tipe'] == tipe).to_numpy() for tipe in self.type_dtype.categories
+        }
+        self._bitmap = BitmapIndex(self.grid)
+        self.day_aligned = bool((df['Tanggal'] == df['Tanggal'].dt.normalize()).all())
+
+    @property
+    def n_days(self):
+        return len(self.sums) - 1
+
+    def _cumulative(self, df, n_days):
+        """Array kumulatif (sums, counts) untuk baris df di atas grid hari ledger"""
+        width = len(self.grid)
+        days = _day_numbers(df['Tanggal'].to_numpy()) - self.first_day
+        combos = df['Kategori'].cat.codes.to_numpy(np.int64) * len(self.type_dtype.categories)
+        combos += df['Tipe'].cat.codes.to_numpy(np.int64)
+        key = days * width + combos
+
+        amounts = df['Jumlah'].to_numpy()
+        daily_sums = weighted_sums(key, amounts, n_days * width)
+        if daily_sums is None:
+            daily_sums = np.zeros(n_days * width, dtype=amounts.dtype)
+            np.add.at(daily_sums, key, amounts)
+        daily_counts = np.bincount(key, minlength=n_days * width)
+
+        sums = np.zeros((n_days + 1, width), dtype=daily_sums.dtype)
+        counts = np.zeros((n_days + 1, width), dtype=np.int64)
+        np.cumsum(daily_sums.reshape(n_days, width), axis=0, out=sums[1:])
+        np.cumsum(daily_counts.reshape(n_days, width), axis=0, out=counts[1:])
+        return sums, counts
+
+    def append(self, new_rows, data):
+        """Tambahkan baris baru ke kumulatif mulai hari pertama baris baru"""
+        days = _day_numbers(new_rows['Tanggal'].to_numpy())
+        if len(days) == 0:
+            return
+        if self.n_days == 0 or days.min() < self.first_day:
+            self.__init__(data)
+            return
+
+        n_days = max(self.n_days, int(days.max()) - self.first_day + 1)
+        if n_days > self.n_days:
+            extra = n_days - self.n_days
+            self.sums = np.concatenate([self.sums, np.repeat(self.sums[-1:], extra, axis=0)])
+            self.counts = np.concatenate([self.counts, np.repeat(self.counts[-1:], extra, axis=0)])
+
+        new_sums, new_counts = self._cumulative(new_rows, n_days)
+        self.sums += new_sums
+        self.counts += new_counts
+        self.day_aligned = self.day_aligned and bool(
+            (new_rows['Tanggal'] == new_rows['Tanggal'].dt.normalize()).all()
+        )
+
+    def answers(self, expr):
+        """True jika expression bisa dijawab dari ledger"""
+        if not _window_separable(expr):
+            return False
+        return self.day_aligned or 'Tanggal' not in expr.columns()
+
+    def _bounds(self, starts, ends):
+        """Baris kumulatif (lo, hi) untuk array batas jendela (None = tanpa batas)"""
+        start_ns, has_start = _nanoseconds(starts)
+        end_ns, has_end = _nanoseconds(ends)
+
+        # Hari pertama >= start (ceil) dan hari terakhir <= end (floor)
+        lo = np.where(has_start, -(-start_ns // _DAY_NS) - self.first_day, 0)
+        hi = np.where(has_end, end_ns // _DAY_NS - self.first_day + 1, self.n_days)
+
+        lo = np.clip(lo, 0, self.n_days)
+        hi = np.clip(hi, lo, self.n_days)
+        return lo, hi
+
+    def _combo_mask(self, expr, window=(None, None)):
+        """Mask kombinasi (Kategori, Tipe) untuk expression (None = semua)"""
+        if expr is None:
+            return None
+        return expr.mask(EvalContext(self.grid, bitmap=self._bitmap, window=window))
+
+    def _type_columns(self, mask, transaction_type):
+        """Kolom kombinasi untuk satu tipe transaksi (dan mask expression)"""
+        selected = self._type_masks[transaction_type]
+        return selected if mask is None else selected & mask
+
+    def window(self, expr):
+        """
+        Total per kombinasi (Kategori, Tipe) untuk expression
+
+        Returns:
+            Tuple (sums, counts, mask); mask None jika semua kombinasi ikut
+        """
+        start, end = expr.date_bounds()
+        lo, hi = self._bounds([start], [end])
+        sums = self.sums[hi[0]] - self.sums[lo[0]]
+        counts = self.counts[hi[0]] - self.counts[lo[0]]
+        return sums, counts, self._combo_mask(expr, (start, end))
+
+    def summary_partial(self, expr):
+        """Agregat parsial calculate_summary (format summary_partial)"""
+        sums, counts, mask = self.window(expr)
+        return {
+            'total_income': sums[self._type_columns(mask, 'Kredit')].sum(),
+            'total_expense': sums[self._type_columns(mask, 'Debit')].sum(),
+            'transaction_count': int(counts.sum() if mask is None else counts[mask].sum()),
+        }
+
+    def category_partial(self, expr):
+        """Agregat parsial (sum, count) per kategori (format category_partial)"""
+        sums, counts, mask = self.window(expr)
+        if mask is not None:
+            sums = np.where(mask, sums, 0)
+            counts = np.where(mask, counts, 0)
+
+        n_types = len(self.type_dtype.categories)
+        category_sums = sums.reshape(-1, n_types).sum(axis=1)
+        category_counts = counts.reshape(-1, n_types).sum(axis=1)
+        present = np.flatnonzero(category_counts)
+        return pd.DataFrame(
+            {'sum': category_sums[present], 'count': category_counts[present]},
+            index=pd.CategoricalIndex(
+                pd.Categorical.from_codes(present, dtype=self.category_dtype), name='Kategori'
+            )
+        )
+
+    def category_windows(self, starts, ends, expr=None):
+        """
+        Total per (jendela, Kategori, Tipe) untuk banyak jendela sekaligus
+
+        Args:
+            starts: Array tanggal awal jendela (inklusif; NaT = tanpa batas)
+            ends: Array tanggal akhir jendela (inklusif; NaT = tanpa batas)
+            expr: Expression view (optional, harus bisa dijawab ledger); setiap
+                jendela dipotong ke batas tanggal expression
+
+        Returns:
+            Tuple (sums, counts) berbentuk (jendela, kategori, tipe) mengikuti
+            urutan category_dtype dan type_dtype; kombinasi di luar expression nol
+        """
+        lo, hi = self._bounds(starts, ends)
+        window = (None, None) if expr is None else expr.date_bounds()
+        if window != (None, None):
+            bound_lo, bound_hi = self._bounds([window[0]], [window[1]])
+            lo = np.maximum(lo, bound_lo[0])
+            hi = np.maximum(np.minimum(hi, bound_hi[0]), lo)
+
+        sums = self.sums[hi] - self.sums[lo]
+        counts = self.counts[hi] - self.counts[lo]
+        mask = self._combo_mask(expr, window)
+        if mask is not None:
+            sums = np.where(mask, sums, 0)
+            counts = np.where(mask, counts, 0)
+
+        shape = (len(lo), len(self.category_dtype.categories), len(self.type_dtype.categories))
+        return sums.reshape(shape), counts.reshape(shape)
+
+    def window_totals(self, starts, ends, expr=None):
+        """
+        Total income, expense dan count untuk banyak jendela sekaligus
+
+        Args:
+            starts: Array tanggal awal jendela (inklusif; NaT = tanpa batas)
+            ends: Array tanggal akhir jendela (inklusif; NaT = tanpa batas)
+            expr: Expression Kategori/Tipe tambahan (optional, tanpa Tanggal)
+
+        Returns:
+            DataFrame per jendela berisi Mulai, Sampai, Income, Expense, Balance
+            dan Jumlah Transaksi
+        """
+        if expr is not None and 'Tanggal' in expr.columns():
+            raise ValueError("Expression window_totals tidak boleh memakai Tanggal")
+
+        lo, hi = self._bounds(starts, ends)
+        mask = self._combo_mask(expr)
+        sums = self.sums[hi] - self.sums[lo]
+        counts = self.counts[hi] - self.counts[lo]
+
+        income = sums[:, self._type_columns(mask, 'Kredit')].sum(axis=1)
+        expense = sums[:, self._type_columns(mask, 'Debit')].sum(axis=1)
+        count = counts.sum(axis=1) if mask is None else counts[:, mask].sum(axis=1)
+
+        return pd.DataFrame({
+            'Mulai': pd.DatetimeIndex(starts),
+            'Sampai': pd.DatetimeIndex(ends),
+            'Income': income,
+            'Expense': expense,
+            'Balance': income - expense,
+            'Jumlah Transaksi': count,
+        })
@@ -0,0 +1,134 @@
+"""
+Agregasi paralel per partisi bulan dengan process pool
+
+Baris dikelompokkan per bulan, lalu bulan-bulan yang berdekatan digabung menjadi
+satu partisi per worker dengan jumlah baris kira-kira sama. Setiap partisi hanya
+membawa kolom yang dibutuhkan agregat (Kategori/Tipe tetap categorical, jadi
+terkirim sebagai kode int8), dihitung menjadi agregat parsial di
+concurrent.futures.ProcessPoolExecutor, lalu digabung dengan fungsi merge dari
+engine.aggregates. Karena setiap bulan utuh berada di satu partisi, hasilnya
+identik dengan agregasi serial.
+
+Di bawah min_rows, atau dengan satu worker, agregat dihitung serial di proses
+ini: biaya mengirim baris ke worker lebih besar daripada agregasinya.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+
+import numpy as np
+
+from engine.views import as_frame
+
+# Pool dipakai ulang antar pemanggilan; start worker (spawn) hanya sekali
+_executor = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+def resolve_workers(workers):
+    """Jumlah worker efektif (None = semua core)"""
+    return max(1, os.cpu_count() or 1) if workers is None else max(1, int(workers))
+
+
+def get_executor(workers):
+    """
+    Process pool bersama dengan jumlah worker tertentu
+
+    Memakai start method spawn agar aman dipanggil dari proses dengan thread
+    (server Streamlit); pembuatan dan penggantian pool dijaga lock.
+    """
+    global _executor, _executor_workers
+
+    with _executor_lock:
+        if _executor is None or _executor_workers != workers:
+            _shutdown_locked()
+            _executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+            _executor_workers = workers
+        return _executor
+
+
+def _shutdown_locked():
+    """Hentikan process pool bersama; pemanggil memegang _executor_lock"""
+    global _executor, _executor_workers
+
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+    _executor = None
+    _executor_workers = 0
+
+
+def shutdown_executor():
+    """Hentikan process pool bersama (jika ada)"""
+    with _executor_lock:
+        _shutdown_locked()
+
+
+def month_partitions(df, columns, n_partitions):
+    """
+    Pecah baris menjadi partisi berisi bulan utuh dengan jumlah baris seimbang
+
+    Args:
+        df: DataFrame atau DataView transaksi
+        columns: Kolom yang dibawa setiap partisi (harus memuat Tanggal)
+        n_partitions: Jumlah partisi maksimum
+
+    Returns:
+        List DataFrame; partisi kosong tidak ikut
+    """
+    frame = as_frame(df, columns)
+    months = frame['Tanggal'].to_numpy().astype('datetime64[M]').astype(np.int64)
+
+    # Dataset biasanya sudah urut Tanggal; jika tidak, kelompokkan bulan dulu
+    if len(months) and np.any(months[1:] < months[:-1]):
+        order = np.argsort(months, kind='stable')
+        frame, months = frame.take(order), months[order]
+
+    # Batas partisi hanya boleh di awal bulan, dipilih paling dekat ke target baris
+    month_starts = np.flatnonzero(np.diff(months, prepend=months[:1] - 1)) if len(months) else np.array([0])
+    targets = np.arange(1, n_partitions) * len(frame) / n_partitions
+    cuts = month_starts[np.clip(np.searchsorted(month_starts, targets), 0, len(month_starts) - 1)]
+    bounds = np.unique(np.concatenate([[0], cuts, [len(frame)]]))
+
+    return [frame.iloc[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+
+
+def parallel_partial(df, partial, merge, columns, workers=None, min_rows=0):
+    """
+    Hitung agregat parsial secara paralel per partisi bulan
+
+    Args:
+        df: DataFrame atau DataView transaksi
+        partial: Fungsi agregat parsial level modul (harus bisa di-pickle)
+        merge: Fungsi penggabung dua agregat parsial
+        columns: Kolom yang dibutuhkan partial (harus memuat Tanggal)
+        workers: Jumlah worker process (None = semua core, 1 = serial)
+        min_rows: Di bawah jumlah baris ini agregat dihitung serial
+
+    Returns:
+        Agregat parsial gabungan (format sama dengan partial(df))
+    """
+    workers = resolve_workers(workers)
+    if workers == 1 or len(df) < min_rows:
+        return partial(df)
+
+    partitions = month_partitions(df, columns, workers)
+    if len(partitions) < 2:
+        return partial(df)
+
+    executor = None
+    try:
+        executor = get_executor(workers)
+        results = list(executor.map(partial, partitions))
+    except Exception:
+        # Pool gagal dibuat, worker mati (BrokenProcessPool) atau pool dihentikan
+        # thread lain (RuntimeError/CancelledError): buang pool dan hitung serial
+        with _executor_lock:
+            if executor is not None and _executor is executor:
+                _shutdown_locked()
+        return partial(df)
+
+    return reduce(merge, results)
@@ -0,0 +1,308 @@
+"""
+Layout dataset terpartisi per bulan dengan manifest
+
+Setiap bulan disimpan sebagai satu file Parquet, ditambah manifest.json berisi
+rentang tanggal, jumlah baris dan total per (Kategori, Tipe) per partisi.
+Filter tanggal hanya membuka partisi yang overlap dengan rentang, dan partisi
+yang seluruhnya berada di dalam rentang dijawab dari total di manifest tanpa
+membaca baris.
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from engine.aggregates import (
+    category_partial, finalize_category_summary, finalize_summary, merge_category,
+    merge_summary, summary_partial
+)
+from engine.expressions import EvalContext, filter_expression
+from engine.schema import apply_schema
+
+MANIFEST_FILE = 'manifest.json'
+
+
+def _partition_file(month):
+    """Nama file partisi untuk bulan (Period)"""
+    return f"bulan={month}.parquet"
+
+
+def _partition_totals(part):
+    """Hitung total sum dan count per Kategori dan Tipe untuk satu partisi"""
+    grouped = part.groupby(['Kategori', 'Tipe'], observed=True)['Jumlah'].agg(['sum', 'count'])
+
+    totals = {}
+    for (kategori, tipe), row in grouped.iterrows():
+        totals.setdefault(str(kategori), {})[str(tipe)] = {'sum': int(row['sum']), 'count': int(row['count'])}
+    return totals
+
+
+def _write_partition(root, month, part):
+    """
+    Tulis satu partisi bulanan secara atomik
+
+    File ditulis ke file sementara di direktori yang sama lalu di-replace, sehingga
+    pembaca tidak pernah melihat file Parquet yang setengah ditulis.
+
+    Returns:
+        Dictionary entry manifest untuk partisi
+    """
+    file_name = _partition_file(month)
+    path = os.path.join(root, file_name)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    try:
+        part.to_parquet(tmp_path, index=True)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return {
+        'month': str(month),
+        'file': file_name,
+        'min_date': part['Tanggal'].min().isoformat(),
+        'max_date': part['Tanggal'].max().isoformat(),
+        'row_count': len(part),
+        'totals': _partition_totals(part),
+    }
+
+
+def _write_manifest(root, manifest):
+    """Tulis manifest secara atomik"""
+    tmp_path = os.path.join(root, f"{MANIFEST_FILE}.tmp-{os.getpid()}")
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(root, MANIFEST_FILE))
+
+
+def write_partitions(df, root):
+    """
+    Tulis dataset sebagai satu file Parquet per bulan beserta manifest
+
+    Args:
+        df: Dataset bertipe (hasil load_data)
+        root: Direktori partisi
+
+    Returns:
+        Dictionary manifest
+    """
+    os.makedirs(root, exist_ok=True)
+
+    months = df['Tanggal'].dt.to_period('M')
+    partitions = [_write_partition(root, month, part) for month, part in df.groupby(months, sort=True)]
+
+    manifest = {
+        'dataset_version': df.attrs.get('dataset_version', ''),
+        'descriptions': df['Deskripsi'].cat.categories.tolist(),
+        'partitions': partitions,
+    }
+
+    # Manifest ditulis terakhir; partisi lama baru dihapus setelah manifest baru terpasang
+    _write_manifest(root, manifest)
+
+    current_files = {p['file'] for p in partitions}
+    for name in os.listdir(root):
+        if name.startswith('bulan=') and name.endswith('.parquet') and name not in current_files:
+            os.remove(os.path.join(root, name))
+
+    return manifest
+
+
+def read_manifest(root):
+    """Baca manifest partisi, None jika belum ada"""
+    path = os.path.join(root, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+class PartitionedBackend:
+    """
+    Backend berbasis partisi bulanan dengan partition pruning
+
+    Interface sama dengan backend di engine.backends.
+    """
+
+    name = 'partitioned'
+
+    def __init__(self, df, root):
+        self.root = root
+        manifest = read_manifest(root)
+
+        version = df.attrs.get('dataset_version', '')
+        if manifest is None or not version or manifest.get('dataset_version') != version:
+            manifest = write_partitions(df, root)
+
+        self._columns = list(df.columns)
+        self._set_manifest(manifest)
+
+    def _set_manifest(self, manifest):
+        """Pasang manifest dan index rentang tanggal partisi"""
+        self.manifest = manifest
+        self._description_dtype = pd.CategoricalDtype(manifest['descriptions'])
+
+        partitions = manifest['partitions']
+        self._min_dates = pd.to_datetime([p['min_date'] for p in partitions])
+        self._max_dates = pd.to_datetime([p['max_date'] for p in partitions])
+
+    def append(self, new_rows, data):
+        """
+        Tambahkan baris baru ke partisi bulannya dan update manifest
+
+        Hanya partisi bulan yang menerima baris baru yang ditulis ulang.
+        """
+        partitions = list(self.manifest['partitions'])
+        positions = {p['month']: i for i, p in enumerate(partitions)}
+
+        for month, rows in new_rows.groupby(new_rows['Tanggal'].dt.to_period('M'), sort=True):
+            if str(month) in positions:
+                i = positions[str(month)]
+                part = pd.concat([self._read_partition(partitions[i]), rows])
+                partitions[i] = _write_partition(self.root, month, part)
+            else:
+                partitions.append(_write_partition(self.root, month, rows))
+
+        manifest = {
+            'dataset_version': data.attrs.get('dataset_version', ''),
+            'descriptions': data['Deskripsi'].cat.categories.tolist(),
+            'partitions': sorted(partitions, key=lambda p: p['month']),
+        }
+        _write_manifest(self.root, manifest)
+        self._set_manifest(manifest)
+
+    def _overlapping(self, start_date=None, end_date=None):
+        """
+        Get partisi yang overlap dengan rentang tanggal
+
+        Returns:
+            List tuple (partisi, fully_inside)
+        """
+        start = pd.to_datetime(start_date) if start_date else None
+        end = pd.to_datetime(end_date) if end_date else None
+
+        overlap = np.ones(len(self._min_dates), dtype=bool)
+        inside = np.ones(len(self._min_dates), dtype=bool)
+
+        if start is not None:
+            overlap &= self._max_dates >= start
+            inside &= self._min_dates >= start
+        if end is not None:
+            overlap &= self._min_dates <= end
+            inside &= self._max_dates <= end
+
+        partitions = self.manifest['partitions']
+        return [(partitions[i], bool(inside[i])) for i in np.flatnonzero(overlap)]
+
+    def _read_partition(self, partition):
+        """Baca satu file partisi"""
+        part = pd.read_parquet(os.path.join(self.root, partition['file']))
+        part['Deskripsi'] = part['Deskripsi'].astype(str).astype(self._description_dtype)
+        return apply_schema(part)
+
+    def _read_filtered(self, partition, expr):
+        """Baca satu partisi lalu terapkan filter expression"""
+        from utils import _match_descriptions
+        part = self._read_partition(partition)
+        mask = expr.mask(EvalContext(part, describe=_match_descriptions))
+        return part if mask is None else part[mask]
+
+    def _totals(self, partition, categories=None, transaction_types=None):
+        """Iterasi total manifest (kategori, tipe, sum, count) yang lolos filter kategori/tipe"""
+        for kategori, per_type in partition['totals'].items():
+            if categories and kategori not in categories:
+                continue
+            for tipe, total in per_type.items():
+                if transaction_types and tipe not in transaction_types:
+                    continue
+                yield kategori, tipe, total['sum'], total['count']
+
+    def select(self, expr):
+        """Baris yang cocok dengan filter expression, hanya membaca partisi yang overlap"""
+        frames = [
+            self._read_filtered(partition, expr)
+            for partition, _ in self._overlapping(*expr.date_bounds())
+        ]
+
+        if not frames:
+            empty = pd.DataFrame({col: pd.Series([], dtype=object) for col in self._columns})
+            empty['Jumlah'] = empty['Jumlah'].astype('int64')
+            empty['Saldo'] = empty['Saldo'].astype('int64')
+            empty['Deskripsi'] = empty['Deskripsi'].astype(self._description_dtype)
+            empty.index = empty.index.astype('int64')
+            return apply_schema(empty)
+
+        return pd.concat(frames)
+
+    def filter_data(self, start_date=None, end_date=None, categories=None, transaction_types=None):
+        """Filter dataset dengan hanya membaca partisi yang overlap, lihat utils.filter_data"""
+        return self.select(filter_expression(start_date, end_date, categories, transaction_types))
+
+    def calculate_summary(self, start_date=None, end_date=None, categories=None, transaction_types=None):
+        """Hitung summary; partisi yang seluruhnya di dalam rentang dijawab dari manifest"""
+        expr = filter_expression(start_date, end_date, categories, transaction_types)
+        partial = None
+
+        for partition, fully_inside in self._overlapping(start_date, end_date):
+            if fully_inside:
+                income = expense = count = 0
+                for _, tipe, total, n in self._totals(partition, categories, transaction_types):
+                    if tipe == 'Kredit':
+                        income += total
+                    elif tipe == 'Debit':
+                        expense += total
+                    count += n
+                part_partial = {
+                    'total_income': np.int64(income),
+                    'total_expense': np.int64(expense),
+                    'transaction_count': count,
+                }
+            else:
+                part_partial = summary_partial(self._read_filtered(partition, expr))
+
+            partial = merge_summary(partial, part_partial)
+
+        if partial is None:
+            partial = {'total_income': np.int64(0), 'total_expense': np.int64(0), 'transaction_count': 0}
+
+        return finalize_summary(partial)
+
+    def get_category_summary(self, start_date=None, end_date=None, categories=None, transaction_types=None):
+        """Hitung summary per kategori; partisi di dalam rentang dijawab dari manifest"""
+        expr = filter_expression(start_date, end_date, categories, transaction_types)
+        partial = None
+
+        for partition, fully_inside in self._overlapping(start_date, end_date):
+            if fully_inside:
+                sums = {}
+                for kategori, _, total, n in self._totals(partition, categories, transaction_types):
+                    current = sums.setdefault(kategori, [0, 0])
+                    current[0] += total
+                    current[1] += n
+                part_partial = _category_frame(sums)
+            else:
+                part_partial = category_partial(self._read_filtered(partition, expr))
+
+            partial = merge_category(partial, part_partial)
+
+        if partial is None:
+            partial = _category_frame({})
+
+        return finalize_category_summary(partial)
+
+
+def _category_frame(sums):
+    """Bentuk agregat parsial per kategori (format category_partial) dari dict {kategori: [sum, count]}"""
+    from engine.schema import column_dtype
+
+    index = pd.Index(list(sums), dtype=column_dtype('Kategori'), name='Kategori')
+    partial = pd.DataFrame(
+        {
+            'sum': np.array([v[0] for v in sums.values()], dtype='int64'),
+            'count': np.array([v[1] for v in sums.values()], dtype='int64'),
+        },
+        index=index,
+    )
+    return partial.sort_index()
@@ -0,0 +1,126 @@
+"""
+Cache LRU hasil filter yang dibagi semua page dan session
+
+Key berupa versi dataset dan bentuk kanonik filter expression (tanggal yang
+dinormalisasi, set kategori dan tipe yang diurutkan), sehingga pilihan yang sama
+dari Dashboard, Analytics dan Transactions memakai satu entry. Nilai yang
+disimpan adalah row selection (posisi baris), bukan salinan DataFrame. Eviction
+berdasarkan total ukuran memori hasil, bukan jumlah entry.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+def normalize_values(values, known):
+    """
+    Bentuk kanonik pilihan kategori/tipe
+
+    Args:
+        values: List nilai yang dipilih (kosong/None berarti tanpa filter)
+        known: List semua nilai yang mungkin
+
+    Returns:
+        None jika tanpa filter (atau semua nilai dipilih), selain itu tuple nilai terurut
+    """
+    if not values:
+        return None
+
+    selected = {str(value) for value in values} & set(known)
+    if len(selected) == len(set(known)):
+        return None
+
+    return tuple(sorted(selected))
+
+
+def result_nbytes(result):
+    """Ukuran memori hasil filter (bytes): array posisi, slice atau DataFrame"""
+    if isinstance(result, np.ndarray):
+        return int(result.nbytes)
+    if isinstance(result, slice):
+        return sys.getsizeof(result)
+    return int(result.memory_usage(index=True, deep=True).sum())
+
+
+class FilterResultCache:
+    """LRU cache hasil filter dengan batas total bytes"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._version = None
+        self._bytes = 0
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def get(self, version, key):
+        """
+        Ambil hasil filter dari cache
+
+        Returns:
+            Hasil yang disimpan, atau None jika belum ada
+        """
+        with self._lock:
+            entry = self._entries.get((version, key)) if version == self._version else None
+
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+
+            self._entries.move_to_end((version, key))
+            self._stats['hits'] += 1
+            return entry[0]
+
+    def put(self, version, key, result):
+        """Simpan hasil filter, evict entry terlama jika melebihi batas bytes"""
+        nbytes = result_nbytes(result)
+
+        with self._lock:
+            if version != self._version:
+                # Dataset berganti versi: semua hasil lama basi
+                self._entries.clear()
+                self._bytes = 0
+                self._version = version
+
+            if nbytes > self.max_bytes:
+                return
+
+            previous = self._entries.pop((version, key), None)
+            if previous is not None:
+                self._bytes -= previous[1]
+
+            self._entries[(version, key)] = (result, nbytes)
+            self._bytes += nbytes
+
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self._bytes -= evicted_bytes
+                self._stats['evictions'] += 1
+
+    def stats(self):
+        """
+        Get statistik cache
+
+        Returns:
+            Dictionary berisi hits, misses, evictions, hit_rate, entries, bytes, max_bytes
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+            stats['bytes'] = self._bytes
+
+        stats['max_bytes'] = self.max_bytes
+        total = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / total if total > 0 else 0.0
+        return stats
+
+    def clear(self):
+        """Hapus semua entry dan reset statistik"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._version = None
+            self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
@@ -0,0 +1,85 @@
+"""
+Total bergulir (moving window) per kategori atau tipe dari DailyLedger
+
+Untuk jendela sepanjang N hari, nilai pada hari d adalah total hari d-N+1..d.
+Semua hari di grid rapat dijawab sekaligus dengan DailyLedger.category_windows
+(selisih dua baris kumulatif per hari), sehingga semua seri kategori/tipe untuk
+bertahun-tahun data dihitung dalam satu operasi array tanpa loop per jendela.
+"""
+
+import numpy as np
+import pandas as pd
+
+ROLLING_GROUPS = ['Kategori', 'Tipe', 'Total']
+
+
+def _visible_days(ledger, expr=None):
+    """Hari-hari grid ledger yang berada di dalam batas tanggal expression"""
+    if ledger.n_days == 0:
+        return pd.DatetimeIndex([], dtype='datetime64[ns]')
+
+    first = pd.Timestamp(ledger.first_day, unit='D')
+    last = first + pd.Timedelta(days=ledger.n_days - 1)
+    start, end = (None, None) if expr is None else expr.date_bounds()
+    if start is not None:
+        first = max(first, start.ceil('D'))
+    if end is not None:
+        last = min(last, end.floor('D'))
+    return pd.date_range(first, last, freq='D', unit='ns')
+
+
+def rolling_totals(ledger, days, by='Kategori', expr=None):
+    """
+    Total, rata-rata harian dan jumlah transaksi bergulir per seri
+
+    Args:
+        ledger: engine.ledger.DailyLedger atas data
+        days: Panjang jendela (hari)
+        by: 'Kategori', 'Tipe' atau 'Total' (satu seri)
+        expr: Expression view (optional, harus bisa dijawab ledger)
+
+    Returns:
+        DataFrame berisi Tanggal, Seri (nilai Kategori/Tipe, atau 'Total'),
+        Total, Rata-rata Harian dan Jumlah Transaksi; rata-rata dibagi jumlah
+        hari jendela yang berada di dalam rentang view (dari tanggal mulai
+        expression, atau hari pertama ledger jika tidak ada), sehingga hari-hari
+        awal tidak bias ke bawah. Tanggal mulai dari hari transaksi pertama view
+        sampai hari terakhirnya; seri tanpa transaksi tidak ikut.
+    """
+    if by not in ROLLING_GROUPS:
+        raise ValueError(f"Pengelompokan rolling tidak dikenal: {by}")
+
+    # Seri dimulai di hari transaksi pertama view dan berakhir di hari terakhirnya
+    ends = _visible_days(ledger, expr)
+    range_start = ends[0] if len(ends) else None
+    _, daily_counts = ledger.category_windows(ends, ends, expr)
+    active = np.flatnonzero(daily_counts.sum(axis=(1, 2)))
+    ends = ends[active[0]:active[-1] + 1] if len(active) else ends[:0]
+
+    starts = ends - pd.Timedelta(days=days - 1)
+    sums, counts = ledger.category_windows(starts, ends, expr)
+
+    if by == 'Kategori':
+        sums, counts = sums.sum(axis=2), counts.sum(axis=2)
+        labels = np.asarray(ledger.category_dtype.categories, dtype=object)
+    elif by == 'Tipe':
+        sums, counts = sums.sum(axis=1), counts.sum(axis=1)
+        labels = np.asarray(ledger.type_dtype.categories, dtype=object)
+    else:
+        sums, counts = sums.sum(axis=(1, 2))[:, None], counts.sum(axis=(1, 2))[:, None]
+        labels = np.array(['Total'], dtype=object)
+
+    present = np.flatnonzero(counts.sum(axis=0)) if len(ends) else np.array([], dtype=np.int64)
+    sums, counts, labels = sums[:, present], counts[:, present], labels[present]
+
+    # Hari jendela yang berada di dalam rentang view, dihitung dari awal rentang
+    # (bukan hari transaksi pertama): hari kosong di awal rentang tetap dihitung
+    covered = np.minimum(days, (ends - range_start).days.to_numpy() + 1) if len(ends) else np.ones(0)
+
+    return pd.DataFrame({
+        'Tanggal': np.repeat(ends, len(labels)),
+        'Seri': np.tile(labels, len(ends)),
+        'Total': sums.ravel(),
+        'Rata-rata Harian': (sums / covered[:, None]).ravel(),
+        'Jumlah Transaksi': counts.ravel(),
+    })
@@ -0,0 +1,169 @@
+"""
+Schema dataset transaksi: konversi tipe, validasi dan laporan memori
+"""
+
+import argparse
+
+import pandas as pd
+
+from config import DATASET_SCHEMA
+
+
+def column_dtype(column):
+    """
+    Get dtype pandas untuk kolom sesuai DATASET_SCHEMA
+
+    Returns:
+        CategoricalDtype dengan kategori tetap, 'category' atau nama dtype numpy
+    """
+    spec = DATASET_SCHEMA[column]
+
+    if spec['dtype'] == 'category' and 'categories' in spec:
+        return pd.CategoricalDtype(spec['categories'])
+
+    return spec['dtype']
+
+
+def csv_dtypes(columns=None):
+    """Get mapping dtype untuk pd.read_csv (kolom tanggal di-parse terpisah)"""
+    columns = columns or list(DATASET_SCHEMA)
+    return {
+        col: column_dtype(col)
+        for col in columns
+        if col in DATASET_SCHEMA and DATASET_SCHEMA[col]['dtype'] != 'datetime64[ns]'
+    }
+
+
+def _has_dtype(series, dtype):
+    """Cek tipe Series; categorical harus punya kategori dan urutan kode yang sama"""
+    if isinstance(dtype, pd.CategoricalDtype):
+        return (
+            isinstance(series.dtype, pd.CategoricalDtype)
+            and series.cat.categories.equals(dtype.categories)
+        )
+
+    if dtype == 'category':
+        return isinstance(series.dtype, pd.CategoricalDtype)
+
+    return series.dtype == dtype
+
+
+def apply_schema(df):
+    """
+    Konversi kolom DataFrame ke tipe sesuai DATASET_SCHEMA
+
+    Kolom yang sudah bertipe benar tidak disalin ulang.
+
+    Returns:
+        DataFrame dengan tipe kolom sesuai schema
+    """
+    for col in df.columns:
+        if col not in DATASET_SCHEMA:
+            continue
+
+        dtype = column_dtype(col)
+        if dtype == 'datetime64[ns]':
+            if df[col].dtype != 'datetime64[ns]':
+                df[col] = pd.to_datetime(df[col]).astype('datetime64[ns]')
+        elif isinstance(dtype, pd.CategoricalDtype):
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                if not _has_dtype(df[col], dtype):
+                    df[col] = df[col].cat.set_categories(dtype.categories)
+            else:
+                df[col] = df[col].astype(dtype)
+        elif not _has_dtype(df[col], dtype):
+            df[col] = df[col].astype(dtype)
+
+    return df
+
+
+def validate_schema(df):
+    """
+    Cek DataFrame terhadap DATASET_SCHEMA
+
+    Kolom yang tidak di-load (projection) tidak dicek.
+
+    Raises:
+        ValueError jika ada kolom asing, tipe salah atau nilai di luar schema
+    """
+    errors = []
+
+    unknown = [col for col in df.columns if col not in DATASET_SCHEMA]
+    if unknown:
+        errors.append(f"kolom tidak dikenal: {unknown}")
+
+    for col in df.columns:
+        if col not in DATASET_SCHEMA:
+            continue
+
+        spec = DATASET_SCHEMA[col]
+        dtype = column_dtype(col)
+
+        if not _has_dtype(df[col], dtype):
+            errors.append(f"{col}: tipe {df[col].dtype}, seharusnya {spec['dtype']}")
+            continue
+
+        missing = int(df[col].isna().sum())
+        if missing:
+            reason = "nilai kosong atau di luar kategori schema" if 'categories' in spec else "nilai kosong"
+            errors.append(f"{col}: {missing} {reason}")
+
+        if 'min' in spec and len(df) > 0 and df[col].min() < spec['min']:
+            errors.append(f"{col}: nilai minimum {df[col].min()} < {spec['min']}")
+
+    if errors:
+        raise ValueError("Data tidak sesuai schema: " + "; ".join(errors))
+
+
+def memory_report(before, after):
+    """
+    Bandingkan penggunaan memori per kolom sebelum dan sesudah schema
+
+    Args:
+        before: DataFrame sebelum konversi (mis. hasil pd.read_csv biasa)
+        after: DataFrame sesudah konversi schema
+
+    Returns:
+        DataFrame berisi Kolom, Bytes Sebelum, Bytes Sesudah, Hemat (%) dan baris Total
+    """
+    bytes_before = before.memory_usage(index=False, deep=True)
+    bytes_after = after.memory_usage(index=False, deep=True).reindex(bytes_before.index, fill_value=0)
+
+    report = pd.DataFrame({
+        'Kolom': bytes_before.index,
+        'Bytes Sebelum': bytes_before.values,
+        'Bytes Sesudah': bytes_after.values,
+    })
+    total = pd.DataFrame({
+        'Kolom': ['Total'],
+        'Bytes Sebelum': [bytes_before.sum()],
+        'Bytes Sesudah': [bytes_after.sum()],
+    })
+    report = pd.concat([report, total], ignore_index=True)
+
+    report['Hemat (%)'] = (
+        (1 - report['Bytes Sesudah'] / report['Bytes Sebelum'].where(report['Bytes Sebelum'] > 0)) * 100
+    ).fillna(0).round(1)
+
+    return report
+
+
+def main():
+    """CLI untuk menampilkan laporan memori dataset"""
+    from config import DATA_PATH
+
+    parser = argparse.ArgumentParser(description="Laporan memori dataset sebelum/sesudah schema")
+    parser.add_argument('csv_path', nargs='?', default=DATA_PATH, help="Path file CSV")
+    args = parser.parse_args()
+
+    before = pd.read_csv(args.csv_path, dtype={'Kategori': object, 'Tipe': object, 'Deskripsi': object})
+    before['Tanggal'] = pd.to_datetime(before['Tanggal'])
+
+    after = apply_schema(before.copy())
+    validate_schema(after)
+
+    print(memory_report(before, after).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""
+Index pencarian Deskripsi yang dibangun sekali per versi dataset
+
+Pencarian dilakukan pada nilai Deskripsi unik (kategori kolom categorical), bukan
+per baris: token inverted index untuk pencarian kata utuh, trigram index untuk
+pencarian substring, dan edit distance terbatas untuk pencarian fuzzy merchant.
+Nilai yang cocok diubah menjadi posisi baris lewat posting list per kode
+kategori (CSR), sehingga hasilnya berupa row-id terurut yang bisa diiris dengan
+filter lain.
+"""
+
+import re
+
+import numpy as np
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """Pecah teks (lowercase) menjadi token kata"""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def trigrams(text):
+    """Set trigram dari teks (lowercase)"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+# Query fuzzy yang lebih pendek dicocokkan sebagai substring persis
+FUZZY_MIN_LENGTH = 4
+
+
+def default_max_distance(query):
+    """Batas edit distance default: 1 per 4 karakter query, maksimal 3"""
+    return min(3, len(query) // 4)
+
+
+def effective_max_distance(query, max_distance=None):
+    """
+    Batas edit distance yang dipakai untuk query
+
+    Query di bawah FUZZY_MIN_LENGTH karakter berarti jarak 0 (substring persis):
+    dengan jarak 1, satu karakter yang cocok di mana pun sudah cukup, sehingga
+    query dua karakter cocok dengan sebagian besar merchant. Jarak juga dibatasi
+    len(query) - 1, karena dengan jarak >= panjang query string kosong sudah cocok.
+    """
+    if len(query) < FUZZY_MIN_LENGTH:
+        return 0
+    if max_distance is None:
+        max_distance = default_max_distance(query)
+    return max(0, min(max_distance, len(query) - 1))
+
+
+def substring_distance(query, text, max_distance):
+    """
+    Edit distance terkecil antara query dan substring mana pun dari text
+
+    Dynamic programming Sellers dengan awal bebas di text (O(|query| * |text|)),
+    berhenti lebih awal begitu ditemukan kecocokan persis.
+
+    Returns:
+        Jarak (int), atau None jika lebih dari max_distance
+    """
+    # previous[i] = jarak terbaik query[:i] yang berakhir di posisi text saat ini
+    previous = list(range(len(query) + 1))
+    best = previous[-1]
+
+    for char in text:
+        current = [0]
+        for i, query_char in enumerate(query, start=1):
+            current.append(min(
+                previous[i - 1] + (query_char != char),
+                previous[i] + 1,
+                current[i - 1] + 1
+            ))
+        best = min(best, current[-1])
+        if best == 0:
+            break
+        previous = current
+
+    return best if best <= max_distance else None
+
+
+class DescriptionIndex:
+    """
+    Token dan trigram inverted index atas nilai Deskripsi unik
+
+    Posting list index berisi kode nilai (posisi di kategori Deskripsi), jadi
+    ukurannya sebanding dengan jumlah nilai unik. Posisi baris per kode disimpan
+    dalam bentuk CSR per run baris berurutan: rows[offsets[code]:offsets[code + 1]].
+    Append hanya membangun run untuk baris baru; run yang berdekatan digabung
+    saat ukurannya setara (seperti binary counter), sehingga jumlah run tetap
+    O(log n) dan setiap baris di-sort ulang O(log n) kali secara amortized.
+
+    Attributes:
+        counts: Array jumlah baris per kode nilai
+    """
+
+    def __init__(self, df):
+        self.values = []
+        self.labels = []
+        self.tokens = {}
+        self.grams = {}
+        self._add_values(df['Deskripsi'].cat.categories)
+        codes = df['Deskripsi'].cat.codes.to_numpy()
+        self._runs = [self._build_run(codes, 0)]
+        self.counts = np.bincount(codes[codes >= 0], minlength=len(self.values))
+
+    def _add_values(self, values):
+        """Tambahkan nilai unik baru ke token dan trigram index"""
+        for value in values:
+            code = len(self.values)
+            text = str(value).lower()
+            self.values.append(text)
+            self.labels.append(str(value))
+
+            for token in set(tokenize(text)):
+                self.tokens.setdefault(token, []).append(code)
+            for gram in trigrams(text):
+                self.grams.setdefault(gram, []).append(code)
+
+    def _build_run(self, codes, start):
+        """
+        Posting list CSR untuk baris [start, start + len(codes))
+
+        Returns:
+            Tuple (start, offsets, rows); rows berisi posisi baris dataset
+        """
+        rows = np.argsort(codes, kind='stable').astype(np.int64) + start
+        counts = np.bincount(codes[codes >= 0], minlength=len(self.values))
+        # Baris dengan Deskripsi kosong (kode -1) berada di awal urutan
+        offsets = np.concatenate([[0], np.cumsum(counts)]) + np.count_nonzero(codes < 0)
+        return start, offsets, rows
+
+    def append(self, new_rows, data):
+        """Tambahkan nilai baru ke index dan run posting list untuk baris baru saja"""
+        categories = data['Deskripsi'].cat.categories
+        self._add_values(categories[len(self.values):])
+
+        start = len(data) - len(new_rows)
+        new_codes = data['Deskripsi'].cat.codes.to_numpy()[start:]
+        self._runs.append(self._build_run(new_codes, start))
+
+        counts = np.zeros(len(self.values), dtype=np.int64)
+        counts[:len(self.counts)] = self.counts
+        self.counts = counts + np.bincount(new_codes[new_codes >= 0], minlength=len(self.values))
+
+        # Gabungkan run terakhir selama run sebelumnya tidak lebih besar
+        while len(self._runs) > 1 and len(self._runs[-2][2]) <= len(self._runs[-1][2]):
+            merged_start = self._runs[-2][0]
+            del self._runs[-2:]
+            self._runs.append(self._build_run(data['Deskripsi'].cat.codes.to_numpy()[merged_start:], merged_start))
+
+    def match_substring(self, query):
+        """
+        Kode nilai yang mengandung query (case-insensitive)
+
+        Kandidat diambil dari irisan posting list trigram query, lalu diverifikasi
+        dengan pencocokan substring pada kandidat saja.
+        """
+        query = query.lower()
+
+        if len(query) < 3:
+            candidates = range(len(self.values))
+        else:
+            postings = sorted((self.grams.get(gram, []) for gram in trigrams(query)), key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates.intersection_update(posting)
+                if not candidates:
+                    break
+
+        return sorted(code for code in candidates if query in self.values[code])
+
+    def match_tokens(self, query):
+        """Kode nilai yang memuat semua kata di query sebagai kata utuh"""
+        codes = None
+
+        for token in set(tokenize(query)):
+            posting = set(self.tokens.get(token, []))
+            codes = posting if codes is None else codes & posting
+            if not codes:
+                return []
+
+        return sorted(codes) if codes else []
+
+    def rows_for(self, codes):
+        """
+        Posisi baris untuk kode nilai
+
+        Returns:
+            Array int64 posisi baris yang terurut
+        """
+        if not len(codes):
+            return np.empty(0, dtype=np.int64)
+
+        rows = np.concatenate([
+            run_rows[offsets[code]:offsets[code + 1]]
+            for _, offsets, run_rows in self._runs
+            for code in codes if code < len(offsets) - 1
+        ])
+        rows.sort()
+        return rows
+
+    def match_fuzzy(self, query, max_distance=None, limit=None):
+        """
+        Merchant (nilai unik) yang mirip query, diurutkan dari yang paling cocok
+
+        Kandidat disaring dengan q-gram lemma: substring yang berjarak <= k dari
+        query masih memuat minimal |trigram query| - 3k trigram query, sehingga
+        edit distance hanya dihitung untuk nilai yang lolos saringan.
+
+        Args:
+            query: Teks pencarian
+            max_distance: Batas edit distance (None = default_max_distance);
+                selalu dibatasi len(query) - 1 (lihat effective_max_distance)
+            limit: Jumlah maksimum merchant (None = semua)
+
+        Returns:
+            List tuple (kode, jarak) urut berdasarkan jarak lalu jumlah transaksi
+        """
+        query = query.lower().strip()
+        if not query:
+            return []
+        max_distance = effective_max_distance(query, max_distance)
+
+        query_grams = trigrams(query)
+        threshold = len(query_grams) - 3 * max_distance
+
+        if threshold > 0:
+            shared = {}
+            for gram in query_grams:
+                for code in self.grams.get(gram, []):
+                    shared[code] = shared.get(code, 0) + 1
+            candidates = [code for code, count in shared.items() if count >= threshold]
+        else:
+            candidates = range(len(self.values))
+
+        counts = self.counts
+        matches = []
+        for code in candidates:
+            distance = substring_distance(query, self.values[code], max_distance)
+            if distance is not None and counts[code] > 0:
+                matches.append((code, distance))
+
+        matches.sort(key=lambda match: (match[1], -counts[match[0]], self.values[match[0]]))
+        return matches[:limit] if limit else matches
+
+    def match(self, query, mode='substring', max_distance=None):
+        """
+        Kode nilai yang cocok dengan query
+
+        Args:
+            query: Teks pencarian
+            mode: 'substring', 'word' (kata utuh) atau 'fuzzy'
+            max_distance: Batas edit distance untuk mode 'fuzzy'
+
+        Returns:
+            List kode nilai yang terurut
+        """
+        if mode == 'word':
+            return self.match_tokens(query)
+        if mode == 'fuzzy':
+            return sorted(code for code, _ in self.match_fuzzy(query, max_distance))
+        if mode == 'substring':
+            return self.match_substring(query)
+
+        raise ValueError(f"Mode pencarian tidak dikenal: {mode}")
+
+    def matching_labels(self, query, mode='substring', max_distance=None):
+        """Nilai Deskripsi asli (bukan lowercase) yang cocok dengan query"""
+        return [self.labels[code] for code in self.match(query, mode, max_distance)]
+
+    def search(self, query, mode='substring', max_distance=None):
+        """
+        Cari baris yang Deskripsi-nya cocok dengan query
+
+        Returns:
+            Array int64 posisi baris yang terurut
+        """
+        return self.rows_for(self.match(query, mode, max_distance))
@@ -0,0 +1,269 @@
+"""
+Quantile sketch yang bisa digabung (mergeable) untuk Jumlah
+
+Sketch memakai bucket logaritmik (gaya DDSketch): nilai x > 0 masuk bucket
+k = ceil(log_gamma(x)) dengan gamma = (1 + a) / (1 - a), dan setiap bucket
+diwakili nilai 2 * gamma^k / (gamma + 1). Setiap quantile yang dikembalikan
+berada dalam error relatif a dari nilai exact-nya, untuk distribusi apa pun.
+Menggabungkan dua sketch cukup dengan menjumlah count per bucket, sehingga
+hasilnya sama persis dengan sketch dari gabungan datanya.
+
+CellSketches menyimpan count bucket per (bulan, Kategori, Tipe) sebagai satu
+array rapat, sehingga median, kuartil dan persentil untuk jendela tanggal AND
+predikat Kategori/Tipe dihitung dengan menjumlah count bulan-bulan penuh di
+dalam jendela; hanya baris bulan tepi yang terpotong jendela yang dibaca.
+
+Jumlah diasumsikan bilangan bulat >= 0 (schema); nilai 0 punya bucket sendiri.
+"""
+
+import numpy as np
+import pandas as pd
+
+from engine.expressions import EvalContext
+from engine.indexes import BitmapIndex
+from engine.ledger import _window_separable
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+
+def sketch_gamma(relative_accuracy):
+    """Rasio bucket gamma untuk error relatif tertentu"""
+    return (1 + relative_accuracy) / (1 - relative_accuracy)
+
+
+def bucket_index(values, gamma):
+    """
+    Index bucket per nilai (0 untuk nilai 0, k + 1 untuk bucket k)
+
+    Returns:
+        Array int64
+    """
+    values = np.asarray(values, dtype=np.float64)
+    index = np.zeros(len(values), dtype=np.int64)
+    positive = values > 0
+    keys = np.ceil(np.log(values[positive]) / np.log(gamma)).astype(np.int64)
+    index[positive] = np.maximum(keys, 0) + 1
+    return index
+
+
+def bucket_values(index, gamma):
+    """Nilai wakil per index bucket (0 untuk bucket nol)"""
+    index = np.asarray(index, dtype=np.int64)
+    return np.where(index > 0, 2 * gamma ** (index - 1) / (gamma + 1), 0.0)
+
+
+class LogSketch:
+    """
+    Sketch quantile dengan bucket logaritmik
+
+    Args:
+        counts: Array count per index bucket (lihat bucket_index)
+        relative_accuracy: Error relatif maksimum quantile
+        low: Nilai minimum exact (optional, untuk membatasi hasil)
+        high: Nilai maksimum exact (optional, untuk membatasi hasil)
+    """
+
+    def __init__(self, counts, relative_accuracy=DEFAULT_RELATIVE_ACCURACY, low=None, high=None):
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self.relative_accuracy = relative_accuracy
+        self.gamma = sketch_gamma(relative_accuracy)
+        self.low = low
+        self.high = high
+
+    @classmethod
+    def from_values(cls, values, relative_accuracy=DEFAULT_RELATIVE_ACCURACY):
+        """Bangun sketch dari array nilai"""
+        values = np.asarray(values)
+        index = bucket_index(values, sketch_gamma(relative_accuracy))
+        low, high = (values.min(), values.max()) if len(values) else (None, None)
+        return cls(np.bincount(index), relative_accuracy, low, high)
+
+    @property
+    def count(self):
+        return int(self.counts.sum())
+
+    def merge(self, other):
+        """Sketch gabungan (count per bucket dijumlahkan)"""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Sketch dengan akurasi berbeda tidak bisa digabung")
+
+        size = max(len(self.counts), len(other.counts))
+        counts = np.zeros(size, dtype=np.int64)
+        counts[:len(self.counts)] += self.counts
+        counts[:len(other.counts)] += other.counts
+
+        lows = [value for value in (self.low, other.low) if value is not None]
+        highs = [value for value in (self.high, other.high) if value is not None]
+        return LogSketch(
+            counts, self.relative_accuracy,
+            min(lows) if lows else None, max(highs) if highs else None
+        )
+
+    def quantiles(self, qs):
+        """
+        Quantile perkiraan (interpolasi linear seperti Series.quantile)
+
+        Args:
+            qs: List quantile di [0, 1]
+
+        Returns:
+            Array nilai quantile (NaN jika sketch kosong)
+        """
+        qs = np.asarray(qs, dtype=np.float64)
+        n = self.count
+        if n == 0:
+            return np.full(len(qs), np.nan)
+
+        cumulative = np.cumsum(self.counts)
+        positions = qs * (n - 1)
+        lower = np.floor(positions).astype(np.int64)
+        upper = np.ceil(positions).astype(np.int64)
+
+        lower_values = bucket_values(np.searchsorted(cumulative, lower, side='right'), self.gamma)
+        upper_values = bucket_values(np.searchsorted(cumulative, upper, side='right'), self.gamma)
+        result = lower_values + (upper_values - lower_values) * (positions - lower)
+
+        if self.low is not None and self.high is not None:
+            result = np.clip(result, self.low, self.high)
+            result[qs == 0] = self.low
+            result[qs == 1] = self.high
+        return result
+
+    def quantile(self, q):
+        """Satu quantile perkiraan"""
+        return float(self.quantiles([q])[0])
+
+
+def _month_numbers(timestamps):
+    """Bulan sejak epoch (int64) untuk array datetime64"""
+    return np.asarray(timestamps).astype('datetime64[M]').astype(np.int64)
+
+
+class CellSketches:
+    """
+    Sketch quantile Jumlah per (bulan, Kategori, Tipe)
+
+    Count bucket disimpan dalam array (bulan, kombinasi, bucket); kombinasi
+    (Kategori, Tipe) dievaluasi dengan filter expression yang sama seperti
+    DailyLedger. Dataset harus urut berdasarkan Tanggal (seperti DateIndex), dan
+    Kategori/Tipe categorical sehingga kode kombinasi tetap sama saat append.
+
+    Attributes:
+        counts: Array (bulan, kombinasi, bucket) count bucket
+        grid: DataFrame kombinasi (Kategori, Tipe), urut sama dengan sumbu kombinasi
+    """
+
+    def __init__(self, df, relative_accuracy=DEFAULT_RELATIVE_ACCURACY):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = sketch_gamma(relative_accuracy)
+        self.category_dtype = df['Kategori'].dtype
+        self.type_dtype = df['Tipe'].dtype
+        n_categories = len(self.category_dtype.categories)
+        n_types = len(self.type_dtype.categories)
+
+        self.grid = pd.DataFrame({
+            'Kategori': pd.Categorical.from_codes(
+                np.repeat(np.arange(n_categories), n_types), dtype=self.category_dtype
+            ),
+            'Tipe': pd.Categorical.from_codes(np.tile(np.arange(n_types), n_categories), dtype=self.type_dtype),
+        })
+        self._bitmap = BitmapIndex(self.grid)
+
+        months = _month_numbers(df['Tanggal'].to_numpy())
+        self.first_month = int(months[0]) if len(months) else 0
+        self.counts = np.zeros((0, len(self.grid), 1), dtype=np.int32)
+        self._data = df
+        self._add_rows(df, months)
+
+    def _add_rows(self, rows, months):
+        """Tambahkan count bucket baris (bulan >= bulan terakhir yang ada)"""
+        if not len(rows):
+            return
+
+        n_types = len(self.type_dtype.categories)
+        combos = rows['Kategori'].cat.codes.to_numpy(np.int64) * n_types + rows['Tipe'].cat.codes.to_numpy(np.int64)
+        buckets = bucket_index(rows['Jumlah'].to_numpy(), self.gamma)
+        month_offsets = months - self.first_month
+
+        n_months = max(len(self.counts), int(month_offsets[-1]) + 1)
+        n_buckets = max(self.counts.shape[2], int(buckets.max()) + 1)
+        if (n_months, n_buckets) != (len(self.counts), self.counts.shape[2]):
+            grown = np.zeros((n_months, len(self.grid), n_buckets), dtype=np.int32)
+            grown[:len(self.counts), :, :self.counts.shape[2]] = self.counts
+            self.counts = grown
+
+        key = (month_offsets * len(self.grid) + combos) * n_buckets + buckets
+        cells, counts = np.unique(key, return_counts=True)
+        self.counts.reshape(-1)[cells] += counts.astype(self.counts.dtype)
+
+    def append(self, new_rows, data):
+        """Tambahkan count bucket baris baru (baris baru selalu di akhir)"""
+        categories_changed = (
+            len(data['Kategori'].cat.categories) != len(self.category_dtype.categories)
+            or len(data['Tipe'].cat.categories) != len(self.type_dtype.categories)
+        )
+        if categories_changed or not len(self._data):
+            self.__init__(data, self.relative_accuracy)
+            return
+
+        self._data = data
+        self._add_rows(new_rows, _month_numbers(new_rows['Tanggal'].to_numpy()))
+
+    def answers(self, expr):
+        """True jika expression = jendela tanggal AND predikat Kategori/Tipe"""
+        return _window_separable(expr)
+
+    def _edge_counts(self, expr, start, stop):
+        """Count bucket baris [start, stop) dataset yang cocok dengan expression"""
+        rows = self._data.iloc[start:stop]
+        mask = expr.mask(EvalContext(rows))
+        amounts = rows['Jumlah'].to_numpy()
+        return np.bincount(bucket_index(amounts if mask is None else amounts[mask], self.gamma))
+
+    def query(self, expr, low=None, high=None):
+        """
+        Sketch gabungan untuk baris yang cocok dengan expression
+
+        Bulan yang semua barisnya berada di dalam jendela tanggal dijawab dari
+        count bucket; baris bulan tepi yang terpotong jendela di-bucket langsung.
+
+        Args:
+            expr: Filter expression (lihat answers)
+            low: Nilai minimum exact (optional, dari sel cube)
+            high: Nilai maksimum exact (optional, dari sel cube)
+
+        Returns:
+            LogSketch, atau None jika expression tidak bisa dijawab
+        """
+        if not self.answers(expr):
+            return None
+
+        tanggal = self._data['Tanggal'].to_numpy()
+        start, end = window = expr.date_bounds()
+        lo = 0 if start is None else int(np.searchsorted(tanggal, start.to_datetime64(), side='left'))
+        hi = len(tanggal) if end is None else int(np.searchsorted(tanggal, end.to_datetime64(), side='right'))
+        hi = max(lo, hi)
+
+        # Posisi baris awal tiap bulan; bulan [first, last) seluruhnya di dalam [lo, hi)
+        boundaries = np.arange(self.first_month, self.first_month + len(self.counts) + 1).astype('datetime64[M]')
+        month_starts = np.searchsorted(tanggal, boundaries.astype(tanggal.dtype), side='left')
+        first = int(np.searchsorted(month_starts, lo, side='left'))
+        last = max(first, int(np.searchsorted(month_starts, hi, side='right')) - 1)
+
+        counts = np.zeros(self.counts.shape[2], dtype=np.int64)
+        if last > first:
+            combos = expr.mask(EvalContext(self.grid, bitmap=self._bitmap, window=window))
+            months = self.counts[first:last]
+            counts += (months.sum(axis=1) if combos is None else months[:, combos].sum(axis=1)).sum(axis=0)
+            edges = [(lo, int(month_starts[first])), (int(month_starts[last]), hi)]
+        else:
+            edges = [(lo, hi)]
+
+        for start, stop in edges:
+            if stop > start:
+                edge = self._edge_counts(expr, start, stop)
+                if len(edge) > len(counts):
+                    counts = np.concatenate([counts, np.zeros(len(edge) - len(counts), dtype=np.int64)])
+                counts[:len(edge)] += edge
+
+        return LogSketch(counts, self.relative_accuracy, low, high)
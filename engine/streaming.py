@@ -0,0 +1,198 @@
+"""
+Agregasi streaming per chunk untuk dataset yang lebih besar dari RAM
+
+Sumber data dibaca per chunk berukuran terbatas, setiap chunk dilipat ke
+agregat parsial (engine.aggregates), lalu agregat digabung dan difinalisasi.
+Hasilnya identik dengan calculate_summary, get_category_summary,
+get_monthly_summary dan get_daily_transactions versi in-memory.
+
+Modul ini API-only (skrip/job batch); tidak ada halaman yang memanggilnya.
+Halaman memakai dataset in-memory dari dataset_cache yang sudah dibagi antar
+session, sehingga membaca ulang file per chunk di setiap render hanya lebih
+lambat; progress_callback disediakan untuk pemanggil batch.
+"""
+
+import os
+
+import pandas as pd
+
+from config import COLUMNAR_FORMAT, STREAMING_MAX_MEMORY_MB
+from engine.aggregates import (
+    category_partial, daily_partial, finalize_category_summary, finalize_daily_transactions,
+    finalize_monthly_summary, finalize_summary, merge_category, merge_monthly, merge_series,
+    merge_summary, monthly_partial, summary_partial
+)
+from engine.columnar import ensure_columnar
+from engine.expressions import EvalContext, filter_expression
+from engine.schema import apply_schema, csv_dtypes
+
+# Kolom yang dibutuhkan agregat; Deskripsi dan Saldo tidak pernah dibaca
+STREAM_COLUMNS = ['Tanggal', 'Kategori', 'Tipe', 'Jumlah']
+
+# Faktor pengali memori per chunk (buffer parser, mask filter, groupby)
+_WORKING_SET_FACTOR = 4
+_SAMPLE_ROWS = 1000
+_MIN_CHUNK_ROWS = 1000
+
+
+class StreamingAggregator:
+    """
+    Kumpulan agregat parsial yang bisa di-update per chunk dan digabung
+
+    Dua aggregator dari sumber berbeda (mis. dua file) bisa digabung dengan merge().
+    """
+
+    def __init__(self):
+        self.summary = None
+        self.category = None
+        self.monthly = None
+        self.daily = None
+        self.rows = 0
+
+    def update(self, chunk):
+        """Lipat satu chunk DataFrame ke agregat"""
+        self.summary = merge_summary(self.summary, summary_partial(chunk))
+        self.category = merge_category(self.category, category_partial(chunk))
+        self.monthly = merge_monthly(self.monthly, monthly_partial(chunk))
+        self.daily = merge_series(self.daily, daily_partial(chunk))
+        self.rows += len(chunk)
+
+    def merge(self, other):
+        """Gabungkan aggregator lain ke aggregator ini"""
+        if other.summary is not None:
+            self.summary = merge_summary(self.summary, other.summary)
+            self.category = merge_category(self.category, other.category)
+            self.monthly = merge_monthly(self.monthly, other.monthly)
+            self.daily = merge_series(self.daily, other.daily)
+        self.rows += other.rows
+        return self
+
+    def results(self):
+        """
+        Finalisasi agregat
+
+        Returns:
+            Dictionary berisi summary, category_summary, monthly_summary, daily_transactions
+        """
+        if self.summary is None:
+            # Tidak ada chunk: hitung dari DataFrame kosong agar format output sama
+            self.update(_empty_frame())
+
+        return {
+            'summary': finalize_summary(self.summary),
+            'category_summary': finalize_category_summary(self.category),
+            'monthly_summary': finalize_monthly_summary(self.monthly),
+            'daily_transactions': finalize_daily_transactions(self.daily),
+        }
+
+
+def _empty_frame():
+    """DataFrame kosong dengan tipe sesuai schema"""
+    df = pd.DataFrame({col: pd.Series([], dtype=object) for col in STREAM_COLUMNS})
+    df['Jumlah'] = df['Jumlah'].astype('int64')
+    return apply_schema(df)
+
+
+def estimate_chunk_rows(csv_path, max_memory_mb=STREAMING_MAX_MEMORY_MB):
+    """
+    Estimasi jumlah baris per chunk agar memori kerja tetap di bawah batas
+
+    Args:
+        csv_path: Path file CSV
+        max_memory_mb: Batas memori kerja per chunk (MB)
+
+    Returns:
+        Jumlah baris per chunk
+    """
+    sample = pd.read_csv(csv_path, usecols=STREAM_COLUMNS, dtype=csv_dtypes(STREAM_COLUMNS), nrows=_SAMPLE_ROWS)
+    sample = apply_schema(sample)
+
+    if len(sample) == 0:
+        return _MIN_CHUNK_ROWS
+
+    bytes_per_row = sample.memory_usage(index=False, deep=True).sum() / len(sample)
+    budget = max_memory_mb * 1024 * 1024 / _WORKING_SET_FACTOR
+
+    return max(_MIN_CHUNK_ROWS, int(budget / bytes_per_row))
+
+
+def iter_chunks(csv_path, chunk_rows, progress_callback=None):
+    """
+    Iterasi dataset per chunk bertipe
+
+    Jika file kolumnar fresh sudah tersedia, chunk dibaca per batch dari file
+    tersebut; jika tidak, CSV dibaca per chunk. File kolumnar tidak pernah dibuat
+    di sini: konversi memuat seluruh CSV ke memori, sehingga batas memori per
+    chunk tidak berlaku lagi.
+
+    Args:
+        csv_path: Path file CSV sumber
+        chunk_rows: Jumlah baris per chunk
+        progress_callback: Callable(fraction, rows_processed) (optional)
+
+    Yields:
+        DataFrame chunk
+    """
+    rows = 0
+    parquet_path = None
+    if COLUMNAR_FORMAT == 'parquet':
+        parquet_path = ensure_columnar(csv_path, 'parquet', auto_convert=False)
+
+    if parquet_path is not None:
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(parquet_path)
+        total_rows = parquet_file.metadata.num_rows
+
+        for batch in parquet_file.iter_batches(batch_size=chunk_rows, columns=STREAM_COLUMNS):
+            chunk = apply_schema(batch.to_pandas())
+            rows += len(chunk)
+            if progress_callback:
+                progress_callback(rows / total_rows if total_rows else 1.0, rows)
+            yield chunk
+        return
+
+    total_bytes = os.path.getsize(csv_path)
+
+    with open(csv_path, 'rb') as f:
+        reader = pd.read_csv(f, usecols=STREAM_COLUMNS, dtype=csv_dtypes(STREAM_COLUMNS), chunksize=chunk_rows)
+        for chunk in reader:
+            chunk = apply_schema(chunk)
+            rows += len(chunk)
+            if progress_callback:
+                progress_callback(min(1.0, f.tell() / total_bytes) if total_bytes else 1.0, rows)
+            yield chunk
+
+
+def stream_aggregates(csv_path=None, start_date=None, end_date=None, categories=None,
+                      transaction_types=None, max_memory_mb=STREAMING_MAX_MEMORY_MB,
+                      progress_callback=None):
+    """
+    Hitung semua summary secara streaming tanpa memuat seluruh dataset
+
+    Args:
+        csv_path: Path file CSV (optional, default DATA_PATH)
+        start_date: Tanggal mulai (optional)
+        end_date: Tanggal akhir (optional)
+        categories: List kategori yang dipilih (optional)
+        transaction_types: List tipe transaksi yang dipilih (optional)
+        max_memory_mb: Batas memori kerja per chunk (MB)
+        progress_callback: Callable(fraction, rows_processed), mis. untuk st.progress
+
+    Returns:
+        Dictionary berisi summary, category_summary, monthly_summary, daily_transactions
+    """
+    if csv_path is None:
+        from config import DATA_PATH
+        csv_path = DATA_PATH
+
+    chunk_rows = estimate_chunk_rows(csv_path, max_memory_mb)
+    aggregator = StreamingAggregator()
+
+    expr = filter_expression(start_date, end_date, categories, transaction_types)
+
+    for chunk in iter_chunks(csv_path, chunk_rows, progress_callback):
+        mask = expr.mask(EvalContext(chunk))
+        aggregator.update(chunk if mask is None else chunk[mask])
+
+    return aggregator.results()
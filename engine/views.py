@@ -0,0 +1,123 @@
+"""
+View tanpa copy atas dataset: DataFrame dasar + posisi baris
+
+Hasil filter tidak di-copy menjadi DataFrame baru. DataView hanya menyimpan
+referensi ke dataset dan posisi baris (slice atau array), lalu me-materialize
+kolom satu per satu saat kolom itu dipakai. Fungsi agregasi di utils menerima
+DataView maupun DataFrame karena keduanya mendukung operasi yang sama:
+view['Kolom'], view[['Kolom', ...]], view[mask], len(view) dan nlargest.
+"""
+
+import numpy as np
+
+
+class DataView:
+    """
+    Row selection atas DataFrame dasar dengan materialisasi kolom lazy
+
+    Args:
+        base: DataFrame dasar (dataset)
+        positions: slice atau array posisi baris terurut (None = semua baris)
+        expr: Filter expression yang menghasilkan positions (optional); view
+            turunan (view[mask], take) tidak membawa expression
+    """
+
+    def __init__(self, base, positions=None, expr=None):
+        self.base = base
+        self.positions = slice(0, len(base)) if positions is None else positions
+        self.expr = expr
+        self._columns = {}
+        self._index = None
+
+    @property
+    def columns(self):
+        return self.base.columns
+
+    @property
+    def attrs(self):
+        return self.base.attrs
+
+    @property
+    def index(self):
+        """Index baris (label dataset dasar), dihitung sekali"""
+        if self._index is None:
+            self._index = self.base.index[self.positions]
+        return self._index
+
+    @property
+    def shape(self):
+        return len(self), len(self.columns)
+
+    @property
+    def empty(self):
+        return len(self) == 0
+
+    def __len__(self):
+        if isinstance(self.positions, slice):
+            return len(range(*self.positions.indices(len(self.base))))
+        return len(self.positions)
+
+    def __repr__(self):
+        return f"DataView({len(self):,} dari {len(self.base):,} baris)"
+
+    def column(self, name):
+        """Series satu kolom untuk baris view (di-materialize sekali lalu di-cache)"""
+        if name not in self._columns:
+            self._columns[name] = self.base[name].iloc[self.positions]
+        return self._columns[name]
+
+    def _absolute(self, relative):
+        """Ubah posisi relatif terhadap view menjadi posisi di dataset dasar"""
+        if isinstance(self.positions, slice):
+            start = self.positions.start or 0
+            return start + np.asarray(relative, dtype=np.int64)
+        return self.positions[relative]
+
+    def take(self, relative):
+        """View baru berisi baris pada posisi relatif terhadap view ini"""
+        return DataView(self.base, self._absolute(relative))
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.column(key)
+        if isinstance(key, list):
+            return self.to_frame(key)
+
+        mask = np.asarray(key)
+        if mask.dtype != bool:
+            raise TypeError("DataView hanya mendukung kolom, list kolom atau boolean mask")
+        return self.take(np.flatnonzero(mask))
+
+    def to_frame(self, columns=None):
+        """
+        Materialize view menjadi DataFrame
+
+        Args:
+            columns: List kolom (None = semua kolom); hanya kolom ini yang di-copy
+
+        Returns:
+            DataFrame berisi baris view
+        """
+        base = self.base if columns is None else self.base[columns]
+        return base.iloc[self.positions]
+
+    def nlargest(self, n, column):
+        """N baris dengan nilai kolom terbesar (setara DataFrame.nlargest)"""
+        values = self.column(column).reset_index(drop=True)
+        return self.take(values.nlargest(n).index.to_numpy()).to_frame()
+
+
+def as_frame(data, columns=None):
+    """
+    DataFrame dari DataView atau DataFrame
+
+    Args:
+        data: DataView atau DataFrame
+        columns: List kolom (optional)
+
+    Returns:
+        DataFrame; DataFrame input dikembalikan tanpa copy
+    """
+    if isinstance(data, DataView):
+        return data.to_frame(columns)
+    return data if columns is None else data[columns]
@@ -13,7 +13,9 @@ from components.filters import date_range_filter, category_filter, transaction_t
 from components.tables import top_transactions_table
 
 # Import utilities
-from utils import load_data, filter_data, calculate_summary, get_category_summary, get_monthly_summary, calculate_statistics
+from utils import load_data, dashboard_aggregates
+from engine.backends import get_backend
+from engine.expressions import filter_expression
 from config import CATEGORIES, TRANSACTION_TYPES, CATEGORY_COLORS
 
 # Page config
@@ -46,13 +48,13 @@ def render_sidebar_filters():
     selected_types = transaction_type_filter(TRANSACTION_TYPES, key="dashboard_type", default=TRANSACTION_TYPES)
     
     # Apply filters
-    filtered_df = filter_data(
-        df,
-        start_date=start_date,
-        end_date=end_date,
-        categories=selected_categories,
-        transaction_types=selected_types
-    )
+    filters = {
+        'start_date': start_date,
+        'end_date': end_date,
+        'categories': selected_categories,
+        'transaction_types': selected_types
+    }
+    filtered_df = get_backend().select(filter_expression(**filters))
     
     # Show info
     st.sidebar.info(f"📊 Menampilkan **{len(filtered_df)}** dari **{len(df)}** transaksi")
@@ -75,10 +77,12 @@ def main():
         st.warning("⚠️ Tidak ada data untuk filter yang dipilih. Silakan ubah filter.")
         return
     
+    # Semua agregat dihitung sekali dari data terfilter
+    aggregates = dashboard_aggregates(filtered_df, top_n=5)
+    
     # Summary metrics
     st.subheader("💰 Ringkasan Keuangan")
-    summary = calculate_summary(filtered_df)
-    summary_metrics(summary)
+    summary_metrics(aggregates['summary'])
     
     st.markdown("---")
     
@@ -88,8 +92,8 @@ def main():
     with col1:
         st.subheader("📊 Distribusi Kategori")
         
-        # Category breakdown
-        category_summary = get_category_summary(filtered_df[filtered_df['Tipe'] == 'Debit'])
+        # Category breakdown (pengeluaran)
+        category_summary = aggregates['category_summary']
         
         if len(category_summary) > 0:
             # Pie chart
@@ -124,7 +128,7 @@ def main():
     # Monthly trend
     st.subheader("📈 Trend Bulanan")
     
-    monthly_summary = get_monthly_summary(filtered_df)
+    monthly_summary = aggregates['monthly_summary']
     
     if len(monthly_summary) > 0:
         fig = line_chart(
@@ -141,8 +145,7 @@ def main():
     
     # Statistics
     st.subheader("📊 Statistik Transaksi")
-    stats = calculate_statistics(filtered_df)
-    statistics_metrics(stats)
+    statistics_metrics(aggregates['statistics'])
     
     st.markdown("---")
     
@@ -150,10 +153,10 @@ def main():
     col1, col2 = st.columns(2)
     
     with col1:
-        top_transactions_table(filtered_df, n=5, transaction_type="Debit")
+        top_transactions_table(aggregates['top_transactions']['Debit'], n=5, transaction_type="Debit")
     
     with col2:
-        top_transactions_table(filtered_df, n=5, transaction_type="Kredit")
+        top_transactions_table(aggregates['top_transactions']['Kredit'], n=5, transaction_type="Kredit")
     
     st.markdown("---")
     
@@ -4,22 +4,26 @@ Analytics Page - Analisis Mendalam dengan Berbagai Chart
 
 import streamlit as st
 import pandas as pd
-import numpy as np
 
 # Import components
 from components.charts import (
     pie_chart, bar_chart, line_chart, box_plot, 
-    histogram_chart, area_chart, heatmap_chart
+    histogram_chart, area_chart, heatmap_chart, grouped_bar_chart
 )
-from components.filters import date_range_filter, category_filter, transaction_type_filter
+from components.filters import date_range_filter, category_filter, transaction_type_filter, period_picker
 from components.metrics import summary_metrics
 
 # Import utilities
 from utils import (
-    load_data, filter_data, calculate_summary, 
-    get_category_summary, get_monthly_summary
+    load_data, calculate_summary, 
+    get_category_summary, get_monthly_summary, get_category_month_pivot, describe_amounts,
+    get_balance_index, get_period_comparison, get_rolling_totals, format_currency
 )
-from config import CATEGORIES, TRANSACTION_TYPES, CATEGORY_COLORS
+from engine.backends import get_backend
+from engine.expressions import filter_expression
+from engine.rolling import ROLLING_GROUPS
+from engine.views import as_frame
+from config import CATEGORIES, TRANSACTION_TYPES, CATEGORY_COLORS, ROLLING_WINDOWS
 
 # Page config
 st.set_page_config(
@@ -36,7 +40,7 @@ def render_sidebar_filters():
     st.sidebar.subheader("📊 Menu Analisis")
     analysis_type = st.sidebar.radio(
         "Pilih Jenis Analisis:",
-        ["Overview", "Kategori", "Time Series", "Distribusi", "Perbandingan"],
+        ["Overview", "Kategori", "Time Series", "Rolling", "Distribusi", "Perbandingan"],
         help="Pilih jenis analisis yang ingin ditampilkan"
     )
     
@@ -59,17 +63,17 @@ def render_sidebar_filters():
     selected_types = transaction_type_filter(TRANSACTION_TYPES, key="analytics_type", default=TRANSACTION_TYPES)
     
     # Apply filters
-    filtered_df = filter_data(
-        df,
-        start_date=start_date,
-        end_date=end_date,
-        categories=selected_categories,
-        transaction_types=selected_types
-    )
+    filters = {
+        'start_date': start_date,
+        'end_date': end_date,
+        'categories': selected_categories,
+        'transaction_types': selected_types
+    }
+    filtered_df = get_backend().select(filter_expression(**filters))
     
     st.sidebar.info(f"📊 Menampilkan **{len(filtered_df)}** dari **{len(df)}** transaksi")
     
-    return filtered_df, df, analysis_type
+    return filtered_df, df, analysis_type, filters
 
 def render_overview_analysis(df):
     """Render overview analysis"""
@@ -85,7 +89,7 @@ def render_overview_analysis(df):
     with col1:
         st.subheader("💸 Breakdown Debit vs Kredit")
         
-        type_summary = df.groupby('Tipe')['Jumlah'].sum()
+        type_summary = df['Jumlah'].groupby(df['Tipe'], observed=True).sum()
         
         fig = pie_chart(
             data=type_summary.values,
@@ -98,8 +102,9 @@ def render_overview_analysis(df):
     with col2:
         st.subheader("📊 Transaksi per Tipe")
         
-        type_count = df.groupby('Tipe').size().reset_index()
+        type_count = df['Tipe'].groupby(df['Tipe'], observed=True).size().rename('Jumlah').reset_index()
         type_count.columns = ['Tipe', 'Jumlah']
+        type_count['Tipe'] = type_count['Tipe'].astype(str)
         
         fig = bar_chart(
             data=type_count,
@@ -145,7 +150,7 @@ def render_category_analysis(df):
     st.subheader("📦 Box Plot - Distribusi Jumlah per Kategori")
     
     fig = box_plot(
-        data=df,
+        data=as_frame(df, ['Kategori', 'Jumlah']),
         x='Kategori',
         y='Jumlah',
         title="Distribusi Jumlah Transaksi per Kategori"
@@ -188,7 +193,8 @@ def render_time_series_analysis(df):
         # Daily transactions
         st.subheader("📅 Transaksi Harian")
         
-        daily_df = df.groupby(df['Tanggal'].dt.date).agg({
+        daily_source = as_frame(df, ['Tanggal', 'Jumlah', 'Tipe'])
+        daily_df = daily_source.groupby(daily_source['Tanggal'].dt.date).agg({
             'Jumlah': 'sum',
             'Tipe': 'count'
         }).reset_index()
@@ -201,6 +207,84 @@ def render_time_series_analysis(df):
             title="Total Transaksi Harian"
         )
         st.pyplot(fig)
+        
+        st.markdown("---")
+        
+        render_balance_over_time(daily_df['Tanggal'].min(), daily_df['Tanggal'].max())
+
+def render_balance_over_time(start_date, end_date):
+    """Render saldo rekening dari waktu ke waktu (dari index saldo, tanpa scan baris)"""
+    st.subheader("🏦 Saldo over Time")
+    st.caption("Saldo penutup harian rekening pada periode terpilih (tidak dipengaruhi filter kategori/tipe)")
+    
+    balance_index = get_balance_index()
+    balance_df = balance_index.balance_series(start_date, end_date)
+    
+    fig = line_chart(
+        data=balance_df,
+        x='Tanggal',
+        y='Saldo',
+        title="Saldo Penutup Harian"
+    )
+    st.pyplot(fig)
+    
+    drift = balance_index.drift
+    if len(drift) > 0:
+        st.warning(
+            f"⚠️ Saldo tersimpan tidak konsisten dengan Jumlah/Tipe pada **{len(drift)}** titik"
+        )
+        with st.expander("Lihat baris drift Saldo"):
+            st.dataframe(drift, use_container_width=True)
+
+def render_rolling_analysis(df):
+    """Render rolling window analysis (total bergulir per kategori/tipe)"""
+    st.header("📉 Rolling Window Analysis")
+    st.caption("Nilai pada setiap tanggal adalah akumulasi jendela N hari yang berakhir di tanggal tersebut")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        days = st.radio(
+            "Panjang jendela", ROLLING_WINDOWS, horizontal=True,
+            format_func=lambda d: f"{d} hari", key="analytics_rolling_days"
+        )
+    
+    with col2:
+        by = st.radio("Kelompokkan per", ROLLING_GROUPS, horizontal=True, key="analytics_rolling_by")
+    
+    with col3:
+        metric = st.radio(
+            "Nilai", ['Total', 'Rata-rata Harian', 'Jumlah Transaksi'],
+            horizontal=True, key="analytics_rolling_metric"
+        )
+    
+    rolling_df = get_rolling_totals(df, days, by)
+    
+    fig = line_chart(
+        data=rolling_df,
+        x='Tanggal',
+        y=metric,
+        title=f"{metric} Bergulir {days} Hari per {by}",
+        hue='Seri'
+    )
+    st.pyplot(fig)
+    
+    st.markdown("---")
+    
+    # Nilai jendela terakhir per seri
+    last_date = rolling_df['Tanggal'].max()
+    st.subheader("📋 Jendela Terakhir")
+    st.caption(f"{days} hari sampai {last_date:%d-%m-%Y}")
+    
+    latest = rolling_df[rolling_df['Tanggal'] == last_date].sort_values('Total', ascending=False)
+    st.dataframe(
+        latest[['Seri', 'Total', 'Rata-rata Harian', 'Jumlah Transaksi']].assign(
+            Total=latest['Total'].apply(format_currency),
+            **{'Rata-rata Harian': latest['Rata-rata Harian'].apply(format_currency)}
+        ),
+        use_container_width=True,
+        hide_index=True
+    )
 
 def render_distribution_analysis(df):
     """Render distribution analysis"""
@@ -222,7 +306,7 @@ def render_distribution_analysis(df):
     with col2:
         st.subheader("📈 Statistik Deskriptif")
         
-        stats_df = df['Jumlah'].describe().reset_index()
+        stats_df = describe_amounts(df).reset_index()
         stats_df.columns = ['Metric', 'Value']
         stats_df['Value'] = stats_df['Value'].apply(lambda x: f"Rp {x:,.0f}")
         
@@ -233,16 +317,7 @@ def render_distribution_analysis(df):
     # Heatmap - Transaksi per kategori dan bulan
     st.subheader("🔥 Heatmap - Kategori vs Bulan")
     
-    df_heatmap = df.copy()
-    df_heatmap['Bulan'] = df_heatmap['Tanggal'].dt.to_period('M').astype(str)
-    
-    pivot_table = df_heatmap.pivot_table(
-        values='Jumlah',
-        index='Kategori',
-        columns='Bulan',
-        aggfunc='sum',
-        fill_value=0
-    )
+    pivot_table = get_category_month_pivot(df)
     
     if not pivot_table.empty:
         fig = heatmap_chart(
@@ -253,76 +328,84 @@ def render_distribution_analysis(df):
         )
         st.pyplot(fig)
 
-def render_comparison_analysis(df):
-    """Render comparison analysis"""
+def render_comparison_analysis(df, filters):
+    """Render comparison analysis antar periode pilihan"""
     st.header("🔄 Comparison Analysis")
     
-    # Split data menjadi 2 periode
-    df_sorted = df.sort_values('Tanggal')
-    mid_idx = len(df_sorted) // 2
-    
-    df_period1 = df_sorted.iloc[:mid_idx]
-    df_period2 = df_sorted.iloc[mid_idx:]
+    # Periode dipilih di sini (relatif terhadap rentang tanggal sidebar);
+    # filter kategori dan tipe dari sidebar tetap berlaku
+    periods = period_picker(
+        df['Tanggal'].min().date(), df['Tanggal'].max().date(),
+        filters['start_date'], filters['end_date'], key_prefix="analytics_period"
+    )
     
-    period1_label = f"{df_period1['Tanggal'].min().strftime('%Y-%m-%d')} - {df_period1['Tanggal'].max().strftime('%Y-%m-%d')}"
-    period2_label = f"{df_period2['Tanggal'].min().strftime('%Y-%m-%d')} - {df_period2['Tanggal'].max().strftime('%Y-%m-%d')}"
+    view = get_backend().select(filter_expression(
+        categories=filters['categories'], transaction_types=filters['transaction_types']
+    ))
+    comparison = get_period_comparison(view, periods)
+    summary = comparison['summary']
     
-    st.info(f"📊 Membandingkan 2 periode:\n\n**Periode 1**: {period1_label}\n\n**Periode 2**: {period2_label}")
+    st.info(
+        f"📊 Membandingkan **{len(periods)}** periode: "
+        f"{periods['Mulai'].min():%Y-%m-%d} - {periods['Sampai'].max():%Y-%m-%d}"
+    )
     
     # Summary comparison
-    from components.tables import comparison_table
-    
-    summary1 = calculate_summary(df_period1)
-    summary2 = calculate_summary(df_period2)
+    from components.tables import period_comparison_table
     
     st.subheader("💰 Perbandingan Summary")
-    comparison_table(summary1, summary2, labels=["Periode 1", "Periode 2"])
+    period_comparison_table(summary)
+    
+    fig = line_chart(
+        data=summary,
+        x='Periode',
+        y=['Income', 'Expense'],
+        title="Pemasukan dan Pengeluaran per Periode"
+    )
+    st.pyplot(fig)
     
     st.markdown("---")
     
     # Category comparison
     st.subheader("🏷️ Perbandingan Kategori")
     
-    cat1 = get_category_summary(df_period1)
-    cat2 = get_category_summary(df_period2)
+    categories = comparison['categories']
+    if len(categories) == 0:
+        st.info("Tidak ada transaksi pada periode yang dipilih")
+        return
     
-    # Merge data
-    comparison_df = pd.merge(
-        cat1[['Kategori', 'Total']],
-        cat2[['Kategori', 'Total']],
-        on='Kategori',
-        how='outer',
-        suffixes=(' P1', ' P2')
-    ).fillna(0)
+    if len(periods) <= 6:
+        fig = grouped_bar_chart(
+            data=categories,
+            x='Kategori',
+            y='Total',
+            hue='Periode',
+            title="Perbandingan Total per Kategori"
+        )
+    else:
+        fig = heatmap_chart(
+            categories.pivot(index='Kategori', columns='Periode', values='Total'),
+            title="Total per Kategori dan Periode",
+            annot=False
+        )
+    st.pyplot(fig)
     
-    fig = bar_chart(
-        data=comparison_df.melt(id_vars='Kategori', var_name='Periode', value_name='Total'),
-        x='Kategori',
-        y='Total',
-        title="Perbandingan Total per Kategori"
+    # Perubahan periode terakhir terhadap periode sebelumnya
+    last, previous = periods['Periode'].iloc[-1], periods['Periode'].iloc[-2]
+    st.markdown(f"**Perubahan {last} vs {previous}**")
+    
+    changes = categories[categories['Periode'] == last].sort_values('Perubahan', key=abs, ascending=False)
+    st.dataframe(
+        changes[['Kategori', 'Total', 'Jumlah Transaksi', 'Perubahan', 'Perubahan (%)']].assign(
+            Total=changes['Total'].apply(format_currency),
+            Perubahan=changes['Perubahan'].apply(format_currency),
+            **{'Perubahan (%)': changes['Perubahan (%)'].map(
+                lambda value: '-' if pd.isna(value) else f"{value:+.1f}%"
+            )}
+        ),
+        use_container_width=True,
+        hide_index=True
     )
-    
-    # Manually create grouped bar chart
-    import matplotlib.pyplot as plt
-    
-    fig, ax = plt.subplots(figsize=(12, 6))
-    
-    x = np.arange(len(comparison_df['Kategori']))
-    width = 0.35
-    
-    ax.bar(x - width/2, comparison_df['Total P1'], width, label='Periode 1', color='#FF6B6B')
-    ax.bar(x + width/2, comparison_df['Total P2'], width, label='Periode 2', color='#4ECDC4')
-    
-    ax.set_xlabel('Kategori')
-    ax.set_ylabel('Total')
-    ax.set_title('Perbandingan Total per Kategori')
-    ax.set_xticks(x)
-    ax.set_xticklabels(comparison_df['Kategori'], rotation=45, ha='right')
-    ax.legend()
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:,.0f}'))
-    
-    plt.tight_layout()
-    st.pyplot(fig)
 
 def main():
     """Main function untuk analytics page"""
@@ -333,7 +416,7 @@ def main():
     st.markdown("---")
     
     # Render filters dan get data
-    filtered_df, original_df, analysis_type = render_sidebar_filters()
+    filtered_df, original_df, analysis_type, filters = render_sidebar_filters()
     
     # Check if data kosong
     if len(filtered_df) == 0:
@@ -347,10 +430,12 @@ def main():
         render_category_analysis(filtered_df)
     elif analysis_type == "Time Series":
         render_time_series_analysis(filtered_df)
+    elif analysis_type == "Rolling":
+        render_rolling_analysis(filtered_df)
     elif analysis_type == "Distribusi":
         render_distribution_analysis(filtered_df)
     elif analysis_type == "Perbandingan":
-        render_comparison_analysis(filtered_df)
+        render_comparison_analysis(original_df, filters)
 
 if __name__ == "__main__":
     main()
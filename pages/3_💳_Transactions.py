@@ -14,7 +14,13 @@ from components.tables import transaction_table, category_breakdown_table
 from components.metrics import summary_metrics
 
 # Import utilities
-from utils import load_data, filter_data, calculate_summary, get_category_summary, format_currency
+from utils import (
+    load_data, calculate_summary, get_category_summary, format_currency,
+    fuzzy_merchant_matches, get_amount_index, describe_amounts
+)
+from engine.backends import get_backend
+from engine.expressions import filter_expression, amount_between, description_matches
+from engine.views import as_frame
 from config import CATEGORIES, TRANSACTION_TYPES
 
 # Page config
@@ -67,34 +73,41 @@ def render_sidebar_filters():
     
     # Amount range filter
     st.sidebar.subheader("💰 Range Jumlah")
-    min_amount = df['Jumlah'].min()
-    max_amount = df['Jumlah'].max()
-    amount_range = amount_range_filter(min_amount, max_amount, key="trans_amount")
+    amount_index = get_amount_index()
+    amount_range = amount_range_filter(
+        amount_index.min, amount_index.max, key="trans_amount", amount_index=amount_index
+    )
     
     # Search filter
     st.sidebar.subheader("🔍 Pencarian")
     search_query = search_filter(placeholder="Cari deskripsi...", key="trans_search")
-    
-    # Apply filters
-    filtered_df = filter_data(
-        df,
-        start_date=start_date,
-        end_date=end_date,
-        categories=selected_categories,
-        transaction_types=selected_types
+    search_mode = st.radio(
+        "Mode Pencarian:",
+        ["Substring", "Kata Utuh", "Fuzzy"],
+        horizontal=True,
+        key="trans_search_mode",
+        help="Substring: cocok di bagian mana pun. Kata Utuh: cocok per kata. "
+             "Fuzzy: toleran salah ketik nama merchant."
     )
     
-    # Apply amount filter
-    filtered_df = filtered_df[
-        (filtered_df['Jumlah'] >= amount_range[0]) & 
-        (filtered_df['Jumlah'] <= amount_range[1])
-    ]
+    # Apply filters: satu expression, satu row selection
+    expr = filter_expression(start_date, end_date, selected_categories, selected_types)
+    
+    if amount_index.count(*amount_range) < len(amount_index):
+        expr = expr & amount_between(*amount_range)
     
-    # Apply search filter
     if search_query:
-        filtered_df = filtered_df[
-            filtered_df['Deskripsi'].str.lower().str.contains(search_query, na=False)
-        ]
+        mode = {"Substring": "substring", "Kata Utuh": "word", "Fuzzy": "fuzzy"}[search_mode]
+        expr = expr & description_matches(search_query, mode=mode)
+        
+        if mode == "fuzzy":
+            matches = fuzzy_merchant_matches(search_query)
+            if len(matches) > 0:
+                st.caption("Merchant cocok: " + ", ".join(
+                    f"{row['Merchant']} ({row['Jumlah Transaksi']})" for _, row in matches.iterrows()
+                ))
+    
+    filtered_df = get_backend().select(expr)
     
     # Show info
     st.sidebar.info(f"📊 Menampilkan **{len(filtered_df)}** dari **{len(df)}** transaksi")
@@ -104,7 +117,7 @@ def render_sidebar_filters():
     
     if len(filtered_df) > 0:
         # Convert to CSV
-        csv = filtered_df.to_csv(index=False)
+        csv = as_frame(filtered_df).to_csv(index=False)
         
         st.sidebar.download_button(
             label="⬇️ Download CSV",
@@ -147,7 +160,7 @@ def render_transaction_details(df):
             show_index = st.checkbox("Tampilkan Index", value=False)
         
         # Sort dataframe
-        df_sorted = df.sort_values(
+        df_sorted = as_frame(df).sort_values(
             by=sort_by,
             ascending=(sort_order == "Ascending")
         )
@@ -188,7 +201,7 @@ def render_transaction_details(df):
         # Statistics
         st.markdown("#### 📊 Statistik Deskriptif")
         
-        stats_df = df['Jumlah'].describe().reset_index()
+        stats_df = describe_amounts(df).reset_index()
         stats_df.columns = ['Metric', 'Value']
         
         # Format display
@@ -0,0 +1,91 @@
+import pandas as pd
+
+from engine.cache import DatasetCache
+from engine.columnar import read_csv_tail, read_csv_typed
+
+HEADER = b"Tanggal,Kategori,Tipe,Jumlah,Deskripsi,Saldo\n"
+ROWS = [
+    b"2025-11-30 09:00:00,Belanja,Debit,1000,Toko A,-1000\n",
+    b"2025-11-30 10:00:00,Gaji,Kredit,5000,Kantor,4000\n",
+]
+
+
+def _write(path, *chunks):
+    with open(path, 'ab') as f:
+        for chunk in chunks:
+            f.write(chunk)
+
+
+def _get(cache, path, loads):
+    def loader(p):
+        loads.append(p)
+        return read_csv_typed(p)
+    return cache.get(str(path), loader, tail_loader=read_csv_tail)
+
+
+def test_partial_line_keeps_cached_rows_until_complete(tmp_path):
+    path = tmp_path / 'transactions.csv'
+    _write(path, HEADER, *ROWS)
+    cache, loads = DatasetCache(), []
+
+    assert len(_get(cache, path, loads)) == 2
+
+    _write(path, b"2025-12-01 08:00:00,Belanja,Deb")
+    df = _get(cache, path, loads)
+    assert len(df) == 2
+    assert df['Jumlah'].dtype == 'int64'
+
+    _write(path, b"it,2500,Toko B,1500\n")
+    df = _get(cache, path, loads)
+    assert len(df) == 3
+    assert df.iloc[-1]['Tipe'] == 'Debit'
+    assert df.iloc[-1]['Saldo'] == 1500
+    assert df.iloc[-1]['Tanggal'] == pd.Timestamp('2025-12-01 08:00:00')
+
+    assert len(loads) == 1
+    assert cache.stats()['appends'] == 1
+
+
+def test_append_parses_complete_lines_before_partial_tail(tmp_path):
+    path = tmp_path / 'transactions.csv'
+    _write(path, HEADER, ROWS[0])
+    cache, loads = DatasetCache(), []
+    _get(cache, path, loads)
+
+    _write(path, ROWS[1], b"2025-12-01 08:00:00,Bel")
+    assert len(_get(cache, path, loads)) == 2
+
+    _write(path, b"anja,Debit,2500,Toko B,1500\n")
+    df = _get(cache, path, loads)
+    assert df['Saldo'].tolist() == [-1000, 4000, 1500]
+    assert len(loads) == 1
+
+
+def test_rewritten_prefix_triggers_full_reload(tmp_path):
+    path = tmp_path / 'transactions.csv'
+    _write(path, HEADER, ROWS[0])
+    cache, loads = DatasetCache(), []
+    _get(cache, path, loads)
+
+    path.write_bytes(HEADER + ROWS[0].replace(b'1000', b'2000') + ROWS[1])
+    df = _get(cache, path, loads)
+    assert df['Jumlah'].tolist() == [2000, 5000]
+    assert len(loads) == 2
+
+
+
+def test_caller_writes_do_not_reach_cached_data(tmp_path):
+    path = tmp_path / 'transactions.csv'
+    _write(path, HEADER, *ROWS)
+    cache, loads = DatasetCache(), []
+
+    first = _get(cache, path, loads)
+    first.loc[0, 'Jumlah'] = -1
+    first.loc[1, 'Tipe'] = 'Debit'
+    first['Saldo'] = 0
+
+    second = _get(cache, path, loads)
+    assert second['Jumlah'].tolist() == [1000, 5000]
+    assert second['Tipe'].tolist() == ['Debit', 'Kredit']
+    assert second['Saldo'].tolist() == [-1000, 4000]
+    assert len(loads) == 1
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from benchmarks.period_comparison import spread_dataset
+from engine.cache import concat_rows
+from engine.indexes import AmountIndex, BitmapIndex
+from engine.schema import apply_schema
+from engine.search import DescriptionIndex
+
+
+@pytest.fixture(scope='module')
+def appended():
+    """Index yang dibangun dari 2.000 baris lalu di-append per batch, dan dataset akhirnya"""
+    df = apply_schema(spread_dataset(8_000, 2)).reset_index(drop=True)
+    data = df.iloc[:2_000].copy()
+    indexes = [AmountIndex(data), BitmapIndex(data), DescriptionIndex(data)]
+
+    for step in (1, 700, 3, 1_500, 296, 2_500, 1_000):
+        old_rows = len(data)
+        data = concat_rows(data, df.iloc[old_rows:old_rows + step])
+        for index in indexes:
+            index.append(data.iloc[old_rows:], data)
+
+    return data, indexes
+
+
+def test_amount_index_append_matches_rebuild(appended):
+    data, (amounts, _, _) = appended
+    rebuilt = AmountIndex(data)
+
+    assert len(amounts) == len(data)
+    for q in (0, 10, 25, 50, 90, 100):
+        assert amounts.percentile(q) == np.percentile(data['Jumlah'], q)
+    for low, high in ((None, None), (50_000, 750_000), (None, 100_000)):
+        assert amounts.count(low, high) == rebuilt.count(low, high)
+        assert (amounts.rows(low, high) == rebuilt.rows(low, high)).all()
+    assert (amounts.histogram()[0] == rebuilt.histogram()[0]).all()
+
+
+def test_bitmap_index_append_matches_rebuild(appended):
+    data, (_, bitmap, _) = appended
+
+    for column in BitmapIndex.COLUMNS:
+        for value in data[column].cat.categories:
+            expected = (data[column] == value).to_numpy()
+            assert (bitmap.mask(column, [value]) == expected).all()
+
+
+def test_description_index_append_matches_rebuild(appended):
+    data, (_, _, description) = appended
+    rebuilt = DescriptionIndex(data)
+
+    assert (description.counts == rebuilt.counts).all()
+    for query, mode in (('toko', 'substring'), ('gojek', 'fuzzy'), ('indomaret', 'word')):
+        assert (description.search(query, mode) == rebuilt.search(query, mode)).all()
@@ -0,0 +1,37 @@
+import pandas as pd
+import pytest
+
+from engine.expressions import date_between
+from engine.ledger import DailyLedger
+from engine.rolling import rolling_totals
+from engine.schema import apply_schema
+
+
+@pytest.fixture(scope='module')
+def ledger():
+    """Ledger dengan transaksi di 1, 5 dan 6 Januari 2026"""
+    df = pd.DataFrame({
+        'Tanggal': pd.to_datetime(['2026-01-01', '2026-01-05', '2026-01-06']),
+        'Kategori': ['Belanja', 'Belanja', 'Gaji'],
+        'Tipe': ['Debit', 'Debit', 'Kredit'],
+        'Jumlah': [700, 1000, 2000],
+    })
+    return DailyLedger(apply_schema(df))
+
+
+def test_coverage_counts_empty_days_at_range_start(ledger):
+    # Rentang mulai 3 Januari; 3 dan 4 Januari kosong
+    expr = date_between(pd.Timestamp('2026-01-03'), pd.Timestamp('2026-01-06'))
+    result = rolling_totals(ledger, 7, by='Total', expr=expr)
+
+    assert result['Tanggal'].tolist() == list(pd.to_datetime(['2026-01-05', '2026-01-06']))
+    assert result['Total'].tolist() == [1000, 3000]
+    # Jendela 5 Januari mencakup 3..5 Januari (3 hari), 6 Januari mencakup 3..6 (4 hari)
+    assert result['Rata-rata Harian'].tolist() == [1000 / 3, 3000 / 4]
+
+
+def test_coverage_without_range_starts_at_ledger_first_day(ledger):
+    result = rolling_totals(ledger, 3, by='Total')
+
+    assert result['Total'].tolist() == [700, 700, 700, 0, 1000, 3000]
+    assert result['Rata-rata Harian'].tolist() == [700, 350, 700 / 3, 0, 1000 / 3, 1000]
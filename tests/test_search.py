@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.search import DescriptionIndex
+
+MERCHANTS = [
+    'Gojek', 'Grab', 'Tokopedia', 'Shopee', 'Indomaret', 'Alfamart', 'Starbucks', 'PLN',
+    'Telkomsel', 'Netflix', 'Spotify', 'Transfer Masuk', 'Gaji Bulanan', 'Apotek K24',
+    'Pertamina', 'Bioskop XXI', 'Lazada', 'McDonalds', 'KFC', 'Blibli',
+]
+
+
+@pytest.fixture(scope='module')
+def index():
+    rng = np.random.default_rng(0)
+    descriptions = pd.Categorical(rng.choice(MERCHANTS, 2_000))
+    return DescriptionIndex(pd.DataFrame({'Deskripsi': descriptions}))
+
+
+@pytest.mark.parametrize('query', ['a', 'go', 'k', 'pl', 'sp'])
+def test_short_fuzzy_query_is_exact_substring(index, query):
+    assert (index.search(query, 'fuzzy') == index.search(query, 'substring')).all()
+
+
+@pytest.mark.parametrize('query', ['go', 'gr', 'to', 'ne', 'xx'])
+def test_short_fuzzy_query_does_not_match_most_merchants(index, query):
+    assert len(index.match(query, 'fuzzy')) <= 3
+
+
+@pytest.mark.parametrize('query, merchant', [
+    ('gojk', 'Gojek'), ('tokped', 'Tokopedia'), ('indomret', 'Indomaret'), ('spotfy', 'Spotify'),
+])
+def test_fuzzy_query_tolerates_typos(index, query, merchant):
+    assert merchant in index.matching_labels(query, 'fuzzy')
@@ -5,17 +5,111 @@ Utility functions untuk data processing dan formatting
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from config import DATA_PATH, CURRENCY_FORMAT, DATE_FORMAT
+from config import (
+    DATA_PATH, CURRENCY_FORMAT, DATE_FORMAT, COLUMNAR_FORMAT, AUTO_CONVERT_COLUMNAR,
+    FILTER_CACHE_MAX_MB, AGGREGATION_ENGINE, QUANTILE_MODE, QUANTILE_RELATIVE_ACCURACY,
+    QUANTILE_SKETCH_MIN_ROWS, PARALLEL_WORKERS, PARALLEL_MIN_ROWS
+)
+from engine.aggregates import (
+    summary_partial, finalize_summary, finalize_category_summary,
+    finalize_monthly_summary, finalize_daily_transactions, merge_monthly,
+    category_month_partial, merge_category_month, finalize_category_month_pivot
+)
+from engine.balance import BalanceIndex
+from engine.bincount import aggregation_partials
+from engine.cache import dataset_cache
+from engine.columnar import load_dataset, read_csv_tail
+from engine.comparison import compare_periods
+from engine.cube import (
+    RollupCube, cube_summary_partial, cube_category_partial, cube_monthly_partial,
+    cube_daily_partial, cube_category_month_pivot, cube_statistics
+)
+from engine.dashboard import dashboard_aggregates as _dashboard_aggregates
+from engine.indexes import AmountIndex, BitmapIndex, DateIndex
+from engine.ledger import DailyLedger
+from engine.parallel import parallel_partial
+from engine.expressions import EvalContext, filter_expression
+from engine.result_cache import FilterResultCache
+from engine.rolling import rolling_totals
+from engine.schema import validate_schema
+from engine.search import DescriptionIndex
+from engine.sketch import CellSketches
+from engine.views import DataView, as_frame
 
-def load_data():
-    """Load data transaksi dari CSV"""
+# Cache hasil filter process-wide, dibagi semua page dan session
+filter_result_cache = FilterResultCache(FILTER_CACHE_MAX_MB * 1024 * 1024)
+
+# Agregat parsial untuk baris mentah (bincount atau groupby pandas)
+_partials = aggregation_partials(AGGREGATION_ENGINE)
+
+def _read_source(path, columns=None):
+    """Baca dataset dari file kolumnar (jika fresh) atau CSV, cek schema, urutkan berdasarkan Tanggal"""
+    df = load_dataset(path, columns=columns, fmt=COLUMNAR_FORMAT, auto_convert=AUTO_CONVERT_COLUMNAR)
+    validate_schema(df)
+    
+    if 'Tanggal' in df.columns and not df['Tanggal'].is_monotonic_increasing:
+        df = df.sort_values('Tanggal', kind='stable').reset_index(drop=True)
+    
+    return df
+
+def load_data(columns=None):
+    """
+    Load data transaksi
+    
+    Dataset di-cache sekali per proses server dan dibagi oleh semua session dan page.
+    File hanya di-parse ulang jika isi DATA_PATH berubah; jika file hanya bertambah
+    di akhir (lihat engine.ingest), hanya baris baru yang di-parse. Jika COLUMNAR_FORMAT diset,
+    data dibaca dari file Parquet/Feather bertipe yang dibuat otomatis dari CSV.
+    
+    Args:
+        columns: List kolom yang dibaca (optional, default semua kolom)
+    
+    Returns:
+        DataFrame transaksi (salinan milik pemanggil)
+    """
     try:
-        df = pd.read_csv(DATA_PATH)
-        df['Tanggal'] = pd.to_datetime(df['Tanggal'])
-        return df
+        key = tuple(columns) if columns else None
+        return dataset_cache.get(
+            DATA_PATH,
+            lambda path: _read_source(path, columns),
+            key=key,
+            tail_loader=read_csv_tail
+        )
     except Exception as e:
         raise Exception(f"Error loading data: {str(e)}")
 
+def get_derived(name, builder):
+    """
+    Get struktur turunan yang dibangun sekali per versi dataset
+    
+    Args:
+        name: Nama struktur (unik per jenis struktur)
+        builder: Callable builder(df) yang membangun struktur dari dataset
+    
+    Returns:
+        Struktur turunan untuk versi dataset saat ini
+    """
+    df = load_data()
+    return dataset_cache.derived(DATA_PATH, name, df.attrs['dataset_version'], lambda: builder(df))
+
+def get_filter_cache_stats():
+    """
+    Get statistik cache hasil filter
+    
+    Returns:
+        Dictionary berisi hits, misses, evictions, hit_rate, entries, bytes, max_bytes
+    """
+    return filter_result_cache.stats()
+
+def get_cache_stats():
+    """
+    Get statistik cache dataset
+    
+    Returns:
+        Dictionary berisi hits, misses, reloads, appends, hit_rate dan entries
+    """
+    return dataset_cache.stats()
+
 def format_currency(amount):
     """Format angka ke format currency Indonesia"""
     return CURRENCY_FORMAT.format(amount)
@@ -28,10 +122,101 @@ def get_date_range(df):
     """Get tanggal minimum dan maksimum dari data"""
     return df['Tanggal'].min(), df['Tanggal'].max()
 
+def _dataset_indexes(df):
+    """
+    Get index dataset (DateIndex, BitmapIndex) jika df adalah dataset yang di-cache
+    
+    Returns:
+        Tuple (date_index, bitmap_index), atau (None, None) jika df bukan dataset di-cache
+    """
+    if not dataset_cache.is_cached(DATA_PATH, df):
+        return None, None
+    return get_derived('date_index', DateIndex), get_derived('bitmap_index', BitmapIndex)
+
+def _match_descriptions(query, mode='substring', max_distance=None):
+    """Nilai Deskripsi dataset yang cocok dengan query (lewat index pencarian)"""
+    index = get_derived('description_index', DescriptionIndex)
+    return index.matching_labels(query, mode, max_distance)
+
+def select_positions(df, expr):
+    """
+    Row selection (posisi baris df) yang cocok dengan filter expression
+    
+    Jika df adalah dataset dari load_data() (urut berdasarkan Tanggal), batas
+    tanggal expression dijawab dengan binary search menjadi slice, lalu sisa
+    predikat dievaluasi sebagai satu mask hanya pada slice tersebut (kategori dan
+    tipe memakai bitmap index, Deskripsi memakai posting list index pencarian,
+    rentang Jumlah yang selektif memakai AmountIndex). Hasilnya disimpan di cache
+    LRU yang dibagi semua page. DataFrame lain dievaluasi dengan satu mask gabungan.
+    
+    Args:
+        df: DataFrame yang akan difilter
+        expr: Filter expression (lihat engine.expressions)
+    
+    Returns:
+        slice atau array int64 posisi baris yang terurut
+    """
+    date_index, bitmap = _dataset_indexes(df)
+    
+    if date_index is None:
+        mask = expr.mask(EvalContext(df))
+        return slice(None) if mask is None else np.flatnonzero(mask)
+    
+    version = df.attrs['dataset_version']
+    key = expr.key()
+    
+    cached = filter_result_cache.get(version, key)
+    if cached is not None:
+        return cached
+    
+    window = expr.date_bounds()
+    start, stop = date_index.slice(*window)
+    columns = expr.columns()
+    ctx = EvalContext(
+        df.iloc[start:stop], bitmap=bitmap, offset=start, window=window,
+        search=get_derived('description_index', DescriptionIndex) if 'Deskripsi' in columns else None,
+        amounts=get_derived('amount_index', AmountIndex) if 'Jumlah' in columns else None
+    )
+    mask = expr.mask(ctx)
+    positions = slice(start, stop) if mask is None else start + np.flatnonzero(mask)
+    
+    filter_result_cache.put(version, key, positions)
+    return positions
+
+def select(df, expr):
+    """
+    Filter dataframe dengan filter expression
+    
+    Args:
+        df: DataFrame yang akan difilter
+        expr: Filter expression, misalnya
+            filter_expression(start, end) & amount_between(0, 100000)
+    
+    Returns:
+        DataFrame berisi baris yang cocok (rentang tanggal tanpa filter lain
+        berupa slice tanpa copy)
+    """
+    return df.iloc[select_positions(df, expr)]
+
+def select_view(df, expr):
+    """
+    Filter dataframe dengan filter expression tanpa copy
+    
+    Args:
+        df: DataFrame yang akan difilter
+        expr: Filter expression
+    
+    Returns:
+        DataView (df + posisi baris); kolom di-materialize saat dipakai
+    """
+    return DataView(df, select_positions(df, expr), expr=expr)
+
 def filter_data(df, start_date=None, end_date=None, categories=None, transaction_types=None):
     """
     Filter dataframe berdasarkan kriteria yang diberikan
     
+    Setara dengan select(df, filter_expression(...)).
+    
     Args:
         df: DataFrame yang akan difilter
         start_date: Tanggal mulai
@@ -42,23 +227,180 @@ def filter_data(df, start_date=None, end_date=None, categories=None, transaction
     Returns:
         DataFrame yang sudah difilter
     """
-    filtered_df = df.copy()
+    return select(df, filter_expression(start_date, end_date, categories, transaction_types))
+
+def search_descriptions(query, mode='substring', max_distance=None):
+    """
+    Cari transaksi berdasarkan Deskripsi memakai index pencarian dataset
     
-    # Filter by date range
-    if start_date:
-        filtered_df = filtered_df[filtered_df['Tanggal'] >= pd.to_datetime(start_date)]
-    if end_date:
-        filtered_df = filtered_df[filtered_df['Tanggal'] <= pd.to_datetime(end_date)]
+    Args:
+        query: Teks pencarian (case-insensitive)
+        mode: 'substring', 'word' (kata utuh) atau 'fuzzy' (toleran typo)
+        max_distance: Batas edit distance untuk mode 'fuzzy' (None = otomatis)
+    
+    Returns:
+        Array row-id (index dataset) yang terurut
+    """
+    index = get_derived('description_index', DescriptionIndex)
+    return index.search(query, mode=mode, max_distance=max_distance)
+
+def fuzzy_merchant_matches(query, max_distance=None, limit=10):
+    """
+    Get merchant yang mirip query, diurutkan dari yang paling cocok
     
-    # Filter by categories
-    if categories and len(categories) > 0:
-        filtered_df = filtered_df[filtered_df['Kategori'].isin(categories)]
+    Args:
+        query: Teks pencarian (boleh typo, misalnya "gojk")
+        max_distance: Batas edit distance (None = otomatis sesuai panjang query)
+        limit: Jumlah maksimum merchant
     
-    # Filter by transaction types
-    if transaction_types and len(transaction_types) > 0:
-        filtered_df = filtered_df[filtered_df['Tipe'].isin(transaction_types)]
+    Returns:
+        DataFrame berisi Merchant, Jarak, Jumlah Transaksi
+    """
+    index = get_derived('description_index', DescriptionIndex)
+    matches = index.match_fuzzy(query, max_distance=max_distance, limit=limit)
+    counts = index.counts
     
-    return filtered_df
+    return pd.DataFrame({
+        'Merchant': [index.labels[code] for code, _ in matches],
+        'Jarak': [distance for _, distance in matches],
+        'Jumlah Transaksi': [int(counts[code]) for code, _ in matches]
+    })
+
+def get_amount_index():
+    """
+    Get index Jumlah terurut (range query, persentil, histogram) dataset
+    
+    Returns:
+        AmountIndex untuk versi dataset saat ini
+    """
+    return get_derived('amount_index', AmountIndex)
+
+def _cube_cells(data):
+    """
+    Sel rollup cube untuk data, jika data bisa dijawab dari cube
+    
+    Data harus DataView atas dataset yang di-cache dengan filter expression yang
+    hanya memakai Tanggal, Kategori dan Tipe.
+    
+    Returns:
+        DataFrame sel cube, atau None jika harus dihitung dari baris mentah
+    """
+    if not isinstance(data, DataView) or data.expr is None:
+        return None
+    if not dataset_cache.is_cached(DATA_PATH, data.base):
+        return None
+    
+    cube = get_derived('rollup_cube', RollupCube)
+    if not cube.answers(data.expr):
+        return None
+    return cube.query(data.expr)
+
+def _daily_ledger(data):
+    """
+    Ledger prefix-sum harian untuk data, jika data bisa dijawab dari ledger
+    
+    Data harus DataView atas dataset yang di-cache dengan expression berupa
+    jendela tanggal AND predikat Kategori/Tipe.
+    
+    Returns:
+        DailyLedger, atau None jika harus dihitung dari cube atau baris mentah
+    """
+    if not isinstance(data, DataView) or data.expr is None:
+        return None
+    if not dataset_cache.is_cached(DATA_PATH, data.base):
+        return None
+    
+    ledger = get_derived('daily_ledger', DailyLedger)
+    return ledger if ledger.answers(data.expr) else None
+
+def get_window_totals(starts, ends, categories=None, transaction_types=None):
+    """
+    Total income, expense dan count untuk banyak jendela tanggal sekaligus
+    
+    Dihitung dari ledger prefix-sum harian (dua lookup per jendela), mis. untuk
+    total setiap minggu dalam setahun.
+    
+    Args:
+        starts: Array tanggal awal jendela (inklusif)
+        ends: Array tanggal akhir jendela (inklusif)
+        categories: List kategori (kosong = semua)
+        transaction_types: List tipe transaksi (kosong = semua)
+    
+    Returns:
+        DataFrame per jendela berisi Mulai, Sampai, Income, Expense, Balance
+        dan Jumlah Transaksi
+    """
+    expr = filter_expression(categories=categories, transaction_types=transaction_types)
+    return get_derived('daily_ledger', DailyLedger).window_totals(starts, ends, expr)
+
+def get_period_comparison(df, periods):
+    """
+    Bandingkan summary dan total per kategori antar periode
+    
+    Args:
+        df: DataFrame atau DataView transaksi yang sudah difilter
+        periods: DataFrame periode (engine.comparison.make_periods dan builder-nya)
+    
+    Returns:
+        Dictionary berisi summary dan categories (lihat engine.comparison.compare_periods)
+    """
+    ledger = _daily_ledger(df)
+    if ledger is not None:
+        return compare_periods(ledger, periods, df.expr)
+    
+    # Ledger sementara atas baris terfilter: satu pass bincount untuk semua periode
+    rows = as_frame(df, ['Tanggal', 'Kategori', 'Tipe', 'Jumlah'])
+    return compare_periods(DailyLedger(rows), periods)
+
+def get_rolling_totals(df, days, by='Kategori'):
+    """
+    Total, rata-rata harian dan jumlah transaksi bergulir per kategori/tipe
+    
+    Args:
+        df: DataFrame atau DataView transaksi yang sudah difilter
+        days: Panjang jendela (hari)
+        by: 'Kategori', 'Tipe' atau 'Total'
+    
+    Returns:
+        DataFrame per (Tanggal, Seri) (lihat engine.rolling.rolling_totals)
+    """
+    ledger = _daily_ledger(df)
+    if ledger is not None:
+        return rolling_totals(ledger, days, by, df.expr)
+    
+    rows = as_frame(df, ['Tanggal', 'Kategori', 'Tipe', 'Jumlah'])
+    return rolling_totals(DailyLedger(rows), days, by)
+
+def get_balance_index():
+    """
+    Get index saldo per tanggal (dibangun sekali per versi dataset)
+    
+    Returns:
+        engine.balance.BalanceIndex; balance_at(dates) untuk saldo pada satu
+        atau banyak tanggal, drift untuk baris Saldo yang tidak konsisten
+    """
+    return get_derived('balance_index', BalanceIndex)
+
+def _amount_sketch(data, cells):
+    """
+    Quantile sketch Jumlah untuk data yang dijawab dari cube
+    
+    Args:
+        data: DataView dengan expression yang bisa dijawab cube
+        cells: Sel cube untuk data (dari _cube_cells), atau None
+    
+    Returns:
+        engine.sketch.LogSketch, atau None jika quantile harus exact
+    """
+    if cells is None or QUANTILE_MODE != 'sketch':
+        return None
+    if cells['count'].sum() < QUANTILE_SKETCH_MIN_ROWS:
+        return None
+    
+    sketches = get_derived(
+        'quantile_sketch', lambda df: CellSketches(df, QUANTILE_RELATIVE_ACCURACY)
+    )
+    return sketches.query(data.expr, low=cells['min'].min(), high=cells['max'].max())
 
 def calculate_summary(df):
     """
@@ -67,17 +409,14 @@ def calculate_summary(df):
     Returns:
         Dictionary berisi total income, expense, balance, dan transaction count
     """
-    total_income = df[df['Tipe'] == 'Kredit']['Jumlah'].sum()
-    total_expense = df[df['Tipe'] == 'Debit']['Jumlah'].sum()
-    balance = total_income - total_expense
-    transaction_count = len(df)
+    ledger = _daily_ledger(df)
+    if ledger is not None:
+        return finalize_summary(ledger.summary_partial(df.expr))
     
-    return {
-        'total_income': total_income,
-        'total_expense': total_expense,
-        'balance': balance,
-        'transaction_count': transaction_count
-    }
+    cells = _cube_cells(df)
+    if cells is not None:
+        return finalize_summary(cube_summary_partial(cells))
+    return finalize_summary(summary_partial(df))
 
 def get_category_summary(df):
     """
@@ -86,10 +425,14 @@ def get_category_summary(df):
     Returns:
         DataFrame berisi total amount per kategori
     """
-    category_summary = df.groupby('Kategori')['Jumlah'].agg(['sum', 'count']).reset_index()
-    category_summary.columns = ['Kategori', 'Total', 'Jumlah Transaksi']
-    category_summary = category_summary.sort_values('Total', ascending=False)
-    return category_summary
+    ledger = _daily_ledger(df)
+    if ledger is not None:
+        return finalize_category_summary(ledger.category_partial(df.expr))
+    
+    cells = _cube_cells(df)
+    if cells is not None:
+        return finalize_category_summary(cube_category_partial(cells))
+    return finalize_category_summary(_partials['category'](df))
 
 def get_monthly_summary(df):
     """
@@ -98,21 +441,15 @@ def get_monthly_summary(df):
     Returns:
         DataFrame berisi income dan expense per bulan
     """
-    df_monthly = df.copy()
-    df_monthly['Bulan'] = df_monthly['Tanggal'].dt.to_period('M')
+    cells = _cube_cells(df)
+    if cells is not None:
+        return finalize_monthly_summary(cube_monthly_partial(cells))
     
-    monthly_income = df_monthly[df_monthly['Tipe'] == 'Kredit'].groupby('Bulan')['Jumlah'].sum()
-    monthly_expense = df_monthly[df_monthly['Tipe'] == 'Debit'].groupby('Bulan')['Jumlah'].sum()
-    
-    monthly_summary = pd.DataFrame({
-        'Income': monthly_income,
-        'Expense': monthly_expense
-    }).fillna(0)
-    
-    monthly_summary['Balance'] = monthly_summary['Income'] - monthly_summary['Expense']
-    monthly_summary.index = monthly_summary.index.astype(str)
-    
-    return monthly_summary.reset_index()
+    partial = parallel_partial(
+        df, _partials['monthly'], merge_monthly, ['Tanggal', 'Tipe', 'Jumlah'],
+        workers=PARALLEL_WORKERS, min_rows=PARALLEL_MIN_ROWS
+    )
+    return finalize_monthly_summary(partial)
 
 def get_daily_transactions(df):
     """
@@ -121,17 +458,67 @@ def get_daily_transactions(df):
     Returns:
         DataFrame berisi count transaksi per hari
     """
-    daily = df.groupby(df['Tanggal'].dt.date).size().reset_index()
-    daily.columns = ['Tanggal', 'Jumlah Transaksi']
-    return daily
+    cells = _cube_cells(df)
+    if cells is not None:
+        return finalize_daily_transactions(cube_daily_partial(cells))
+    return finalize_daily_transactions(_partials['daily'](df))
+
+def get_category_month_pivot(df):
+    """
+    Get pivot total Jumlah per Kategori (baris) x Bulan (kolom)
+    
+    Returns:
+        DataFrame pivot dengan Bulan berformat YYYY-MM
+    """
+    cells = _cube_cells(df)
+    if cells is not None:
+        return cube_category_month_pivot(cells)
+    
+    partial = parallel_partial(
+        df, category_month_partial, merge_category_month, ['Tanggal', 'Kategori', 'Jumlah'],
+        workers=PARALLEL_WORKERS, min_rows=PARALLEL_MIN_ROWS
+    )
+    return finalize_category_month_pivot(partial)
+
+def dashboard_aggregates(df, top_n=5):
+    """
+    Hitung semua agregat Dashboard dalam satu pass
+    
+    Args:
+        df: DataFrame atau DataView transaksi yang sudah difilter
+        top_n: Jumlah top transaksi per tipe
+    
+    Returns:
+        Dictionary berisi summary, category_summary (Debit), monthly_summary,
+        statistics dan top_transactions ({'Debit': ..., 'Kredit': ...})
+    """
+    cells = _cube_cells(df)
+    return _dashboard_aggregates(df, cells=cells, sketch=_amount_sketch(df, cells), top_n=top_n)
 
 def calculate_statistics(df):
     """
     Hitung statistik descriptive
     
+    Jika data bisa dijawab dari cube, mean/max/min/std dihitung dari sel dan
+    median dari quantile sketch (QUANTILE_MODE = "sketch", error relatif
+    maksimum QUANTILE_RELATIVE_ACCURACY) untuk minimal QUANTILE_SKETCH_MIN_ROWS
+    baris.
+    
     Returns:
         Dictionary berisi mean, median, max, min amount
     """
+    cells = _cube_cells(df)
+    sketch = _amount_sketch(df, cells)
+    if sketch is not None:
+        stats = cube_statistics(cells)
+        return {
+            'mean': stats['mean'],
+            'median': sketch.quantile(0.5),
+            'max': stats['max'],
+            'min': stats['min'],
+            'std': stats['std']
+        }
+    
     amounts = df['Jumlah']
     
     return {
@@ -141,3 +528,26 @@ def calculate_statistics(df):
         'min': amounts.min(),
         'std': amounts.std()
     }
+
+def describe_amounts(df):
+    """
+    Statistik deskriptif Jumlah (setara df['Jumlah'].describe())
+    
+    Kuartil dihitung dari quantile sketch jika data bisa dijawab dari cube.
+    
+    Returns:
+        Series berisi count, mean, std, min, 25%, 50%, 75%, max
+    """
+    cells = _cube_cells(df)
+    sketch = _amount_sketch(df, cells)
+    if sketch is None:
+        return df['Jumlah'].describe()
+    
+    stats = cube_statistics(cells)
+    quartiles = sketch.quantiles([0.25, 0.5, 0.75])
+    return pd.Series(
+        [sketch.count, stats['mean'], stats['std'], stats['min'], *quartiles, stats['max']],
+        index=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'],
+        dtype=float,
+        name='Jumlah'
+    )